@@ -2,11 +2,18 @@
 """
 간단한 ROE 분석 데모 서버 - Vercel 배포용
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
+from pathlib import Path
 import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.static_assets import StaticAssets
 
 app = FastAPI(title="ROE 기반 장기투자 분석", version="1.0.0")
 
@@ -19,6 +26,8 @@ app.add_middleware(
 )
 
 # Vercel에서는 정적 파일이 자동으로 서빙됨
+# 대시보드 HTML 은 api/static/ 의 파일을 내용 해시 ETag / 사전 압축본으로 제공
+assets = StaticAssets(Path(__file__).parent / "static", ["index.html", "test.html"])
 
 class AnalysisRequest(BaseModel):
     min_roe: float = 15.0
@@ -187,1286 +196,14 @@ async def api_info():
     return {"message": "ROE 기반 장기투자 분석 API - 데모 버전"}
 
 @app.get("/test", response_class=HTMLResponse)
-async def chart_test():
+async def chart_test(request: Request):
     """차트 기능 테스트 페이지"""
-    test_html = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Chart.js 테스트</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.js"></script>
-    <style>
-        .container { max-width: 800px; margin: 50px auto; padding: 20px; font-family: Arial, sans-serif; }
-        button { padding: 10px 20px; margin: 10px; background: #007bff; color: white; border: none; border-radius: 5px; cursor: pointer; }
-        button:hover { background: #0056b3; }
-        #chartContainer { margin-top: 30px; height: 400px; }
-        .result { margin-top: 20px; padding: 15px; border-radius: 5px; }
-        .success { background: #d4edda; color: #155724; }
-        .error { background: #f8d7da; color: #721c24; }
-        .info { background: #d1ecf1; color: #0c5460; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Chart.js 기본 테스트</h1>
-        <p>차트 기능이 정상적으로 작동하는지 확인합니다.</p>
-        
-        <button onclick="testChart()">차트 생성 테스트</button>
-        <button data-symbol="AAPL" class="chart-btn">AAPL 차트 (이벤트 리스너)</button>
-        <button onclick="checkChart()">Chart.js 상태 확인</button>
-        
-        <div id="chartContainer">
-            <canvas id="testChart"></canvas>
-        </div>
-        
-        <div id="result"></div>
-    </div>
-
-    <script>
-        console.log('Chart.js 로드됨:', typeof Chart !== 'undefined');
-        
-        function checkChart() {
-            const result = document.getElementById('result');
-            if (typeof Chart === 'undefined') {
-                result.innerHTML = '<div class="result error">❌ Chart.js가 로드되지 않았습니다!</div>';
-            } else {
-                result.innerHTML = '<div class="result success">✅ Chart.js가 정상적으로 로드되었습니다!</div>';
-            }
-        }
-        
-        // 기본 차트 생성 함수
-        function testChart() {
-            console.log('testChart 함수 호출됨');
-            
-            if (typeof Chart === 'undefined') {
-                document.getElementById('result').innerHTML = '<div class="result error">❌ Chart.js가 로드되지 않았습니다!</div>';
-                return;
-            }
-            
-            const ctx = document.getElementById('testChart').getContext('2d');
-            
-            // 기존 차트가 있다면 제거
-            if (window.currentChart) {
-                window.currentChart.destroy();
-            }
-            
-            window.currentChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: ['2020', '2021', '2022', '2023', '2024'],
-                    datasets: [{
-                        label: 'ROE (%)',
-                        data: [15, 18, 22, 25, 28],
-                        borderColor: '#28a745',
-                        backgroundColor: 'rgba(40, 167, 69, 0.1)',
-                        tension: 0.4,
-                        borderWidth: 3
-                    }, {
-                        label: '주가수익률 (%)',
-                        data: [0, 25, 45, 78, 125],
-                        borderColor: '#007bff',
-                        backgroundColor: 'rgba(0, 123, 255, 0.1)',
-                        tension: 0.4,
-                        borderWidth: 3
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        title: {
-                            display: true,
-                            text: '테스트 차트 - ROE vs 주가수익률'
-                        }
-                    }
-                }
-            });
-            
-            document.getElementById('result').innerHTML = '<div class="result success">✅ 차트가 성공적으로 생성되었습니다!</div>';
-        }
-        
-        // 클래스 방식 테스트
-        class TestAnalyzer {
-            constructor() {
-                console.log('TestAnalyzer 생성됨');
-                this.currentChart = null;
-            }
-            
-            showChart(symbol) {
-                console.log('showChart 호출됨, symbol:', symbol);
-                document.getElementById('result').innerHTML = `<div class="result info">📊 ${symbol} 차트를 보여줍니다.</div>`;
-                testChart(); // 실제 차트 생성
-            }
-        }
-        
-        // DOM 로딩 완료 후 실행
-        document.addEventListener('DOMContentLoaded', function() {
-            console.log('DOM 로딩 완료');
-            
-            const analyzer = new TestAnalyzer();
-            window.analyzer = analyzer;
-            
-            // 이벤트 리스너 방식 테스트
-            document.querySelectorAll('.chart-btn').forEach(button => {
-                button.addEventListener('click', function(e) {
-                    const symbol = e.target.getAttribute('data-symbol');
-                    analyzer.showChart(symbol);
-                });
-            });
-            
-            console.log('analyzer 객체:', analyzer);
-            console.log('showChart 메서드 타입:', typeof analyzer.showChart);
-            
-            // 초기 상태 확인
-            checkChart();
-        });
-    </script>
-</body>
-</html>"""
-    return test_html
+    return assets.response(request, "test.html")
 
-# 메인 페이지 HTML 직접 반환
+# 메인 페이지 (api/static/index.html, ETag 재검증 / 사전 압축본 제공)
 @app.get("/", response_class=HTMLResponse)
-async def serve_index():
-    html_content = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ROE 기반 장기투자 분석</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>📊</text></svg>">
-    <!-- Plotly 직접 로딩 -->
-    <script src="https://cdn.plot.ly/plotly-2.26.0.min.js"
-            onerror="console.log('CDN1 실패, CDN2 시도...'); this.onerror=null; this.src='https://cdn.jsdelivr.net/npm/plotly.js-dist@2.26.0/plotly.min.js';"
-            onload="console.log('✅ Plotly 로딩 성공!', typeof Plotly);">
-    </script>
-    <script>
-        // Plotly 로딩 상태 확인
-        window.addEventListener('load', function() {
-            console.log('🔍 페이지 로드 완료 - Plotly 상태:', typeof Plotly);
-        });
-    </script>
-    <style>
-        .navbar { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-        .card { border: none; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); }
-        .card-header { background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); color: white; }
-        .form-range::-webkit-slider-thumb { background: #6366f1; }
-        .btn-primary { background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%); border: none; }
-        .btn-chart {
-            background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%);
-            border: none;
-            color: white;
-            font-weight: 600;
-            padding: 8px 16px;
-            border-radius: 20px;
-            box-shadow: 0 2px 4px rgba(14, 165, 233, 0.3);
-            transition: all 0.3s ease;
-        }
-        .btn-chart:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(14, 165, 233, 0.4);
-            color: white;
-        }
-        .philosophy-toggle-btn {
-            background: linear-gradient(135deg, #f59e0b 0%, #f97316 100%);
-            border: none;
-            color: white;
-            padding: 10px 20px;
-            border-radius: 25px;
-            box-shadow: 0 3px 6px rgba(245, 158, 11, 0.3);
-            transition: all 0.3s ease;
-        }
-        .philosophy-toggle-btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 12px rgba(245, 158, 11, 0.4);
-            color: white;
-        }
-        .error-message { background: #fef2f2; color: #dc2626; padding: 10px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #dc2626; }
-        .success-message { background: #f0fdf4; color: #059669; padding: 10px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #059669; }
-        .grade-A-plus { background: #059669; color: white; }
-        .grade-A { background: #0891b2; color: white; }
-        .grade-B-plus { background: #0ea5e9; color: white; }
-        .grade-B { background: #6366f1; color: white; }
-        .grade-C-plus { background: #f59e0b; color: white; }
-        .grade-C { background: #ef4444; color: white; }
-        .grade-D { background: #6b7280; color: white; }
-        .correlation-positive { color: #059669; font-weight: bold; }
-        .correlation-negative { color: #ef4444; font-weight: bold; }
-        .correlation-neutral { color: #6c757d; }
-        .score-breakdown { border-left: 4px solid #667eea; padding-left: 15px; }
-        .score-item { display: flex; justify-content: space-between; margin: 5px 0; padding: 5px 10px; background: #f8f9fa; border-radius: 5px; }
-        #loadingSection { text-align: center; padding: 40px 0; }
-        .spinner-border { color: #667eea; }
-        #chartSection, #detailsSection { margin-top: 30px; }
-
-        /* 차트 반응형 스타일 */
-        .chart-container {
-            position: relative;
-            height: 400px;
-            margin-bottom: 4rem;
-        }
-
-        /* 데스크톱 너비 제한 및 가운데 정렬 */
-        .main-container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 20px;
-        }
-
-        /* 모바일에서는 전체 너비 사용 */
-        @media (max-width: 768px) {
-            .main-container {
-                max-width: none;
-                margin: 0;
-                padding: 0 15px;
-            }
-        }
-        #roeChart, #returnChart {
-            width: 100%;
-            height: 600px;
-            min-height: 600px;
-        }
-
-        /* 모바일 반응형 */
-        @media (max-width: 768px) {
-            .chart-container {
-                height: 520px;
-                margin-bottom: 3rem;
-            }
-            #roeChart, #returnChart {
-                width: 100%;
-                height: 520px;
-                min-height: 520px;
-            }
-            .card-body { padding: 1rem; }
-            .table-responsive { font-size: 0.85rem; }
-            .btn-chart { padding: 0.25rem 0.5rem; font-size: 0.75rem; }
-            h5 { font-size: 1.1rem; }
-            .score-item { font-size: 0.85rem; }
-        }
-
-        @media (max-width: 480px) {
-            .chart-container {
-                height: 450px;
-                margin-bottom: 2.5rem;
-            }
-            #roeChart, #returnChart {
-                height: 450px !important;
-                max-height: 450px;
-            }
-            .table-responsive { font-size: 0.8rem; }
-            .card-body { padding: 0.75rem; }
-            h5 { font-size: 1rem; }
-        }
-    </style>
-</head>
-<body>
-    <div class="main-container">
-        <div class="container-fluid py-4">
-            <div class="text-center mb-4 mt-3">
-                <div class="d-flex align-items-center justify-content-center mb-3">
-                    <img src="https://raw.githubusercontent.com/bijang5353/ROE_investment/master/assets/images/profile.gif"
-                         alt="AI Generated Portrait"
-                         class="rounded-circle me-4"
-                         style="width: 160px; height: 160px; object-fit: cover; border: 4px solid #667eea; box-shadow: 0 6px 12px rgba(0,0,0,0.15);"
-                         title="Created with Midjourney AI">
-                    <h1 class="text-primary mb-0" style="font-weight: 600; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">
-                        ROE 기반 장기투자 분석 시스템
-                    </h1>
-                </div>
-                <p class="text-muted mb-0">현명한 투자자를 위한 ROE 분석 도구</p>
-                <small class="text-muted" style="font-size: 0.7rem;">Portrait created with Midjourney AI</small>
-            </div>
-        <div class="row">
-            <div class="col-12">
-                <div class="card mb-4">
-                    <div class="card-header">
-                        <div class="d-flex justify-content-between align-items-center">
-                            <h5 class="card-title mb-0">📈 투자 철학</h5>
-                            <button class="btn btn-sm fw-bold philosophy-toggle-btn" type="button" data-bs-toggle="collapse" data-bs-target="#philosophyContent" aria-expanded="false" aria-controls="philosophyContent">
-                                <i class="fas fa-eye me-2"></i>
-                                <span id="philosophyToggleText">투자철학 보기</span>
-                                <i class="bi bi-chevron-down ms-2" id="philosophyToggleIcon"></i>
-                            </button>
-                        </div>
-                    </div>
-                    <div class="collapse" id="philosophyContent">
-                        <div class="card-body">
-                            <div class="philosophy-content">
-                                <h4 class="text-primary mb-3">ROE와 복리수익의 마법</h4>
-                                
-                                <div class="row mb-4">
-                                    <div class="col-md-6">
-                                        <h6 class="text-success"><i class="bi bi-lightbulb"></i> 간단한 원리</h6>
-                                        <p class="text-muted">ROE가 높은 기업에 장기투자하면, <strong class="text-primary">ROE(%)와 거의 비슷한 연평균 수익률</strong>을 얻을 수 있습니다.</p>
-                                        
-                                        <h6 class="text-success mt-3"><i class="bi bi-graph-up"></i> 복리의 힘</h6>
-                                        <ul class="list-unstyled">
-                                            <li>• ROE 15% 기업 → 연평균 약 <span class="badge bg-success">15%</span> 수익률 기대</li>
-                                            <li>• ROE 20% 기업 → 연평균 약 <span class="badge bg-success">20%</span> 수익률 기대</li>
-                                        </ul>
-                                    </div>
-                                    
-                                    <div class="col-md-6">
-                                        <h6 class="text-warning"><i class="bi bi-clock-history"></i> 시간이 만드는 기적</h6>
-                                        <div class="bg-light p-3 rounded mb-3">
-                                            <p class="mb-2"><strong>5년 투자시:</strong></p>
-                                            <ul class="list-unstyled small">
-                                                <li>• 100만원 → ROE 15% 기업: 약 <span class="text-primary fw-bold">200만원</span></li>
-                                                <li>• 100만원 → ROE 20% 기업: 약 <span class="text-success fw-bold">250만원</span></li>
-                                            </ul>
-                                        </div>
-                                        <div class="bg-light p-3 rounded">
-                                            <p class="mb-2"><strong>10년 투자시:</strong></p>
-                                            <ul class="list-unstyled small">
-                                                <li>• 100만원 → ROE 15% 기업: 약 <span class="text-primary fw-bold">400만원</span></li>
-                                                <li>• 100만원 → ROE 20% 기업: 약 <span class="text-success fw-bold">620만원</span></li>
-                                            </ul>
-                                        </div>
-                                    </div>
-                                </div>
-                                
-                                <div class="alert alert-info border-0">
-                                    <h6 class="alert-heading"><i class="bi bi-gem"></i> 핵심 메시지</h6>
-                                    <p class="mb-0"><em>"좋은 기업(고ROE)을 사서 오래 들고 있으면, 복리의 힘으로 돈이 눈덩이처럼 불어난다"</em></p>
-                                    <small class="text-muted">시장이 일시적으로 흔들려도, 결국 기업의 진짜 실력(ROE)만큼 수익률이 따라옵니다.</small>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="card mb-4">
-                    <div class="card-header">
-                        <h5 class="card-title mb-0">분석 설정</h5>
-                    </div>
-                    <div class="card-body">
-                        <div class="row">
-                            <div class="col-md-4">
-                                <label for="minRoe" class="form-label">최소 ROE (%): <span id="roeValue">15</span>%</label>
-                                <input type="range" class="form-range" id="minRoe" min="5" max="40" value="15" step="1">
-                                <div class="d-flex justify-content-between">
-                                    <small class="text-muted">5%</small>
-                                    <small class="text-muted">40%</small>
-                                </div>
-                            </div>
-                            <div class="col-md-4">
-                                <label for="years" class="form-label">지속 년수: <span id="yearsValue">5</span>년</label>
-                                <input type="range" class="form-range" id="years" min="5" max="10" value="5" step="1">
-                                <div class="d-flex justify-content-between">
-                                    <small class="text-muted">5년</small>
-                                    <small class="text-muted">10년</small>
-                                </div>
-                            </div>
-                            <div class="col-md-2">
-                                <label for="limit" class="form-label">분석 기업 수</label>
-                                <select class="form-select" id="limit">
-                                    <option value="5">5개</option>
-                                    <option value="10">10개</option>
-                                    <option value="20" selected>20개</option>
-                                    <option value="30">30개</option>
-                                </select>
-                            </div>
-                            <div class="col-md-2">
-                                <button class="btn btn-primary w-100" id="analyzeBtn">분석하기</button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div id="loadingSection" style="display: none;">
-            <div class="spinner-border" role="status">
-                <span class="visually-hidden">Loading...</span>
-            </div>
-            <p class="mt-3">분석 중입니다...</p>
-        </div>
-
-        <div id="resultsSection" style="display: none;">
-            <div class="card">
-                <div class="card-header">
-                    <h5 class="card-title mb-0">분석 결과 (<span id="resultCount">0</span>)</h5>
-                </div>
-                <div class="card-body">
-                    <div class="table-responsive">
-                        <table class="table table-hover">
-                            <thead>
-                                <tr>
-                                    <th>순위</th>
-                                    <th>기업명</th>
-                                    <th>섹터</th>
-                                    <th>10년 평균 ROE</th>
-                                    <th>10년 누적수익률</th>
-                                    <th>상관계수</th>
-                                    <th>투자점수</th>
-                                    <th>등급</th>
-                                    <th>차트</th>
-                                </tr>
-                            </thead>
-                            <tbody id="resultsTableBody">
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div id="chartSection" style="display: none;">
-            <div class="card mb-4">
-                <div class="card-header">
-                    <h5 class="card-title mb-0" id="chartTitle">ROE vs 누적주가수익률</h5>
-                </div>
-                <div class="card-body">
-                    <div class="row mb-4">
-                        <div class="col-12">
-                            <div class="chart-container">
-                                <h5 class="text-center mb-3">년도별 ROE vs 누적 년평균 수익률 (%)</h5>
-                                <div id="roeChart"></div>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="row">
-                        <div class="col-12">
-                            <div class="chart-container">
-                                <h5 class="text-center mb-3">년도별 ROE vs 년도별 수익률 (%)</h5>
-                                <div id="returnChart"></div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div id="detailsSection" style="display: none;">
-            <div class="card">
-                <div class="card-header">
-                    <h5 class="card-title mb-0">상세 분석</h5>
-                </div>
-                <div class="card-body" id="detailsContent">
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        class ROEAnalyzer {
-            constructor() {
-                this.apiBaseUrl = window.location.origin;
-                this.analysisData = [];
-                this.autoAnalysisTimer = null;
-                this.hasPerformedInitialAnalysis = false;
-                this.initializeEventListeners();
-            }
-
-            initializeEventListeners() {
-                document.getElementById('analyzeBtn').addEventListener('click', () => {
-                    this.performAnalysis();
-                });
-                
-                document.getElementById('minRoe').addEventListener('input', (e) => {
-                    document.getElementById('roeValue').textContent = e.target.value;
-                    this.scheduleAutoAnalysis();
-                });
-                
-                document.getElementById('years').addEventListener('input', (e) => {
-                    document.getElementById('yearsValue').textContent = e.target.value;
-                    this.scheduleAutoAnalysis();
-                });
-                
-                document.getElementById('limit').addEventListener('change', () => {
-                    this.scheduleAutoAnalysis();
-                });
-            }
-
-            scheduleAutoAnalysis() {
-                if (!this.hasPerformedInitialAnalysis) {
-                    return;
-                }
-                
-                if (this.autoAnalysisTimer) {
-                    clearTimeout(this.autoAnalysisTimer);
-                }
-                
-                this.autoAnalysisTimer = setTimeout(() => {
-                    this.performAnalysis(true);
-                }, 800);
-            }
-
-            async performAnalysis(isAutoAnalysis = false) {
-                const minRoe = parseFloat(document.getElementById('minRoe').value);
-                const years = parseInt(document.getElementById('years').value);
-                const limit = parseInt(document.getElementById('limit').value);
-
-                if (minRoe < 5 || years < 5 || limit < 5) {
-                    this.showError('올바른 분석 조건을 입력해주세요.');
-                    return;
-                }
-
-                this.hasPerformedInitialAnalysis = true;
-
-                if (!isAutoAnalysis) {
-                    this.showLoading(true);
-                    this.hideResults();
-                } else {
-                    const resultCount = document.getElementById('resultCount');
-                    resultCount.textContent = '분석 중...';
-                }
-
-                try {
-                    const response = await fetch(`${this.apiBaseUrl}/analyze`, {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            min_roe: minRoe,
-                            years: years,
-                            limit: limit
-                        })
-                    });
-
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        this.analysisData = result.data;
-                        this.displayResults(result.data);
-                        if (!isAutoAnalysis) {
-                            this.showSuccess(`${result.data.length}개 기업 분석이 완료되었습니다.`);
-                        }
-                    } else {
-                        if (!isAutoAnalysis) {
-                            this.showError(result.message || '분석 중 오류가 발생했습니다.');
-                        }
-                    }
-
-                } catch (error) {
-                    console.error('Analysis error:', error);
-                    if (!isAutoAnalysis) {
-                        this.showError('서버 연결에 실패했습니다. 서버가 실행 중인지 확인해주세요.');
-                    }
-                } finally {
-                    if (!isAutoAnalysis) {
-                        this.showLoading(false);
-                    }
-                }
-            }
-
-            displayResults(data) {
-                const tbody = document.getElementById('resultsTableBody');
-                const resultCount = document.getElementById('resultCount');
-                
-                tbody.innerHTML = '';
-                resultCount.textContent = `${data.length}개 기업`;
-
-                data.sort((a, b) => b.investment_score.total_score - a.investment_score.total_score);
-
-                data.forEach((item, index) => {
-                    const row = this.createTableRow(item, index + 1);
-                    tbody.appendChild(row);
-                });
-
-
-                document.getElementById('resultsSection').style.display = 'block';
-            }
-
-            createTableRow(item, rank) {
-                const tr = document.createElement('tr');
-                
-                const gradeClass = this.getGradeClass(item.investment_score.grade);
-                const correlationClass = this.getCorrelationClass(item.correlation_analysis.correlation_coefficient);
-                
-                tr.innerHTML = `
-                    <td>${rank}</td>
-                    <td>
-                        <strong>${item.stock_info.company_name}</strong><br>
-                        <small class="text-muted">${item.stock_info.symbol}</small>
-                    </td>
-                    <td>${item.stock_info.sector || '-'}</td>
-                    <td>${item.ten_year_roe_avg.toFixed(2)}%</td>
-                    <td>${item.ten_year_return.toFixed(2)}%</td>
-                    <td class="${correlationClass}">${item.correlation_analysis.correlation_coefficient.toFixed(3)}</td>
-                    <td>
-                        <span class="badge ${gradeClass}">
-                            ${item.investment_score.total_score.toFixed(0)}점
-                        </span>
-                    </td>
-                    <td>
-                        <span class="badge ${gradeClass}">${item.investment_score.grade}</span>
-                    </td>
-                    <td>
-                        <button class="btn btn-chart btn-sm" onclick="window.analyzer.showChart('${item.stock_info.symbol}')">
-                            <i class="fas fa-chart-line me-1"></i>
-                            차트 보기
-                        </button>
-                    </td>
-                `;
-
-                return tr;
-            }
-
-            getGradeClass(grade) {
-                const gradeMap = {
-                    'A+': 'grade-A-plus',
-                    'A': 'grade-A',
-                    'B+': 'grade-B-plus',
-                    'B': 'grade-B',
-                    'C+': 'grade-C-plus',
-                    'C': 'grade-C',
-                    'D': 'grade-D'
-                };
-                return gradeMap[grade] || 'bg-secondary';
-            }
-
-            getCorrelationClass(correlation) {
-                if (correlation > 0.3) return 'correlation-positive';
-                if (correlation < -0.3) return 'correlation-negative';
-                return 'correlation-neutral';
-            }
-
-            showLoading(show) {
-                const loadingSection = document.getElementById('loadingSection');
-                loadingSection.style.display = show ? 'block' : 'none';
-            }
-
-            hideResults() {
-                document.getElementById('resultsSection').style.display = 'none';
-                document.getElementById('chartSection').style.display = 'none';
-                document.getElementById('detailsSection').style.display = 'none';
-                this.clearMessages();
-            }
-
-            showError(message) {
-                this.clearMessages();
-                const alertDiv = document.createElement('div');
-                alertDiv.className = 'error-message';
-                alertDiv.textContent = message;
-                
-                const container = document.querySelector('.container-fluid');
-                container.insertBefore(alertDiv, container.firstChild);
-                
-                setTimeout(() => {
-                    if (alertDiv.parentNode) {
-                        alertDiv.parentNode.removeChild(alertDiv);
-                    }
-                }, 5000);
-            }
-
-            showSuccess(message) {
-                this.clearMessages();
-                const alertDiv = document.createElement('div');
-                alertDiv.className = 'success-message';
-                alertDiv.textContent = message;
-                
-                const container = document.querySelector('.container-fluid');
-                container.insertBefore(alertDiv, container.firstChild);
-                
-                setTimeout(() => {
-                    if (alertDiv.parentNode) {
-                        alertDiv.parentNode.removeChild(alertDiv);
-                    }
-                }, 3000);
-            }
-
-            clearMessages() {
-                const messages = document.querySelectorAll('.error-message, .success-message');
-                messages.forEach(msg => {
-                    if (msg.parentNode) {
-                        msg.parentNode.removeChild(msg);
-                    }
-                });
-            }
-
-            createRoeChart(stockData) {
-                if (typeof Plotly === 'undefined') {
-                    console.error('Plotly.js가 로드되지 않았습니다.');
-                    return;
-                }
-
-                const chartData = stockData.chart_data;
-                const maxRoeValue = Math.max(...chartData.roe_data);
-                const targetMaxRoe = Math.max(maxRoeValue * 1.1, 100); // 최소 100, 최대값의 110%
-                const targetMaxReturn = Math.max(...chartData.return_data) * 1.1;
-
-                // 강제 디버깅
-                console.log('===== 차트 Y축 설정 디버깅 =====');
-                console.log('회사:', stockData.stock_info.symbol);
-                console.log('ROE 데이터:', chartData.roe_data);
-                console.log('최대 ROE:', maxRoeValue);
-                console.log('설정할 Y축 최대값:', targetMaxRoe);
-                console.log('==================================');
-
-                console.log('🚀 PLOTLY CHART DEBUG:');
-                console.log('ROE Data:', chartData.roe_data);
-                console.log('Max ROE Value:', maxRoeValue);
-                console.log('Symbol:', stockData.stock_info.symbol);
-                console.log('Target Y-axis Max ROE:', targetMaxRoe);
-
-                // 애플인 경우 강제로 테스트 데이터 사용
-                if (stockData.stock_info.symbol === 'AAPL') {
-                    console.log('🍎 APPLE: 강제로 테스트 데이터 사용');
-                    chartData.roe_data = [45.2, 39.1, 43.5, 49.8, 55.9, 73.7, 90.4, 175.4, 156.1, 164.6, 165.2];
-                    console.log('🍎 APPLE: 강제 ROE 데이터:', chartData.roe_data);
-                }
-
-                document.getElementById('chartTitle').textContent =
-                    `${stockData.stock_info.company_name} (${stockData.stock_info.symbol}) - ROE vs 주가수익률`;
-
-                // 누적 투자금액 계산 (초기 1억원 투자 + 누적수익률 적용)
-                const cumulativeInvestment = chartData.labels.map((label, index) => {
-                    const initialInvestment = 1.0; // 초기 투자금액 1억원
-                    const cumulativeReturn = chartData.return_data[index] / 100; // 누적수익률
-                    return initialInvestment * (1 + cumulativeReturn); // 초기투자금에 누적수익률 적용
-                });
-
-                const trace1 = {
-                    x: chartData.labels,
-                    y: chartData.roe_data,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: 'ROE (%)',
-                    yaxis: 'y',
-                    line: { color: '#059669', width: 3 },
-                    marker: { size: 8, color: '#059669' },
-                    text: chartData.roe_data.map(val => `${val.toFixed(1)}%`),
-                    textposition: 'top center',
-                    textfont: { size: 10, color: '#059669' }
-                };
-
-                const trace2 = {
-                    x: chartData.labels,
-                    y: chartData.return_data,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: '누적 주가수익률 (%)',
-                    yaxis: 'y2',
-                    line: { color: '#0ea5e9', width: 3 },
-                    marker: { size: 8, color: '#0ea5e9' },
-                    text: chartData.return_data.map(val => `${val.toFixed(1)}%`),
-                    textposition: 'middle left',
-                    textfont: { size: 10, color: '#0ea5e9' }
-                };
-
-                // 누적 투자금액 trace 추가
-                const trace3 = {
-                    x: chartData.labels,
-                    y: cumulativeInvestment,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: '투자가치 (억원)',
-                    yaxis: 'y3',
-                    line: { color: '#f59e0b', width: 2, dash: 'dot' },
-                    marker: { size: 6, color: '#f59e0b' },
-                    text: cumulativeInvestment.map(val => `${val.toLocaleString('ko-KR', {minimumFractionDigits: 1, maximumFractionDigits: 1})}억`),
-                    textposition: 'top right',
-                    textfont: { size: 9, color: '#000000', family: 'Arial Black, sans-serif' }
-                };
-
-                const layout = {
-                    title: {
-                        text: window.innerWidth <= 768 ? 'ROE vs 주가수익률' : 'ROE와 주가수익률의 상관관계',
-                        font: { size: window.innerWidth <= 768 ? 14 : 16 }
-                    },
-                    xaxis: {
-                        title: '연도',
-                        showgrid: true,
-                        titlefont: {
-                            size: window.innerWidth <= 768 ? 10 : 12
-                        },
-                        tickfont: {
-                            size: window.innerWidth <= 768 ? 8 : 10
-                        },
-                        dtick: window.innerWidth <= 768 ? 2 : 1,
-                        tickmode: 'linear'
-                    },
-                    yaxis: {
-                        title: 'ROE (%)',
-                        side: 'left',
-                        range: [0, targetMaxRoe],  // 강제 범위 설정
-                        showgrid: true,
-                        gridcolor: 'rgba(5, 150, 105, 0.2)',
-                        titlefont: {
-                            color: '#059669',
-                            size: window.innerWidth <= 768 ? 10 : 12
-                        },
-                        tickfont: {
-                            color: '#059669',
-                            size: window.innerWidth <= 768 ? 8 : 10
-                        }
-                    },
-                    yaxis2: {
-                        title: window.innerWidth <= 768 ? '누적수익률(%)' : '누적 주가수익률 (%)',
-                        side: 'right',
-                        range: [0, targetMaxReturn],
-                        overlaying: 'y',
-                        showgrid: false,
-                        titlefont: {
-                            color: '#0ea5e9',
-                            size: window.innerWidth <= 768 ? 10 : 12
-                        },
-                        tickfont: {
-                            color: '#0ea5e9',
-                            size: window.innerWidth <= 768 ? 8 : 10
-                        }
-                    },
-                    yaxis3: {
-                        title: window.innerWidth <= 768 ? '투자가치(억)' : '투자가치 (억원)',
-                        side: 'right',
-                        position: window.innerWidth <= 768 ? 0.9 : 0.85,
-                        range: [0, Math.max(...cumulativeInvestment) * 1.2],
-                        overlaying: 'y',
-                        showgrid: false,
-                        titlefont: {
-                            color: '#f59e0b',
-                            size: window.innerWidth <= 768 ? 9 : 12
-                        },
-                        tickfont: {
-                            color: '#f59e0b',
-                            size: window.innerWidth <= 768 ? 7 : 10
-                        }
-                    },
-                    legend: {
-                        orientation: 'h',
-                        x: 0,
-                        y: -0.2,
-                        bgcolor: 'rgba(255,255,255,0.9)',
-                        bordercolor: 'rgba(0,0,0,0.2)',
-                        borderwidth: 1,
-                        font: {
-                            size: window.innerWidth <= 768 ? 9 : 11
-                        }
-                    },
-                    margin: window.innerWidth <= 768
-                        ? { l: 50, r: 50, t: 80, b: 150 }
-                        : { l: 80, r: 80, t: 100, b: 180 },
-                    height: window.innerWidth <= 768 ? 520 : 600,
-                    autosize: true,
-                    dragmode: window.innerWidth <= 768 ? false : 'zoom'
-                };
-
-                const config = {
-                    responsive: true,
-                    displayModeBar: false,
-                    scrollZoom: window.innerWidth <= 768 ? true : true,
-                    doubleClick: window.innerWidth <= 768 ? 'reset' : 'reset+autosize',
-                    staticPlot: false
-                };
-
-                console.log('🚀 Plotly.newPlot 시작...');
-                console.log('차트 컨테이너 확인:', document.getElementById('roeChart'));
-                console.log('📊 차트 데이터 확인:', {
-                    labels: chartData.labels,
-                    roe_data: chartData.roe_data,
-                    return_data: chartData.return_data,
-                    labelCount: chartData.labels.length,
-                    roeCount: chartData.roe_data.length,
-                    returnCount: chartData.return_data.length
-                });
-
-                Plotly.newPlot('roeChart', [trace1, trace2, trace3], layout, config).then(() => {
-                    console.log('✅ Plotly 차트 생성 완료!');
-                    console.log('설정된 Y축 최대값:', targetMaxRoe);
-
-                    // 차트 생성 후 실제 Y축 범위 확인
-                    setTimeout(() => {
-                        const plotDiv = document.getElementById('roeChart');
-                        console.log('🔍 실제 차트 Y축 확인:');
-                        console.log('Y축 범위:', plotDiv.layout.yaxis.range);
-
-                        // Y축 범위 자동 조정 완료
-                    }, 500);
-                }).catch((error) => {
-                    console.error('❌ Plotly 차트 생성 실패:', error);
-                    console.log('차트 컨테이너 상태:', document.getElementById('roeChart'));
-                });
-            }
-
-            createReturnChart(stockData) {
-                if (typeof Plotly === 'undefined') {
-                    console.error('Plotly.js가 로드되지 않았습니다.');
-                    return;
-                }
-
-                const chartData = stockData.chart_data;
-
-                // 년도별 수익률 계산 (전년 대비)
-                const yearlyReturns = chartData.return_data.map((cumReturn, index) => {
-                    if (index === 0) return 0;
-                    if (index === 1) return cumReturn;
-
-                    const currentReturn = cumReturn;
-                    const prevReturn = chartData.return_data[index - 1];
-
-                    if (prevReturn === 0) return currentReturn;
-                    const yearlyReturn = ((currentReturn / prevReturn) - 1) * 100;
-                    return yearlyReturn;
-                });
-
-                const maxRoeValue = Math.max(...chartData.roe_data);
-                const maxReturnValue = Math.max(...yearlyReturns);
-                const minReturnValue = Math.min(...yearlyReturns);
-                const targetMaxY = Math.max(maxRoeValue, maxReturnValue) * 1.1;
-                const targetMinY = Math.min(0, minReturnValue * 1.2);
-
-                const trace1 = {
-                    x: chartData.labels,
-                    y: chartData.roe_data,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: 'ROE (%)',
-                    line: { color: '#28a745', width: 3 },
-                    marker: { size: 8, color: '#28a745' },
-                    text: chartData.roe_data.map(val => `${val.toFixed(1)}%`),
-                    textposition: 'bottom left',
-                    textfont: { size: 9, color: '#28a745' }
-                };
-
-                const trace2 = {
-                    x: chartData.labels,
-                    y: yearlyReturns,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: '년도별 수익률 (%)',
-                    line: { color: '#ff6b35', width: 3 },
-                    marker: { size: 8, color: '#ff6b35' },
-                    text: yearlyReturns.map(val => `${val.toFixed(1)}%`),
-                    textposition: yearlyReturns.map(val => val >= 0 ? 'top right' : 'bottom right'),
-                    textfont: { size: 9, color: '#ff6b35' }
-                };
-
-                // 누적 투자금액 trace 추가 (초기 1억원 투자 + 누적수익률 적용)
-                const cumulativeInvestment = chartData.labels.map((label, index) => {
-                    const initialInvestment = 1.0; // 초기 투자금액 1억원
-                    const cumulativeReturn = chartData.return_data[index] / 100; // 누적수익률
-                    return initialInvestment * (1 + cumulativeReturn); // 초기투자금에 누적수익률 적용
-                });
-                const trace3 = {
-                    x: chartData.labels,
-                    y: cumulativeInvestment,
-                    type: 'scatter',
-                    mode: 'lines+markers+text',
-                    name: '투자가치 (억원)',
-                    line: { color: '#f59e0b', width: 2 },
-                    marker: { size: 6, color: '#f59e0b' },
-                    text: cumulativeInvestment.map(val => `${val.toLocaleString('ko-KR', {minimumFractionDigits: 1, maximumFractionDigits: 1})}억`),
-                    textposition: 'top right',
-                    textfont: { size: 9, color: '#000000', family: 'Arial Black, sans-serif' },
-                    yaxis: 'y3'
-                };
-
-                const layout = {
-                    title: {
-                        text: window.innerWidth <= 768 ? 'ROE vs 년도별 수익률' : 'ROE와 년도별 수익률 비교',
-                        font: { size: window.innerWidth <= 768 ? 14 : 16 }
-                    },
-                    xaxis: {
-                        title: '연도',
-                        showgrid: true,
-                        titlefont: {
-                            size: window.innerWidth <= 768 ? 10 : 12
-                        },
-                        tickfont: {
-                            size: window.innerWidth <= 768 ? 8 : 10
-                        },
-                        dtick: window.innerWidth <= 768 ? 2 : 1,
-                        tickmode: 'linear'
-                    },
-                    yaxis: {
-                        title: '수익률 (%)',
-                        range: [targetMinY, targetMaxY],
-                        showgrid: true,
-                        titlefont: {
-                            size: window.innerWidth <= 768 ? 10 : 12
-                        },
-                        tickfont: {
-                            size: window.innerWidth <= 768 ? 8 : 10
-                        }
-                    },
-                    yaxis3: {
-                        title: window.innerWidth <= 768 ? '투자가치(억)' : '투자가치 (억원)',
-                        side: 'right',
-                        position: window.innerWidth <= 768 ? 0.9 : 0.85,
-                        range: [0, Math.max(...cumulativeInvestment) * 1.2],
-                        overlaying: 'y',
-                        showgrid: false,
-                        titlefont: {
-                            color: '#f59e0b',
-                            size: window.innerWidth <= 768 ? 9 : 12
-                        },
-                        tickfont: {
-                            color: '#f59e0b',
-                            size: window.innerWidth <= 768 ? 7 : 10
-                        }
-                    },
-                    legend: {
-                        orientation: 'h',
-                        x: 0,
-                        y: -0.2,
-                        bgcolor: 'rgba(255,255,255,0.9)',
-                        bordercolor: 'rgba(0,0,0,0.2)',
-                        borderwidth: 1,
-                        font: {
-                            size: window.innerWidth <= 768 ? 9 : 11
-                        }
-                    },
-                    margin: window.innerWidth <= 768
-                        ? { l: 50, r: 50, t: 80, b: 150 }
-                        : { l: 80, r: 80, t: 100, b: 180 },
-                    height: window.innerWidth <= 768 ? 520 : 600,
-                    autosize: true,
-                    dragmode: window.innerWidth <= 768 ? false : 'zoom'
-                };
-
-                const config = {
-                    responsive: true,
-                    displayModeBar: false,
-                    scrollZoom: window.innerWidth <= 768 ? true : true,
-                    doubleClick: window.innerWidth <= 768 ? 'reset' : 'reset+autosize',
-                    staticPlot: false
-                };
-
-                console.log('🚀 Return Chart - Plotly.newPlot 시작...');
-                console.log('Return 차트 컨테이너 확인:', document.getElementById('returnChart'));
-                console.log('📊 Return 차트 데이터 확인:', {
-                    labels: chartData.labels,
-                    yearlyReturns: yearlyReturns,
-                    labelCount: chartData.labels.length,
-                    yearlyReturnCount: yearlyReturns.length,
-                    has2025YTD: chartData.labels.includes('2025 YTD')
-                });
-
-                Plotly.newPlot('returnChart', [trace1, trace2, trace3], layout, config).then(() => {
-                    console.log('✅ Plotly return chart created');
-                }).catch((error) => {
-                    console.error('❌ Return 차트 생성 실패:', error);
-                    console.log('Return 차트 컨테이너 상태:', document.getElementById('returnChart'));
-                });
-            }
-
-
-            showStockDetails(stockData) {
-                const detailsContent = document.getElementById('detailsContent');
-                const correlation = stockData.correlation_analysis;
-                const score = stockData.investment_score;
-                
-                const significanceText = {
-                    'highly_significant': '매우 유의함 (p < 0.01)',
-                    'significant': '유의함 (p < 0.05)',
-                    'moderately_significant': '보통 유의함 (p < 0.1)',
-                    'not_significant': '유의하지 않음 (p ≥ 0.1)',
-                    'insufficient_data': '데이터 부족',
-                    'error': '계산 오류'
-                };
-
-                detailsContent.innerHTML = `
-                    <div class="row">
-                        <div class="col-md-6">
-                            <h6>기업 정보</h6>
-                            <ul class="list-unstyled">
-                                <li><strong>회사명:</strong> ${stockData.stock_info.company_name}</li>
-                                <li><strong>심볼:</strong> ${stockData.stock_info.symbol}</li>
-                                <li><strong>섹터:</strong> ${stockData.stock_info.sector || '-'}</li>
-                                <li><strong>시가총액:</strong> ${stockData.stock_info.market_cap ? 
-                                    (stockData.stock_info.market_cap / 1000000000).toFixed(1) + 'B USD' : '-'}</li>
-                            </ul>
-                            
-                            <h6>수익성 지표</h6>
-                            <ul class="list-unstyled">
-                                <li><strong>10년 평균 ROE:</strong> ${stockData.ten_year_roe_avg.toFixed(2)}%</li>
-                                <li><strong>10년 총수익률:</strong> ${stockData.ten_year_return.toFixed(2)}%</li>
-                                <li><strong>연평균 수익률:</strong> ${(stockData.ten_year_return / 10).toFixed(2)}%</li>
-                            </ul>
-                        </div>
-                        
-                        <div class="col-md-6">
-                            <h6>상관관계 분석</h6>
-                            <ul class="list-unstyled">
-                                <li><strong>상관계수:</strong> ${correlation.correlation_coefficient.toFixed(4)}</li>
-                                <li><strong>P-값:</strong> ${correlation.p_value.toFixed(4)}</li>
-                                <li><strong>유의성:</strong> ${significanceText[correlation.significance]}</li>
-                            </ul>
-                            
-                            <h6>투자 점수 상세</h6>
-                            <div class="score-breakdown">
-                                <div class="score-item">
-                                    <span>ROE 일관성</span>
-                                    <span>${score.roe_consistency_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>ROE 성장성</span>
-                                    <span>${score.roe_growth_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>주가 수익률</span>
-                                    <span>${score.price_return_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>상관관계</span>
-                                    <span>${score.correlation_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>총점</span>
-                                    <span>${score.total_score}/100 (${score.grade})</span>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }
-
-            showChart(symbol) {
-
-                if (!this.analysisData || this.analysisData.length === 0) {
-                    console.error('분석 데이터가 없습니다. 먼저 분석을 실행해주세요.');
-                    return;
-                }
-
-                const stockData = this.analysisData.find(item => item.stock_info.symbol === symbol);
-                if (!stockData) {
-                    console.error('해당 기업의 데이터를 찾을 수 없습니다:', symbol);
-                    return;
-                }
-
-                // Plotly 차트는 자동으로 기존 차트를 덮어씀
-                this.createRoeChart(stockData);
-                this.createReturnChart(stockData);
-                this.createDetailsSection(stockData);
-
-                // 섹션들 표시
-                document.getElementById('chartSection').style.display = 'block';
-                document.getElementById('detailsSection').style.display = 'block';
-
-                // 차트 크기 조정 (Plotly resize)
-                setTimeout(() => {
-                    if (typeof Plotly !== 'undefined') {
-                        Plotly.Plots.resize('roeChart');
-                        Plotly.Plots.resize('returnChart');
-                    }
-                }, 100);
-
-                // 차트 섹션으로 스크롤
-                document.getElementById('chartSection').scrollIntoView({ behavior: 'smooth' });
-            }
-
-            createDetailsSection(stockData) {
-                const detailsContent = document.getElementById('detailsContent');
-                if (!detailsContent) return;
-                
-                const score = stockData.investment_score;
-                detailsContent.innerHTML = `
-                    <div class="row">
-                        <div class="col-md-6">
-                            <h6>기업 정보</h6>
-                            <p><strong>기업명:</strong> ${stockData.stock_info.company_name}</p>
-                            <p><strong>심볼:</strong> ${stockData.stock_info.symbol}</p>
-                            <p><strong>섹터:</strong> ${stockData.stock_info.sector || '-'}</p>
-                        </div>
-                        <div class="col-md-6">
-                            <h6>투자 점수 상세</h6>
-                            <div class="score-breakdown">
-                                <div class="score-item">
-                                    <span>ROE 일관성</span>
-                                    <span>${score.roe_consistency_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>ROE 성장성</span>
-                                    <span>${score.roe_growth_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>주가 수익률</span>
-                                    <span>${score.price_return_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>상관관계</span>
-                                    <span>${score.correlation_score}/25</span>
-                                </div>
-                                <div class="score-item">
-                                    <span>총점</span>
-                                    <span>${score.total_score}/100 (${score.grade})</span>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }
-        }
-
-        // Plotly 로딩 완료까지 대기하는 함수
-        function waitForPlotly(callback, attempts = 0) {
-            console.log('🔍 Plotly 로딩 확인 중... 시도:', attempts + 1, '현재 상태:', typeof Plotly);
-
-            if (typeof Plotly !== 'undefined' && Plotly.newPlot) {
-                console.log('✅ Plotly 로딩 확인됨! 버전:', Plotly.version);
-                callback();
-            } else if (attempts < 30) { // 최대 6초 대기 (200ms * 30)
-                setTimeout(() => waitForPlotly(callback, attempts + 1), 200);
-            } else {
-                console.error('❌ Plotly 로딩 타임아웃!');
-                console.log('Chart.js 사용으로 폴백...');
-                callback(); // Chart.js로 폴백
-            }
-        }
-
-        // DOM 로딩 완료 후 실행
-        document.addEventListener('DOMContentLoaded', function() {
-            console.log('📱 페이지 로딩 완료');
-            console.log('🔍 즉시 Plotly 상태 확인:', typeof Plotly);
-
-            waitForPlotly(function() {
-                console.log('🎯 Plotly 최종 상태:', typeof Plotly);
-                if (typeof Plotly !== 'undefined') {
-                    console.log('✅ Plotly가 정상적으로 로드됨!');
-                } else {
-                    console.log('❌ Plotly가 로드되지 않음 - Chart.js 사용');
-                }
-
-                const analyzer = new ROEAnalyzer();
-                window.analyzer = analyzer;
-                console.log('🚀 ROE Analyzer:', typeof analyzer);
-                console.log('🚀 ROE Analyzer 초기화 완료');
-            });
-            
-            // 투자 철학 토글 기능
-            const philosophyCollapse = document.getElementById('philosophyContent');
-            const toggleText = document.getElementById('philosophyToggleText');
-            const toggleIcon = document.getElementById('philosophyToggleIcon');
-            
-            console.log('투자철학 요소들:', { philosophyCollapse, toggleText, toggleIcon });
-            
-            if (philosophyCollapse && toggleText && toggleIcon) {
-                philosophyCollapse.addEventListener('show.bs.collapse', function() {
-                    console.log('투자철학 섹션 열림');
-                    toggleText.textContent = '투자철학 숨기기';
-                    toggleIcon.className = 'bi bi-chevron-up';
-                });
-                
-                philosophyCollapse.addEventListener('hide.bs.collapse', function() {
-                    console.log('투자철학 섹션 닫힘');
-                    toggleText.textContent = '투자철학 보기';
-                    toggleIcon.className = 'bi bi-chevron-down';
-                });
-                
-                // 버튼 클릭 디버깅
-                const toggleButton = document.querySelector('[data-bs-target="#philosophyContent"]');
-                if (toggleButton) {
-                    toggleButton.addEventListener('click', function() {
-                        console.log('투자철학 토글 버튼 클릭됨');
-                    });
-                }
-            } else {
-                console.error('투자철학 토글 요소들을 찾을 수 없습니다');
-            }
-        });
-    </script>
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
-    </div> <!-- main-container 닫기 -->
-</body>
-</html>"""
-    return html_content
+async def serve_index(request: Request):
+    return assets.response(request, "index.html")
 
 @app.post("/analyze")
 async def analyze_stocks(request: AnalysisRequest):
@@ -1,18 +1,28 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 import sys
 import os
-import random
-import math
+import json
+import asyncio
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Set
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.stock_screener import StockScreener
-from services.investment_analyzer import InvestmentAnalyzer
-from models.stock_models import AnalysisRequest, AnalysisResponse
+# pandas / numpy / scipy / yfinance 를 끌어오는 서비스 모듈은 처음 사용할 때 import (콜드 스타트 단축)
+from services.metrics import IN_FLIGHT, PROMETHEUS_CONTENT_TYPE, REGISTRY, record_cache
+if TYPE_CHECKING:
+    from services.investment_analyzer import InvestmentAnalyzer
+from services.job_store import JobStore
+from services.result_cache import ResultCache
+from services.serialization import available_media_types, compress, encode, negotiate
+from services.static_assets import StaticAssets
+from models.stock_models import (
+    AnalysisRequest, AnalysisResponse, JobStatus, StockAnalysisResult, StockInfo, StockPrice
+)
 
 app = FastAPI(title="ROE 기반 장기투자 분석", version="1.0.0")
 
@@ -30,138 +40,255 @@ project_root = current_dir.parent
 frontend_dir = project_root / "frontend"
 
 app.mount("/static", StaticFiles(directory=str(frontend_dir)), name="static")
+dashboard_assets = StaticAssets(frontend_dir, ["index.html"])
 
-screener = StockScreener()
-analyzer = InvestmentAnalyzer()
-
-def get_grade_by_rank(rank):
-    """순위에 따른 투자 등급 반환"""
-    if rank == 0:
-        return "A+"
-    elif rank <= 2:
-        return "A"
-    elif rank <= 5:
-        return "B+"
-    elif rank <= 10:
-        return "B"
-    elif rank <= 15:
-        return "C+"
-    elif rank <= 20:
-        return "C"
-    else:
-        return "D"
+# 데이터 제공자 / 스크리너 / 분석기는 처음 사용할 때 생성 (get_screener / get_analyzer)
+# 데이터 제공자는 ROE_FIXTURE_DIR 환경변수로 오프라인 픽스처로 바꿀 수 있음
+# (동시 요청의 같은 조회는 한 번만 실행, 실제 업스트림 호출은 메트릭으로 기록)
+provider = None
+screener = None
+analyzer = None
+job_store = JobStore()
+running_jobs: Dict[str, asyncio.Task] = {}
+# 시작 시 띄운 백그라운드 작업 (이벤트 루프는 작업을 약하게 참조하므로 끝날 때까지 참조를 보관)
+background_tasks: Set[asyncio.Task] = set()
+# 동일한 분석 요청 결과 캐시 (재무/주가 데이터 버전이 바뀌면 자동 무효화)
+result_cache = ResultCache(max_entries=128, ttl=10 * 60)
+# 서버 모드: ROE_SERVE_MODE=snapshot 이면 /analyze 는 사전 계산 스냅샷(python run.py snapshot)만으로 응답
+# (요청 처리 중 데이터 제공자를 호출하지 않음, CURRENT 버전이 바뀌면 새 스냅샷으로 교체)
+SERVE_MODE = os.environ.get("ROE_SERVE_MODE", "live")
+snapshot_store = None
+snapshot = None
+snapshot_lock = asyncio.Lock()
+# ROE_PANEL=1 이면 기본 유니버스 ROE 패널을 첫 요청 때 백그라운드에서 만들고 panel_ttl 이 지나면 다시 만든다
+# (유니버스 전체의 재무제표를 조회하므로 기본값은 사용하지 않음, 종목별 실시간 판정)
+USE_ROE_PANEL = os.environ.get("ROE_PANEL") == "1"
+panel_task = None
+
+# API 요청 처리 시간 / 업스트림 HTTP 세션 통계 메트릭
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "roe_http_request_duration_seconds", "API 요청 처리 시간", ("method", "route", "status"))
+UPSTREAM_HTTP = REGISTRY.gauge(
+    "roe_upstream_http", "데이터 제공자 HTTP 세션 누적 통계", ("stat",))
+CLIENT_DISCONNECTS = REGISTRY.counter(
+    "roe_client_disconnects_total", "분석이 끝나기 전에 클라이언트 연결이 끊겨 작업을 취소한 요청 수", ("route",))
+# 클라이언트가 응답을 받기 전에 연결을 끊은 요청의 상태 코드 (nginx 관례)
+CLIENT_CLOSED_REQUEST = 499
+
+def collect_upstream_http():
+    # HTTP 세션을 아직 쓰지 않았다면 수집하지 않음 (메트릭 조회만으로 curl_cffi 를 로드하지 않도록)
+    http_session = sys.modules.get("services.http_session")
+    if http_session is None:
+        return
+    for stat, value in http_session.get_http_session().stats.items():
+        UPSTREAM_HTTP.set(value, stat=stat)
+
+REGISTRY.add_collector(collect_upstream_http)
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    with IN_FLIGHT.track_in_progress(kind="http_requests"):
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            # 경로 파라미터별로 시계열이 늘어나지 않도록 라우트 템플릿(/jobs/{job_id}) 사용
+            route = request.scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                method=request.method, route=getattr(route, "path", "unmatched"), status=status
+            )
+
+async def wait_for_disconnect(http_request: Request):
+    """클라이언트 연결 종료(http.disconnect)까지 대기
+
+    요청 본문을 이미 읽었으므로 이후 receive 는 연결이 끊길 때 반환된다. Request.is_disconnected 는
+    즉시 취소되는 receive 를 쓰는데, http 미들웨어(BaseHTTPMiddleware)를 거치면 그 사이에 대기가 생겨
+    연결 종료를 감지하지 못하므로 StreamingResponse 처럼 receive 를 직접 기다린다.
+    """
+    while True:
+        message = await http_request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+async def cancel_on_disconnect(http_request: Request, coro, route: str):
+    """coro 를 실행하다가 클라이언트 연결이 끊기면 작업(과 그 하위 스크리닝/분석 작업)을 취소하고 None 반환"""
+    task = asyncio.ensure_future(coro)
+    watcher = asyncio.ensure_future(wait_for_disconnect(http_request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+    if task.done():
+        return task.result()
+    
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    CLIENT_DISCONNECTS.inc(route=route)
+    print(f"클라이언트 연결 종료 - {route} 작업 취소")
+    return None
+
+def get_screener():
+    global provider, screener
+    if screener is None:
+        from services.data_provider import InstrumentedProvider, get_default_provider
+        from services.single_flight import SingleFlightProvider
+        from services.stock_screener import StockScreener
+        provider = provider or SingleFlightProvider(InstrumentedProvider(get_default_provider()))
+        screener = StockScreener(provider=provider)
+    return screener
+
+def get_analyzer():
+    global analyzer
+    if analyzer is None:
+        from services.investment_analyzer import InvestmentAnalyzer
+        screener = get_screener()
+        analyzer = InvestmentAnalyzer(provider=screener.provider, screener=screener)
+    return analyzer
+
+async def get_snapshot():
+    """현재 버전 스냅샷 (새 버전을 로드하는 동안 다른 요청은 이전 버전으로 응답)"""
+    global snapshot_store, snapshot
+    if snapshot_store is None:
+        from services.snapshot import SnapshotStore
+        snapshot_store = SnapshotStore()
+    version = snapshot_store.current_version()
+    if version is None or (snapshot is not None and (snapshot.version == version or snapshot_lock.locked())):
+        return snapshot
+    async with snapshot_lock:
+        if snapshot is None or snapshot.version != version:
+            snapshot = await asyncio.to_thread(snapshot_store.load, version)
+            print(f"스냅샷 {version} 로드: {len(snapshot)}개 종목")
+    return snapshot
 
 @app.get("/")
-async def root():
-    return FileResponse(str(frontend_dir / "index.html"))
+async def root(request: Request):
+    """대시보드 (ETag 재검증, 변경이 없으면 304, 사전 압축본 제공)"""
+    return dashboard_assets.response(request, "index.html")
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭 (단계별 소요 시간, 캐시 적중률, 데이터 제공자 오류, 진행 중인 작업 수)"""
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/prices/{symbol}", response_model=List[StockPrice])
+async def get_prices(symbol: str, years: int = 10):
+    """원본 일간 주가 조회 (StockPrice 모델 변환은 이 API 경계에서만 수행)"""
+    from services.price_store import to_stock_prices
+    series = await asyncio.to_thread(get_analyzer()._get_price_history, symbol.upper(), years)
+    return to_stock_prices(series)
+
+def data_version() -> tuple:
+    """분석에 쓰이는 재무/주가 저장소의 현재 데이터 버전"""
+    return (get_screener().store.version, get_analyzer().prices.version)
+
+def cache_key(request: AnalysisRequest) -> tuple:
+    """요청 파라미터를 정규화한 캐시 키"""
+    return (round(request.min_roe, 4), request.years, request.limit)
 
 @app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_stocks(request: AnalysisRequest):
+async def analyze_stocks(request: AnalysisRequest, http_request: Request, columnar: bool = False):
+    """분석 실행 (Accept 헤더로 응답 형식 선택: JSON / MessagePack / Arrow IPC, Accept-Encoding 으로 br/gzip 압축)
+
+    스냅샷 모드(ROE_SERVE_MODE=snapshot)에서는 스냅샷을 필터링/정렬해 응답한다 (스냅샷이 없으면 503).
+    분석 중 클라이언트 연결이 끊기면 스크리닝/분석 작업을 취소한다 (상태 코드 499).
+
+    columnar=true 이면 JSON 응답에서도 종목별 주가를 컬럼 배열로 보낸다 (MessagePack / Arrow 는 항상 컬럼 배열).
+    """
+    media_type = negotiate(http_request.headers.get("accept"))
+    if media_type is None:
+        raise HTTPException(
+            status_code=406, detail=f"지원하는 응답 형식: {', '.join(available_media_types())}"
+        )
+    
+    if SERVE_MODE == "snapshot":
+        current = await get_snapshot()
+        if current is None:
+            raise HTTPException(status_code=503, detail="스냅샷이 없습니다. python run.py snapshot 으로 생성하세요.")
+        response = current.analyze(request)
+    else:
+        key = cache_key(request)
+        response = result_cache.get(key, data_version())
+        record_cache("result", response is not None)
+        if response is None:
+            response = await cancel_on_disconnect(http_request, run_analysis(request), "/analyze")
+            if response is None:
+                return Response(status_code=CLIENT_CLOSED_REQUEST)
+            if response.success and not response.partial:
+                # 분석 중 저장소가 갱신될 수 있으므로 분석이 끝난 시점의 버전으로 저장
+                result_cache.put(key, data_version(), response)
+    
+    body, encoding = compress(encode(response, media_type, columnar), http_request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+def request_services():
+    """요청 단위 데이터 컨텍스트를 공유하는 스크리너/분석기 (종목별 데이터는 요청당 한 번만 조회)"""
+    from services.data_context import RequestDataContext
+    screener, analyzer = get_screener(), get_analyzer()
+    ensure_roe_panel()
+    context = RequestDataContext(screener.provider)
+    request_screener = screener.with_context(context)
+    return request_screener, analyzer.with_context(context, request_screener)
+
+async def run_analysis(request: AnalysisRequest) -> AnalysisResponse:
+    """스크리닝 + 선정 기업 동시 분석
+
+    request.time_budget(초)이 있으면 그 시각이 지날 때 남은 스크리닝/분석 작업을 취소하고
+    그때까지 완료된 결과만 partial 로 반환한다.
+    """
     try:
+        request_screener, request_analyzer = request_services()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + request.time_budget if request.time_budget else None
+        
         # ROE 15% 이상 5년 지속 기업 스크리닝
-        qualified_stocks = await screener.screen_high_roe_stocks(
+        qualified_stocks = await request_screener.screen_high_roe_stocks(
             min_roe=request.min_roe,
             years=request.years,
-            limit=request.limit
+            limit=request.limit,
+            deadline=deadline
         )
+        screening_cut = deadline is not None and loop.time() >= deadline
         
         if not qualified_stocks:
             return AnalysisResponse(
                 success=False,
-                message="조건에 맞는 기업을 찾을 수 없습니다.",
-                data=[]
+                message="제한 시간 안에 조건에 맞는 기업을 찾지 못했습니다." if screening_cut
+                else "조건에 맞는 기업을 찾을 수 없습니다.",
+                data=[],
+                partial=screening_cut
             )
         
-        # 간소화된 데모 결과 반환 (복잡한 분석 생략)
-        demo_results = []
-        # request.limit에 맞게 결과 제한
-        limited_stocks = qualified_stocks[:request.limit]
-        
-        for i, stock in enumerate(limited_stocks):
-            # 10년치 데모 데이터 생성
-            base_roe = 15 + i * 2  # 기업별 기본 ROE
-            base_return = 100
-            
-            # 10년치 데이터 생성
-            roe_data = []
-            return_data = []
-            investment_values = []
-            labels = []
-            roe_history = []
-            
-            # 누적 수익률 계산을 위한 초기값
-            cumulative_return = 100  # 초기 투자금 100%
-            
-            for year_idx, year in enumerate(list(range(2015, 2025)) + ['2025 YTD']):  # 2015-2024 + 2025 YTD (11년)
-                if year == '2025 YTD':
-                    year_label = '2025 YTD'
-                    multiplier = 0.75  # YTD는 약 9개월이므로 75%만 적용
-                else:
-                    year_label = year
-                    multiplier = 1.0
-                
-                # ROE는 기본값 주변에서 현실적으로 변동 (실제처럼 오르락내리락)
-                random.seed(42 + i * 100 + year_idx * 10)  # 일관된 시드로 재현가능한 랜덤값
-                # 사이클을 만들어서 오르락내리락하도록 함
-                cycle_factor = math.sin(year_idx * 0.7 + i) * 3  # -3 ~ +3 사이클 변동
-                random_factor = random.uniform(-2, 2)  # -2 ~ +2 랜덤 변동
-                roe_value = max(8.0, base_roe + cycle_factor + random_factor)  # 최소 8% 보장
-                roe_data.append(round(roe_value, 1))
-                
-                # 누적 수익률 계산 (매년 복리)
-                if year_idx == 0:
-                    cumulative_return = 100  # 첫 해는 100%
-                else:
-                    # 이전 누적 수익률에 해당 년도 ROE 적용
-                    yearly_growth = 1 + (roe_value / 100 * multiplier)
-                    cumulative_return = cumulative_return * yearly_growth
-                
-                return_data.append(round(cumulative_return, 1))
-                
-                # 투자 가치
-                investment_values.append(round(cumulative_return / 100, 2))
-                
-                labels.append(year_label)
-                
-                # ROE 히스토리
-                roe_history.append({
-                    "year": 2025 if year == '2025 YTD' else int(year),  # Pydantic validation을 위해 정수로 변환
-                    "roe": float(roe_value),
-                    "net_income": float(1000000000 + (year_idx * 100000000))
-                })
-            
-            demo_result = {
-                "stock_info": stock,
-                "roe_history": roe_history,
-                "price_history": [],
-                "ten_year_return": float(return_data[-1] - 100),  # 최종 수익률
-                "five_year_roe_avg": float(sum(roe_data[-5:]) / 5),  # 최근 5년 평균 ROE
-                "correlation_analysis": {
-                    "correlation_coefficient": float(0.75 - i * 0.05),
-                    "p_value": float(0.02),
-                    "significance": "significant"
-                },
-                "investment_score": {
-                    "total_score": float(max(50, 95 - i * 3)),
-                    "roe_consistency_score": float(max(15, 25 - i)),
-                    "roe_growth_score": float(max(15, 23 - i)),
-                    "price_return_score": float(max(15, 25 - i)),
-                    "correlation_score": float(max(10, 22 - i)),
-                    "grade": get_grade_by_rank(i)
-                },
-                "chart_data": {
-                    "labels": labels,
-                    "roe_data": roe_data,
-                    "return_data": return_data,
-                    "investment_value": investment_values
-                }
-            }
-            demo_results.append(demo_result)
+        # 선정된 기업을 동시에 분석 (종목별 제한 시간, 실패/시간 초과 종목은 빼고 부분 결과로 응답)
+        from services.analysis_runner import analyze_stocks_concurrently
+        outcome = await analyze_stocks_concurrently(
+            qualified_stocks[:request.limit], request_analyzer, deadline=deadline
+        )
+        results = sorted(outcome.results, key=lambda r: r.investment_score.total_score, reverse=True)
         
+        message = f"{len(results)}개 기업 분석 완료"
+        if outcome.partial:
+            message += f" ({len(outcome.failed)}개 기업 분석 실패 또는 시간 초과)"
+        if screening_cut:
+            message += " (제한 시간 초과로 스크리닝 중단)"
         return AnalysisResponse(
-            success=True,
-            message=f"{len(demo_results)}개 기업 분석 완료",
-            data=demo_results
+            success=bool(results),
+            message=message if results else "선정된 기업의 분석에 모두 실패했습니다.",
+            data=results,
+            partial=outcome.partial or screening_cut,
+            failed_symbols=list(outcome.failed)
         )
         
     except Exception as e:
@@ -174,6 +301,203 @@ async def analyze_stocks(request: AnalysisRequest):
             data=[]
         )
 
+def format_stream_event(event: str, payload: str, media_type: str) -> str:
+    """스트리밍 이벤트 한 건을 NDJSON 한 줄 또는 SSE 메시지로 변환"""
+    if media_type == "text/event-stream":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f'{{"event": "{event}", "data": {payload}}}\n'
+
+@app.post("/analyze/stream")
+async def analyze_stocks_stream(request: AnalysisRequest, format: str = "ndjson"):
+    """분석 결과 스트리밍: 종목 분석이 끝나는 즉시 result 이벤트, 마지막에 summary 이벤트 전송
+
+    스크리닝을 통과한 종목은 확정되는 즉시 동시 분석을 시작하고 (종목별 제한 시간), 끝난 순서대로 보낸다.
+    format=ndjson (기본값, application/x-ndjson) 또는 format=sse (text/event-stream)
+    """
+    from services.analysis_runner import DEFAULT_MAX_CONCURRENCY, DEFAULT_SYMBOL_TIMEOUT, analyze_and_record
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    
+    async def event_stream():
+        count = 0
+        failed: List[str] = []
+        request_screener, request_analyzer = request_services()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + request.time_budget if request.time_budget else None
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+        # (종목, 분석 결과 또는 None) 을 끝난 순서대로 전달, 스크리닝과 분석이 모두 끝나면 None
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def analyze(stock: StockInfo):
+            # 종목별 결과는 /analyze 와 같이 roe_symbol_analyses_total 에 기록
+            _, result, _ = await analyze_and_record(
+                stock, request_analyzer, semaphore, DEFAULT_SYMBOL_TIMEOUT, deadline)
+            finished.put_nowait((stock, result))
+        
+        async def screen_and_analyze():
+            analyses = []
+            try:
+                async for stock in request_screener.iter_high_roe_stocks(
+                    min_roe=request.min_roe,
+                    years=request.years,
+                    limit=request.limit,
+                    deadline=deadline
+                ):
+                    analyses.append(asyncio.ensure_future(analyze(stock)))
+                await asyncio.gather(*analyses)
+            finally:
+                for task in analyses:
+                    task.cancel()
+                finished.put_nowait(None)
+        
+        producer = asyncio.ensure_future(screen_and_analyze())
+        try:
+            while (item := await finished.get()) is not None:
+                stock, result = item
+                if result is None:
+                    failed.append(stock.symbol)
+                    continue
+                count += 1
+                yield format_stream_event("result", result.model_dump_json(), media_type)
+            await producer
+            
+            success = count > 0
+            message = f"{count}개 기업 분석 완료" if success else "조건에 맞는 기업을 찾을 수 없습니다."
+            if failed:
+                message += f" ({len(failed)}개 기업 분석 실패 또는 시간 초과)"
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료로 스트림이 취소됨 (스크리닝/분석 작업은 아래에서 취소)
+            CLIENT_DISCONNECTS.inc(route="/analyze/stream")
+            raise
+        except Exception as e:
+            print(f"Error details: {str(e)}")
+            success = False
+            message = f"분석 중 오류 발생: {str(e)}"
+        finally:
+            producer.cancel()
+        
+        summary = json.dumps({"success": success, "message": message, "count": count,
+                              "failed_symbols": failed}, ensure_ascii=False)
+        yield format_stream_event("summary", summary, media_type)
+    
+    return StreamingResponse(event_stream(), media_type=media_type)
+
+async def run_analysis_job(job_id: str):
+    """백그라운드 스크리닝+분석 작업 실행 (이미 기록된 단계는 건너뛰고 이어서 진행)
+
+    /analyze 와 같이 종목을 동시에 분석하며(종목별 제한 시간), 결과는 종목 분석이 끝나는 즉시 기록한다.
+    request.time_budget 이 있으면 이번 실행 시작부터의 제한 시간으로 적용하고, 그때까지 끝나지 않은 종목은
+    실패로 기록한다.
+    """
+    from services.analysis_runner import DEFAULT_MAX_CONCURRENCY, DEFAULT_SYMBOL_TIMEOUT, analyze_and_record
+    job = job_store.get_job(job_id)
+    request = AnalysisRequest(**job["request"])
+    request_screener, request_analyzer = request_services()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + request.time_budget if request.time_budget else None
+    try:
+        stocks = job_store.get_stocks(job_id)
+        if stocks is None:
+            job_store.update_status(job_id, "screening")
+            qualified_stocks = await request_screener.screen_high_roe_stocks(
+                min_roe=request.min_roe,
+                years=request.years,
+                limit=request.limit,
+                deadline=deadline
+            )
+            stocks = [stock.model_dump() for stock in qualified_stocks]
+            job_store.set_stocks(job_id, stocks)
+        
+        job_store.update_status(job_id, "analyzing")
+        finished = {r["symbol"] for r in job_store.get_results(job_id)}
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+        pending = [
+            analyze_and_record(StockInfo(**stock), request_analyzer, semaphore, DEFAULT_SYMBOL_TIMEOUT, deadline)
+            for stock in stocks if stock["symbol"] not in finished
+        ]
+        timed_out = 0
+        for next_done in asyncio.as_completed(pending):
+            stock, result, reason = await next_done
+            timed_out += reason in ("timeout", "deadline")
+            job_store.add_result(job_id, stock.symbol, result.model_dump(mode="json") if result else None)
+        
+        succeeded = sum(1 for r in job_store.get_results(job_id) if r["status"] == "ok")
+        message = f"{succeeded}개 기업 분석 완료"
+        if timed_out:
+            message += f" ({timed_out}개 기업 시간 초과)"
+        job_store.update_status(job_id, "completed", message)
+        
+    except Exception as e:
+        import traceback
+        print(f"Error in job {job_id}: {str(e)}")
+        print(f"Traceback: {traceback.format_exc()}")
+        job_store.update_status(job_id, "failed", f"분석 중 오류 발생: {str(e)}")
+
+def spawn_background(coro) -> asyncio.Task:
+    """백그라운드 작업 시작 (완료될 때까지 background_tasks 에 참조 보관)"""
+    task = asyncio.ensure_future(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+def start_job(job_id: str):
+    task = asyncio.create_task(run_analysis_job(job_id))
+    running_jobs[job_id] = task
+    task.add_done_callback(lambda _: running_jobs.pop(job_id, None))
+
+def get_job_status(job_id: str) -> JobStatus:
+    job = job_store.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    results = job_store.get_results(job_id)
+    return JobStatus(
+        job_id=job_id,
+        status=job["status"],
+        request=job["request"],
+        total=job["total"],
+        completed=len(results),
+        failed_symbols=[r["symbol"] for r in results if r["status"] == "failed"],
+        message=job["message"],
+        results=[r["result"] for r in results if r["status"] == "ok"]
+    )
+
+@app.on_event("startup")
+async def resume_unfinished_jobs():
+    """서버 재시작 시 끝나지 않은 작업을 이어서 실행"""
+    for job_id in job_store.unfinished_jobs():
+        print(f"Resuming job {job_id}")
+        start_job(job_id)
+
+@app.on_event("startup")
+async def preload_snapshot():
+    """스냅샷 모드에서는 현재 스냅샷을 미리 로드 (디스크 읽기만, 데이터 제공자는 호출하지 않음)"""
+    if SERVE_MODE == "snapshot":
+        spawn_background(get_snapshot())
+
+def ensure_roe_panel():
+    """ROE_PANEL=1 일 때 ROE 패널이 없거나 panel_ttl 이 지났으면 백그라운드에서 (다시) 생성
+
+    서버 시작 시가 아니라 처음 스크리닝 요청이 올 때 시작하므로 콜드 스타트에는 비용이 없다.
+    생성이 끝나기 전의 요청은 종목별 실시간 판정을 사용한다.
+    """
+    global panel_task
+    if not USE_ROE_PANEL or (panel_task is not None and not panel_task.done()):
+        return
+    if get_screener()._active_panel() is not None:
+        return
+    panel_task = spawn_background(asyncio.to_thread(get_screener().build_roe_panel))
+
+@app.post("/jobs", response_model=JobStatus)
+async def create_job(request: AnalysisRequest):
+    """스크리닝+분석 작업을 백그라운드로 시작하고 작업 ID 반환"""
+    job_id = job_store.create_job(request.model_dump())
+    start_job(job_id)
+    return get_job_status(job_id)
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """작업 진행 상황과 지금까지의 분석 결과 조회"""
+    return get_job_status(job_id)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
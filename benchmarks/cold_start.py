@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+서버 진입점 콜드 스타트 측정 / import 시간 프로파일 / 예산 검사
+
+새 파이썬 프로세스에서 진입점 모듈을 import 하고 startup 이벤트(lifespan)를 실행한 뒤 첫 요청(GET /)을
+처리하기까지의 시간을 재고,
+`python -X importtime` 결과에서 누적 import 시간이 큰 모듈을 보여준다.
+
+    python benchmarks/cold_start.py            # 예산을 넘으면 종료 코드 1
+    python benchmarks/cold_start.py --top 30
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+project_root = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ["backend/main.py", "api/index.py"]
+
+# 콜드 스타트 예산 (초): 진입점 import / import + startup 이벤트 + 첫 요청(GET /) 처리
+COLD_START_BUDGET = {"import_s": 1.0, "first_request_s": 1.5}
+
+# 진입점 import 시점에 로드되면 안 되는 무거운 모듈 (첫 사용 시 로드)
+DEFERRED_MODULES = ("pandas", "numpy", "scipy", "yfinance", "pyarrow", "curl_cffi")
+
+# 자식 프로세스에서 실행: 진입점 import 후 ASGI lifespan 시작(startup 이벤트) 과 GET / 한 번 호출
+# (startup 이벤트가 띄운 작업과 그 import 도 측정에 포함, 무거운 모듈 로드 여부는 첫 요청 후에 확인)
+_PROBE = """
+import asyncio, importlib.util, json, sys, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("entry", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.perf_counter()
+result = {}
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+async def send(message):
+    if message["type"] == "http.response.start":
+        result["status"] = message["status"]
+scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+         "scheme": "http", "path": "/", "raw_path": b"/", "query_string": b"", "root_path": "",
+         "headers": [(b"host", b"localhost"), (b"accept-encoding", b"br, gzip")],
+         "client": ("127.0.0.1", 0), "server": ("localhost", 80)}
+async def main():
+    lifespan_in, lifespan_out = asyncio.Queue(), asyncio.Queue()
+    lifespan_in.put_nowait({"type": "lifespan.startup"})
+    lifespan = asyncio.ensure_future(module.app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}},
+                                                lifespan_in.get, lifespan_out.put))
+    result["lifespan"] = (await lifespan_out.get())["type"]
+    result["started_s"] = time.perf_counter() - start
+    await module.app(scope, receive, send)
+    result["first_request_s"] = time.perf_counter() - start
+    result["deferred_loaded"] = [name for name in sys.argv[2].split(",") if name in sys.modules]
+    lifespan_in.put_nowait({"type": "lifespan.shutdown"})
+    await lifespan_out.get()
+    await lifespan
+asyncio.run(main())
+print(json.dumps({"import_s": imported - start, **result}))
+"""
+
+
+def _probe(entry: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + [
+        "-c", _PROBE, str(project_root / entry), ",".join(DEFERRED_MODULES)
+    ]
+    # startup 이벤트가 네트워크를 쓰지 않도록 빈 저장소와 빈 오프라인 픽스처 제공자 사용 (import 는 그대로 발생)
+    with tempfile.TemporaryDirectory(prefix="roe-cold-start-") as tmp:
+        env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1",
+               "ROE_CACHE_DIR": tmp, "ROE_FIXTURE_DIR": os.path.join(tmp, "fixtures")}
+        return subprocess.run(command, cwd=project_root, env=env, capture_output=True, text=True, check=True)
+
+
+def import_profile(entry: str, top: int = 15) -> List[Dict]:
+    """-X importtime 결과에서 누적 import 시간이 큰 모듈 top 개"""
+    rows = []
+    for line in _probe(entry, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|").split("|")]
+        rows.append({"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    return sorted(rows, key=lambda row: row["cumulative_ms"], reverse=True)[:top]
+
+
+def measure_cold_start(entry: str, repeat: int = 5) -> Dict:
+    """진입점 콜드 스타트 시간 (새 프로세스 repeat 번의 중앙값)"""
+    runs = [json.loads(_probe(entry).stdout.strip().splitlines()[-1]) for _ in range(repeat)]
+    return {
+        "import_s": statistics.median(run["import_s"] for run in runs),
+        "started_s": statistics.median(run["started_s"] for run in runs),
+        "first_request_s": statistics.median(run["first_request_s"] for run in runs),
+        "lifespan": runs[-1]["lifespan"],
+        "status": runs[-1]["status"],
+        "deferred_loaded": runs[-1]["deferred_loaded"],
+        "repeat": repeat,
+    }
+
+
+def check_budget(results: Dict[str, Dict]) -> List[str]:
+    """예산 위반 목록 (비어 있으면 통과)"""
+    violations = []
+    for entry, result in results.items():
+        for metric, budget in COLD_START_BUDGET.items():
+            if result[metric] > budget:
+                violations.append(f"{entry}: {metric} {result[metric]:.3f}s > 예산 {budget:.3f}s")
+        if result["deferred_loaded"]:
+            violations.append(f"{entry}: import 시점에 로드됨 - {', '.join(result['deferred_loaded'])}")
+        if result["lifespan"] != "lifespan.startup.complete":
+            violations.append(f"{entry}: startup 이벤트 실패 ({result['lifespan']})")
+        if result["status"] != 200:
+            violations.append(f"{entry}: GET / 응답 코드 {result['status']}")
+    return violations
+
+
+def run(repeat: int = 5, top: int = 15, verbose: bool = True) -> Dict:
+    results = {}
+    for entry in ENTRY_POINTS:
+        result = measure_cold_start(entry, repeat)
+        result["import_profile"] = import_profile(entry, top)
+        results[entry] = result
+        if verbose:
+            print(f"  {entry:16} import {result['import_s'] * 1000:8.1f} ms  "
+                  f"startup 까지 {result['started_s'] * 1000:8.1f} ms  "
+                  f"첫 요청까지 {result['first_request_s'] * 1000:8.1f} ms")
+            for row in result["import_profile"]:
+                print(f"      {row['cumulative_ms']:8.1f} ms  {row['module']}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 진입점 콜드 스타트 측정 / 예산 검사")
+    parser.add_argument("--repeat", type=int, default=5, help="새 프로세스 실행 횟수")
+    parser.add_argument("--top", type=int, default=15, help="import 프로파일에 보여줄 모듈 수")
+    args = parser.parse_args()
+
+    print(f"[cold start] 예산: {COLD_START_BUDGET}, import 지연 대상: {', '.join(DEFERRED_MODULES)}")
+    violations = check_budget(run(args.repeat, args.top))
+    for violation in violations:
+        print(f"[OVER BUDGET] {violation}")
+    print("콜드 스타트 예산 통과" if not violations else "콜드 스타트 예산 초과")
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+스크리너 / 분석기 / 엔드포인트 벤치마크
+
+합성 유니버스(100~5,000 종목)에서 단계별 소요 시간을 측정하고 JSON 으로 저장한다.
+
+    python benchmarks/run_benchmarks.py --sizes 100 1000 5000
+    python benchmarks/run_benchmarks.py --skip-cold-start   # 콜드 스타트 예산 검사 생략
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<이전>.json benchmarks/results/<현재>.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# 저장소(cache/)가 실제 데이터와 섞이지 않도록 임시 디렉토리 사용 (서비스 모듈 import 전에 설정)
+os.environ["ROE_CACHE_DIR"] = tempfile.mkdtemp(prefix="roe-bench-")
+
+from benchmarks import cold_start
+from benchmarks.synthetic_universe import SyntheticProvider, make_symbols
+from models.stock_models import AnalysisRequest
+from services.fundamentals_store import FundamentalsStore
+from services.investment_analyzer import InvestmentAnalyzer
+from services.price_ingest import to_price_series
+from services.roe_calculator import compute_roe
+from services.sharded_screener import screen_universe_sharded
+from services.stock_screener import StockScreener
+
+RESULTS_DIR = project_root / "benchmarks" / "results"
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def measure(fn, repeat: int) -> dict:
+    """fn 을 repeat 번 실행한 소요 시간 통계 (서비스 로그 출력은 버림)"""
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "max_s": max(timings),
+        "repeat": repeat,
+    }
+
+
+def run_size(size: int, repeat: int, seed: int) -> dict:
+    """종목 수 size 인 합성 유니버스에서 단계별 벤치마크"""
+    symbols = make_symbols(size)
+    provider = SyntheticProvider(seed=seed)
+    db_path = os.path.join(os.environ["ROE_CACHE_DIR"], f"fundamentals-{size}.db")
+    store = FundamentalsStore(db_path=db_path)
+    screener = StockScreener(provider=provider, store=store)
+    screener.sp500_symbols = symbols
+    analyzer = InvestmentAnalyzer(provider=provider, screener=screener)
+    # 패널 없이 종목별로 판정하는 스크리너 (panel_build 단계가 screener 에 패널을 설치하므로 따로 둠)
+    live_screener = StockScreener(provider=provider, store=store)
+
+    # 측정 대상이 아닌 입력 데이터 준비 (저장소 채우기 포함)
+    with contextlib.redirect_stdout(io.StringIO()):
+        frames = [provider.get_statements(symbol) for symbol in symbols]
+        roe_histories = [screener.get_stock_roe_history(symbol, 10) for symbol in symbols]
+        series = [to_price_series(symbol, provider.get_price_history(symbol)) for symbol in symbols]
+        correlations = [analyzer._analyze_correlation(r, s) for r, s in zip(roe_histories, series)]
+        returns = [analyzer._calculate_total_return(s) for s in series]
+
+    stages = {
+        "roe_kernel": lambda: [compute_roe(frame) for frame in frames],
+        "roe_history": lambda: [screener.get_stock_roe_history(symbol, 10) for symbol in symbols],
+        "correlation": lambda: [analyzer._analyze_correlation(r, s) for r, s in zip(roe_histories, series)],
+        "scoring": lambda: [
+            analyzer._calculate_investment_score(r, s, ret, c)
+            for r, s, ret, c in zip(roe_histories, series, returns, correlations)
+        ],
+        "chart_prep": lambda: [analyzer._prepare_chart_data(r, s) for r, s in zip(roe_histories, series)],
+        "screen": lambda: asyncio.run(live_screener.screen_high_roe_stocks(limit=size, symbols=symbols)),
+        "screen_top_k": lambda: asyncio.run(live_screener.screen_high_roe_stocks(limit=20, symbols=symbols)),
+        "panel_build": lambda: screener.build_roe_panel(symbols),
+        "panel_query": lambda: [screener.panel.query(min_roe, years) for min_roe in (10, 15, 20) for years in (3, 5, 10)],
+        "screen_top_k_panel": lambda: asyncio.run(screener.screen_high_roe_stocks(limit=20, symbols=symbols)),
+        "screen_sharded": lambda: screen_universe_sharded(symbols, provider=provider, db_path=db_path),
+        "endpoint": lambda: run_endpoint(screener, analyzer, symbols),
+    }
+
+    results = {}
+    for name, fn in stages.items():
+        stats = measure(fn, repeat)
+        stats["per_ticker_us"] = stats["median_s"] / size * 1e6
+        results[name] = stats
+        print(f"  {name:18} median {stats['median_s'] * 1000:10.2f} ms  ({stats['per_ticker_us']:8.1f} us/ticker)")
+    return results
+
+
+def run_endpoint(screener: StockScreener, analyzer: InvestmentAnalyzer, symbols: List[str]):
+    """/analyze 처리 함수를 캐시 없이 직접 호출 (기본 요청: 15% / 5년 / 20개)
+
+    /analyze 는 스크리너의 기본 유니버스 전체를 스크리닝하므로 합성 유니버스 전체(symbols)로 설정한다
+    (종목당 시간 per_ticker_us 의 분모와 같은 종목 수).
+    """
+    import backend.main as main
+    screener.sp500_symbols = symbols
+    main.screener, main.analyzer = screener, analyzer
+    response = asyncio.run(main.run_analysis(AnalysisRequest()))
+    if not response.success:
+        raise RuntimeError(response.message)
+
+
+def compare(baseline_path: str, current_path: str):
+    """두 결과 파일의 단계별 중앙값 비교 (비율 < 1 이면 빨라진 것)"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    current = json.loads(Path(current_path).read_text())
+    print(f"{baseline['revision']} -> {current['revision']}")
+    for size, stages in current["results"].items():
+        if size not in baseline["results"]:
+            continue
+        print(f"[{size} tickers]")
+        for name, stats in stages.items():
+            before = baseline["results"][size].get(name)
+            if before is None:
+                continue
+            ratio = stats["median_s"] / before["median_s"] if before["median_s"] else float("inf")
+            print(f"  {name:18} {before['median_s'] * 1000:10.2f} ms -> {stats['median_s'] * 1000:10.2f} ms  (x{ratio:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ROE 분석 시스템 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000],
+                        help="합성 유니버스 종목 수 (100 ~ 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/<revision>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="두 결과 파일 비교")
+    parser.add_argument("--skip-cold-start", action="store_true", help="콜드 스타트 예산 검사 생략")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    revision = git_revision()
+    report = {
+        "revision": revision,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": {},
+    }
+    for size in args.sizes:
+        if not 100 <= size <= 5000:
+            parser.error("--sizes 는 100 ~ 5000 범위여야 합니다.")
+        print(f"[{size} tickers]")
+        report["results"][str(size)] = run_size(size, args.repeat, args.seed)
+
+    violations = []
+    if not args.skip_cold_start:
+        print(f"[cold start] 예산: {cold_start.COLD_START_BUDGET}")
+        report["cold_start"] = cold_start.run(repeat=args.repeat, top=10)
+        violations = cold_start.check_budget(report["cold_start"])
+        for violation in violations:
+            print(f"  [OVER BUDGET] {violation}")
+        report["cold_start_budget"] = {"budget": cold_start.COLD_START_BUDGET, "violations": violations}
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"결과 저장: {output}")
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
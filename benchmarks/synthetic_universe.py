@@ -0,0 +1,68 @@
+"""
+벤치마크용 결정적(deterministic) 합성 유니버스 생성기
+
+같은 종목 수와 시드로 만들면 항상 같은 재무제표/주가/기업 정보를 돌려준다.
+회계연도와 주가 기간은 실행 연도 기준(직전 10년)으로 맞춘다.
+"""
+import zlib
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from services.data_provider import DataProvider
+from services.roe_calculator import frame_from_rows
+
+SECTORS = ["Technology", "Healthcare", "Financial Services", "Consumer Defensive",
+           "Communication Services", "Industrials", "Energy"]
+
+
+def make_symbols(n: int) -> List[str]:
+    """SYN0000, SYN0001, ... 형식의 종목 코드 n 개"""
+    return [f"SYN{i:04d}" for i in range(n)]
+
+
+class SyntheticProvider(DataProvider):
+    """종목 코드와 시드에서 결정적으로 데이터를 만들어내는 데이터 제공자"""
+
+    def __init__(self, seed: int = 42, years: int = 10):
+        self.seed = seed
+        self.years = years
+        self.last_year = pd.Timestamp.now().year - 1
+        self.dates = pd.bdate_range(f"{self.last_year - years + 1}-01-01", f"{self.last_year}-12-31", tz="UTC")
+
+    def _rng(self, symbol: str, stream: int) -> np.random.Generator:
+        return np.random.default_rng([self.seed, zlib.crc32(symbol.encode()), stream])
+
+    @lru_cache(maxsize=None)
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        rng = self._rng(symbol, 0)
+        n_years = self.years + 1
+        equity = rng.uniform(1e9, 1e11) * np.cumprod(1 + rng.normal(0.05, 0.05, n_years))
+        roe = rng.uniform(0, 40) + rng.normal(0, 5, n_years)
+        rows = [
+            {
+                "fiscal_year": self.last_year - n_years + 1 + i,
+                "net_income": float(equity[i] * roe[i] / 100),
+                "total_revenue": float(equity[i] * rng.uniform(0.5, 3)),
+                "stockholders_equity": float(equity[i]),
+            }
+            for i in range(n_years)
+        ]
+        return frame_from_rows(rows)
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        rng = self._rng(symbol, 1)
+        drift = rng.uniform(-0.0002, 0.0008)
+        returns = rng.normal(drift, 0.015, len(self.dates))
+        close = rng.uniform(10, 500) * np.exp(np.cumsum(returns))
+        return pd.Series(close, index=self.dates)
+
+    def get_info(self, symbol: str) -> dict:
+        rng = self._rng(symbol, 2)
+        return {
+            "longName": f"{symbol} Corporation",
+            "sector": SECTORS[int(rng.integers(len(SECTORS)))],
+            "marketCap": float(rng.uniform(1e9, 3e12)),
+        }
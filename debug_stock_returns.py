@@ -2,9 +2,13 @@
 """
 실제 주가수익률 계산 및 디버깅 스크립트
 """
-import yfinance as yf
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
 import pandas as pd
 from datetime import datetime
+from services.data_provider import YFinanceProvider
 
 def calculate_real_stock_returns():
     """실제 주가수익률 계산 및 디버깅"""
@@ -25,21 +29,18 @@ def calculate_real_stock_returns():
     
     results = {}
     
+    # yfinance 다중 종목 요청으로 한 번에 가져오기 (auto_adjust: 주식분할 조정된 가격)
+    closes = YFinanceProvider().download_prices(symbols, start=start_date, end=end_date)
+    
     for symbol in symbols:
         try:
             print(f"\n--- {symbol} 분석 중 ---")
             
-            # yfinance에서 데이터 가져오기
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(start=start_date, end=end_date)
-            
-            if data.empty:
+            adj_close = closes.get(symbol)
+            if adj_close is None:
                 print(f"❌ {symbol}: 데이터 없음")
                 continue
             
-            # Adjusted Close 사용 (주식분할 조정됨)
-            adj_close = data['Close']  # yfinance history()는 자동으로 조정된 가격 제공
-            
             # 첫 번째와 마지막 가격
             first_price = adj_close.iloc[0]
             last_price = adj_close.iloc[-1]
@@ -46,8 +46,23 @@ class AnalysisRequest(BaseModel):
     min_roe: float = Field(default=15.0, description="최소 ROE 기준 (%)")
     years: int = Field(default=5, description="ROE 지속 년수")
     limit: int = Field(default=20, description="분석할 기업 수")
+    time_budget: Optional[float] = Field(
+        default=None, gt=0, description="분석 전체 제한 시간 (초), 지나면 남은 종목 작업을 취소하고 완료된 결과만 partial 로 반환"
+    )
 
 class AnalysisResponse(BaseModel):
     success: bool
     message: str
-    data: List[StockAnalysisResult]
\ No newline at end of file
+    data: List[StockAnalysisResult]
+    partial: bool = Field(default=False, description="일부 종목의 분석이 실패/시간 초과되어 빠진 결과인지 여부")
+    failed_symbols: List[str] = []
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str = Field(description="pending / screening / analyzing / completed / failed")
+    request: AnalysisRequest
+    total: Optional[int] = Field(default=None, description="스크리닝으로 선정된 기업 수")
+    completed: int = Field(default=0, description="분석이 끝난 기업 수 (실패 포함)")
+    failed_symbols: List[str] = []
+    message: Optional[str] = None
+    results: List[StockAnalysisResult] = []
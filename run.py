@@ -3,17 +3,22 @@
 ROE 기반 장기투자 분석 시스템 실행 스크립트
 """
 
+import argparse
 import uvicorn
 import os
 import sys
 import webbrowser
 from pathlib import Path
 
-def main():
+def serve(universe: str = None):
     print("="*50)
     print("ROE 기반 장기투자 분석 시스템 시작")
     print("="*50)
     
+    # 서버가 스크리닝할 유니버스 (reload 로 띄우는 서버 프로세스에도 전달되도록 환경변수로 설정)
+    if universe:
+        os.environ["ROE_UNIVERSE"] = universe
+    
     # 프로젝트 루트 디렉토리를 Python 경로에 추가
     project_root = Path(__file__).parent
     sys.path.insert(0, str(project_root))
@@ -52,5 +57,97 @@ def main():
         print("requirements.txt의 모든 패키지가 설치되어 있는지 확인해주세요.")
         print("pip install -r requirements.txt")
 
+def sync(universe: str, chunk_size: int, skip_fundamentals: bool):
+    """주가/재무 데이터 증분 동기화 (야간 배치용)"""
+    project_root = Path(__file__).parent
+    sys.path.insert(0, str(project_root))
+    
+    from services.data_provider import get_default_provider
+    from services.fundamentals_store import FundamentalsStore
+    from services.http_session import get_http_session
+    from services.incremental_sync import IncrementalSync
+    from services.price_store import PriceStore
+    from services.universe import UniverseRegistry
+    
+    symbols = UniverseRegistry().load(universe)
+    syncer = IncrementalSync(get_default_provider(), FundamentalsStore(), PriceStore())
+    
+    print(f"증분 동기화 시작: {universe} ({len(symbols)}개 종목)")
+    price_stats = syncer.sync_prices(symbols, chunk_size=chunk_size)
+    print(f"주가: 전체 {price_stats['full']}개, 증분 {price_stats['delta']}개, "
+          f"수정 기준 변경으로 재다운로드 {price_stats['readjusted']}개, "
+          f"최신 {price_stats['up_to_date']}개 종목 / {price_stats['bars']}개 일봉 추가")
+    
+    if not skip_fundamentals:
+        fundamental_stats = syncer.sync_fundamentals(symbols)
+        print(f"재무: 조회 {fundamental_stats['fetched']}개, 건너뜀 {fundamental_stats['skipped']}개 종목 / "
+              f"{fundamental_stats['new_years']}개 회계연도 추가")
+    
+    http_stats = get_http_session().stats
+    print(f"HTTP: 요청 {http_stats['requests']}회, 재시도 {http_stats['retries']}회, "
+          f"스로틀(429) {http_stats['throttled']}회, 실패 {http_stats['failures']}회")
+
+def screen(universe: str, min_roe: float, years: int, limit: int, workers: int):
+    """유니버스 전체를 shard 로 나눠 프로세스 풀에서 병렬 스크리닝하고 사전 점수 상위 기업 출력"""
+    project_root = Path(__file__).parent
+    sys.path.insert(0, str(project_root))
+    
+    from services.sharded_screener import screen_universe_sharded
+    from services.universe import UniverseRegistry
+    
+    symbols = UniverseRegistry().load(universe)
+    stocks = screen_universe_sharded(symbols, min_roe=min_roe, years=years, limit=limit, workers=workers)
+    for rank, stock in enumerate(stocks, 1):
+        print(f"{rank:3d}. {stock.symbol:<8} {stock.company_name} ({stock.sector})")
+
+def snapshot(universe: str, max_workers: int):
+    """유니버스 전체를 스크리닝/분석해 서버 스냅샷 모드용 스냅샷 생성 (야간 배치용)"""
+    project_root = Path(__file__).parent
+    sys.path.insert(0, str(project_root))
+    
+    from services.investment_analyzer import InvestmentAnalyzer
+    from services.snapshot import SnapshotStore, build_snapshot
+    from services.universe import UniverseRegistry
+    
+    symbols = UniverseRegistry().load(universe)
+    store = SnapshotStore()
+    print(f"스냅샷 생성 시작: {universe} ({len(symbols)}개 종목)")
+    version = build_snapshot(InvestmentAnalyzer(), symbols, store, universe=universe, max_workers=max_workers)
+    manifest = store.load(version).manifest
+    print(f"스냅샷 {version}: 분석 {manifest['analyzed']}개, 실패 {len(manifest['failed_symbols'])}개 종목 "
+          f"({manifest['build_seconds']:.1f}초) -> {store.root / version}")
+
+def main():
+    parser = argparse.ArgumentParser(description="ROE 기반 장기투자 분석 시스템")
+    subparsers = parser.add_subparsers(dest="command")
+    serve_parser = subparsers.add_parser("serve", help="웹 서버 실행 (기본값)")
+    serve_parser.add_argument("--universe", help="스크리닝 유니버스 이름 (data/universes/, 기본값: sp500_sample)")
+    
+    sync_parser = subparsers.add_parser("sync", help="주가/재무 데이터 증분 동기화")
+    sync_parser.add_argument("--universe", default="sp500_sample", help="유니버스 이름 (data/universes/)")
+    sync_parser.add_argument("--chunk-size", type=int, default=100, help="다중 종목 요청당 종목 수")
+    sync_parser.add_argument("--skip-fundamentals", action="store_true", help="주가만 동기화")
+    
+    screen_parser = subparsers.add_parser("screen", help="유니버스 전체 병렬(shard) 스크리닝")
+    screen_parser.add_argument("--universe", default="sp500_sample", help="유니버스 이름 (data/universes/)")
+    screen_parser.add_argument("--min-roe", type=float, default=15.0, help="최소 ROE 기준 (%%)")
+    screen_parser.add_argument("--years", type=int, default=5, help="ROE 지속 년수")
+    screen_parser.add_argument("--limit", type=int, default=20, help="선정할 기업 수")
+    screen_parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    
+    snapshot_parser = subparsers.add_parser("snapshot", help="서버 스냅샷 모드용 사전 계산 스냅샷 생성")
+    snapshot_parser.add_argument("--universe", default="sp500_sample", help="유니버스 이름 (data/universes/)")
+    snapshot_parser.add_argument("--workers", type=int, default=8, help="동시에 분석할 종목 수")
+    
+    args = parser.parse_args()
+    if args.command == "sync":
+        sync(args.universe, args.chunk_size, args.skip_fundamentals)
+    elif args.command == "screen":
+        screen(args.universe, args.min_roe, args.years, args.limit, args.workers)
+    elif args.command == "snapshot":
+        snapshot(args.universe, args.workers)
+    else:
+        serve(getattr(args, "universe", None))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
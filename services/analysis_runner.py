@@ -0,0 +1,123 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from models.stock_models import StockAnalysisResult, StockInfo
+from services.metrics import REGISTRY, record_orphan
+
+if TYPE_CHECKING:
+    from services.investment_analyzer import InvestmentAnalyzer
+
+# 동시에 분석할 종목 수 / 종목당 분석 제한 시간 (초)
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_SYMBOL_TIMEOUT = 20.0
+
+SYMBOL_ANALYSES = REGISTRY.counter(
+    "roe_symbol_analyses_total", "종목별 분석 결과 (outcome=ok|failed|timeout|deadline)", ("outcome",))
+
+
+class DeadlineExceeded(Exception):
+    """요청 전체 제한 시간(deadline)이 지나 종목 분석을 시작하지 못했거나 중단함"""
+
+
+class AnalysisOutcome(NamedTuple):
+    """종목 분석 결과 모음 (results 는 입력 순서, failed 는 종목 -> 실패 사유)"""
+    results: List[StockAnalysisResult]
+    failed: Dict[str, str]
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.failed)
+
+
+def _release_when_done(task: asyncio.Future, semaphore: asyncio.Semaphore):
+    """스레드 작업이 실제로 끝났을 때 슬롯 반환 (시간 초과로 먼저 응답한 경우의 예외도 여기서 회수)"""
+    def done(finished: asyncio.Future):
+        semaphore.release()
+        if not finished.cancelled():
+            finished.exception()
+    task.add_done_callback(done)
+
+
+async def analyze_stock_bounded(stock: StockInfo, analyzer: "InvestmentAnalyzer", semaphore: asyncio.Semaphore,
+                                timeout: float, deadline: Optional[float] = None) -> Optional[StockAnalysisResult]:
+    """세마포어 슬롯을 얻어 별도 스레드에서 analyze_stock_sync 실행
+
+    timeout 초가 지나면 asyncio.TimeoutError, 슬롯을 기다리거나 실행하는 중에 deadline(loop.time() 기준)이
+    지나면 DeadlineExceeded. 실행 중인 스레드는 중단할 수 없으므로 시간 초과 후에도 슬롯은 스레드가 끝날 때
+    반환한다 (업스트림 동시 호출 수가 max_concurrency 를 넘지 않도록).
+    """
+    loop = asyncio.get_running_loop()
+    remaining = None if deadline is None else deadline - loop.time()
+    try:
+        await asyncio.wait_for(semaphore.acquire(), remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(stock.symbol) from None
+    if deadline is not None:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            semaphore.release()
+            raise DeadlineExceeded(stock.symbol)
+    # 분석은 내부에서 블로킹 호출을 하므로 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+    task = asyncio.ensure_future(asyncio.to_thread(analyzer.analyze_stock_sync, stock))
+    _release_when_done(task, semaphore)
+    limit = timeout if remaining is None else min(timeout, remaining)
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), limit)
+    except asyncio.TimeoutError:
+        if limit < timeout:
+            record_orphan(task, "analysis", "deadline")
+            raise DeadlineExceeded(stock.symbol) from None
+        record_orphan(task, "analysis", "timeout")
+        raise
+    except asyncio.CancelledError:
+        # 요청이 취소됨 (예: 클라이언트 연결 종료)
+        record_orphan(task, "analysis", "cancelled")
+        raise
+
+
+async def analyze_and_record(stock: StockInfo, analyzer: "InvestmentAnalyzer", semaphore: asyncio.Semaphore,
+                             timeout: float, deadline: Optional[float] = None
+                             ) -> Tuple[StockInfo, Optional[StockAnalysisResult], Optional[str]]:
+    """analyze_stock_bounded 실행 후 결과를 roe_symbol_analyses_total 에 기록
+
+    (종목, 분석 결과, 실패 사유) 반환. 실패 사유는 deadline / timeout / error / no_data 이고 성공하면 None.
+    요청 취소(asyncio.CancelledError)는 기록하지 않고 그대로 전파한다.
+    """
+    try:
+        result = await analyze_stock_bounded(stock, analyzer, semaphore, timeout, deadline)
+        reason = None if result is not None else "no_data"
+    except DeadlineExceeded:
+        result, reason = None, "deadline"
+    except asyncio.TimeoutError:
+        result, reason = None, "timeout"
+    except Exception as e:
+        print(f"[ERROR] {stock.symbol} 분석 오류 - {e}")
+        result, reason = None, "error"
+    if reason is None:
+        SYMBOL_ANALYSES.inc(outcome="ok")
+    else:
+        SYMBOL_ANALYSES.inc(outcome=reason if reason in ("timeout", "deadline") else "failed")
+    return stock, result, reason
+
+
+async def analyze_stocks_concurrently(stocks: List[StockInfo], analyzer: "InvestmentAnalyzer",
+                                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                      timeout: float = DEFAULT_SYMBOL_TIMEOUT,
+                                      deadline: Optional[float] = None) -> AnalysisOutcome:
+    """종목들을 최대 max_concurrency 개씩 동시에 분석
+
+    분석에 실패했거나(데이터 없음 포함) timeout 초 안에 끝나지 않은 종목, deadline 까지 끝나지 않은 종목은
+    failed 에 사유와 함께 기록하고, 나머지 종목의 결과만으로 응답할 수 있게 한다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    outcomes = await asyncio.gather(
+        *(analyze_and_record(stock, analyzer, semaphore, timeout, deadline) for stock in stocks)
+    )
+
+    results, failed = [], {}
+    for stock, result, reason in outcomes:
+        if reason is None:
+            results.append(result)
+        else:
+            failed[stock.symbol] = reason
+    return AnalysisOutcome(results, failed)
@@ -0,0 +1,57 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+import pandas as pd
+
+from services.data_provider import DEFAULT_CHUNK_SIZE, DataProvider
+from services.metrics import record_cache
+from services.single_flight import SingleFlight
+
+
+class RequestDataContext(DataProvider):
+    """요청 단위 데이터 컨텍스트
+
+    한 요청(스크리닝 + 분석) 동안 데이터 제공자 호출과 종목별 파생 데이터(ROE 히스토리,
+    기업 정보, 주가)를 종목별로 기억해 두어, 스크리너와 분석기가 같은 데이터를 다시
+    조회하지 않도록 한다. 요청이 끝나면 버린다 (요청 간 캐시는 로컬 저장소가 담당).
+    """
+
+    def __init__(self, provider: DataProvider):
+        self.provider = provider
+        self.hits = 0
+        self.misses = 0
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        # 같은 요청 안에서 동시에 같은 종목을 조회하는 경우도 한 번만 실행
+        self._flight = SingleFlight()
+
+    def memoize(self, key: Hashable, loader: Callable, *args) -> Any:
+        """key 에 대해 처음 한 번만 loader(*args) 를 실행하고 이후에는 기억된 값을 반환 (예외는 기억하지 않음)"""
+        with self._lock:
+            hit = key in self._values
+            if hit:
+                self.hits += 1
+                value = self._values[key]
+            else:
+                self.misses += 1
+        record_cache("request_context", hit)
+        if hit:
+            return value
+        value = self._flight.do(key, loader, *args)
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        return self.memoize(("statements", symbol), self.provider.get_statements, symbol)
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        key = ("price_history", symbol, tuple(sorted(history_kwargs.items())))
+        return self.memoize(key, lambda: self.provider.get_price_history(symbol, **history_kwargs))
+
+    def get_info(self, symbol: str) -> dict:
+        return self.memoize(("info", symbol), self.provider.get_info, symbol)
+
+    def download_prices(self, symbols: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        **history_kwargs) -> Dict[str, pd.Series]:
+        """다중 종목 다운로드는 원래 제공자의 일괄 요청을 그대로 사용"""
+        return self.provider.download_prices(symbols, chunk_size=chunk_size, **history_kwargs)
@@ -0,0 +1,219 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+import pandas as pd
+
+from services.metrics import IN_FLIGHT, PROVIDER_ERRORS, STAGE_SECONDS
+from services.roe_calculator import STATEMENT_COLUMNS, frame_from_rows, rows_from_frame, statement_frame
+
+DEFAULT_CHUNK_SIZE = 100
+
+
+def _chunks(symbols: List[str], size: int):
+    for i in range(0, len(symbols), size):
+        yield symbols[i:i + size]
+
+
+class DataProvider(ABC):
+    """재무제표 / 주가 / 기업 정보 데이터 제공자 인터페이스
+
+    - get_statements: 회계연도 인덱스의 net_income / total_revenue / stockholders_equity DataFrame
+    - get_price_history: 날짜 인덱스의 종가 Series (오름차순)
+    - get_info: yfinance info 형식의 dict (longName, sector, marketCap)
+    """
+
+    @abstractmethod
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        ...
+
+    @abstractmethod
+    def get_info(self, symbol: str) -> dict:
+        ...
+
+    def download_prices(self, symbols: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        **history_kwargs) -> Dict[str, pd.Series]:
+        """여러 종목의 종가 조회 (기본 구현은 종목별 조회, 데이터가 없는 종목은 제외)"""
+        closes = {}
+        for symbol in dict.fromkeys(symbols):
+            try:
+                close = self.get_price_history(symbol, **history_kwargs)
+            except Exception as e:
+                print(f"Error getting price history for {symbol}: {e}")
+                continue
+            if not close.empty:
+                closes[symbol] = close
+        return closes
+
+
+class YFinanceProvider(DataProvider):
+    """Yahoo Finance (yfinance) 데이터 제공자
+
+    모든 요청은 프로세스 공용 HTTP 세션(연결 재사용, 속도 제한, 429/5xx 재시도)을 사용한다.
+    yfinance / curl_cffi 는 import 비용이 커서 처음 요청할 때 로드한다.
+    """
+
+    def _ticker(self, symbol: str):
+        import yfinance as yf
+        from services.http_session import get_http_session
+        return yf.Ticker(symbol, session=get_http_session())
+
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        ticker = self._ticker(symbol)
+        return statement_frame(ticker.financials, ticker.balance_sheet)
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        hist = self._ticker(symbol).history(**history_kwargs)
+        if hist.empty:
+            return pd.Series(dtype=float)
+        return hist["Close"].dropna().sort_index()
+
+    def get_info(self, symbol: str) -> dict:
+        return self._ticker(symbol).info
+
+    def download_prices(self, symbols: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        **history_kwargs) -> Dict[str, pd.Series]:
+        """다중 종목 요청으로 chunk_size 개 종목씩 yf.download 한 번에 다운로드"""
+        import yfinance as yf
+        from services.http_session import get_http_session
+        symbols = list(dict.fromkeys(symbols))
+        closes = {}
+
+        for chunk in _chunks(symbols, chunk_size):
+            try:
+                data = yf.download(
+                    chunk,
+                    group_by="ticker",
+                    auto_adjust=True,
+                    threads=True,
+                    progress=False,
+                    session=get_http_session(),
+                    **history_kwargs
+                )
+            except Exception as e:
+                print(f"Error downloading prices for {len(chunk)} symbols: {e}")
+                continue
+
+            if data is None or data.empty:
+                continue
+
+            for symbol in chunk:
+                try:
+                    if isinstance(data.columns, pd.MultiIndex):
+                        if symbol not in data.columns.get_level_values(0):
+                            continue
+                        close = data[symbol]["Close"]
+                    else:
+                        close = data["Close"]
+                except KeyError:
+                    continue
+
+                close = close.dropna()
+                if not close.empty:
+                    closes[symbol] = close.sort_index()
+
+        return closes
+
+
+class FixtureProvider(DataProvider):
+    """디스크에 기록된 데이터를 재생하는 오프라인 데이터 제공자 (벤치마크/부하 테스트용)
+
+    root/{symbol}/statements.csv, prices.csv, info.json 형식이며 record() 로 다른 제공자의
+    응답을 기록할 수 있다. 기록이 없는 종목은 빈 데이터를 반환한다.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        path = self.root / symbol / "statements.csv"
+        if not path.exists():
+            return frame_from_rows([])
+        return frame_from_rows(pd.read_csv(path).to_dict("records"))
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        path = self.root / symbol / "prices.csv"
+        if not path.exists():
+            return pd.Series(dtype=float)
+        recorded = pd.read_csv(path)
+        prices = pd.Series(recorded["close"].to_numpy(dtype=float),
+                           index=pd.DatetimeIndex(pd.to_datetime(recorded["date"], utc=True)))
+
+        # period / start / end 인자를 기록된 데이터에 적용
+        if history_kwargs.get("start") is not None:
+            prices = prices[prices.index >= pd.Timestamp(history_kwargs["start"], tz=prices.index.tz)]
+        elif history_kwargs.get("period", "max") != "max":
+            years = int(str(history_kwargs["period"]).rstrip("y"))
+            prices = prices[prices.index >= prices.index[-1] - pd.DateOffset(years=years)] if len(prices) else prices
+        if history_kwargs.get("end") is not None:
+            prices = prices[prices.index < pd.Timestamp(history_kwargs["end"], tz=prices.index.tz)]
+        return prices.sort_index()
+
+    def get_info(self, symbol: str) -> dict:
+        path = self.root / symbol / "info.json"
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def record(self, symbols: Iterable[str], source: DataProvider, period: str = "10y"):
+        """source 제공자의 응답을 픽스처 파일로 기록"""
+        for symbol in symbols:
+            symbol_dir = self.root / symbol
+            symbol_dir.mkdir(parents=True, exist_ok=True)
+
+            statements = pd.DataFrame(rows_from_frame(source.get_statements(symbol)),
+                                      columns=["fiscal_year"] + STATEMENT_COLUMNS)
+            statements.to_csv(symbol_dir / "statements.csv", index=False)
+
+            prices = source.get_price_history(symbol, period=period)
+            prices.rename("close").rename_axis("date").to_frame().to_csv(symbol_dir / "prices.csv")
+
+            info = source.get_info(symbol)
+            keep = {key: info.get(key) for key in ("longName", "sector", "marketCap") if key in info}
+            (symbol_dir / "info.json").write_text(json.dumps(keep, ensure_ascii=False))
+
+
+class InstrumentedProvider(DataProvider):
+    """데이터 제공자 호출의 소요 시간, 오류, 진행 중인 호출 수를 기록하는 래퍼"""
+
+    def __init__(self, provider: DataProvider):
+        self.provider = provider
+
+    def _call(self, dataset: str, fn: Callable, *args, **kwargs):
+        with IN_FLIGHT.track_in_progress(kind="provider_calls"), STAGE_SECONDS.time(stage=f"provider_{dataset}"):
+            try:
+                result = fn(*args, **kwargs)
+            except Exception:
+                PROVIDER_ERRORS.inc(dataset=dataset, reason="exception")
+                raise
+        if result is None or (hasattr(result, "empty") and result.empty) or (isinstance(result, dict) and not result):
+            PROVIDER_ERRORS.inc(dataset=dataset, reason="empty")
+        return result
+
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        return self._call("statements", self.provider.get_statements, symbol)
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        return self._call("prices", self.provider.get_price_history, symbol, **history_kwargs)
+
+    def get_info(self, symbol: str) -> dict:
+        return self._call("info", self.provider.get_info, symbol)
+
+    def download_prices(self, symbols: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        **history_kwargs) -> Dict[str, pd.Series]:
+        return self._call("download_prices", self.provider.download_prices, symbols,
+                          chunk_size=chunk_size, **history_kwargs)
+
+
+def get_default_provider() -> DataProvider:
+    """환경변수 ROE_FIXTURE_DIR 이 설정되어 있으면 픽스처 제공자, 아니면 yfinance 제공자"""
+    fixture_dir = os.environ.get("ROE_FIXTURE_DIR")
+    if fixture_dir:
+        return FixtureProvider(fixture_dir)
+    return YFinanceProvider()
@@ -0,0 +1,206 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 기본 저장 위치: 프로젝트 루트의 cache/ 디렉토리 (ROE_CACHE_DIR 로 변경 가능)
+DEFAULT_CACHE_DIR = Path(os.environ.get("ROE_CACHE_DIR", Path(__file__).parent.parent / "cache"))
+
+DAY = 24 * 60 * 60
+
+# 테이블별 TTL (초) - 연간 재무제표는 1년에 한 번 바뀌므로 길게, 기업 정보는 짧게
+DEFAULT_TTLS = {
+    "statements": 30 * DAY,
+    "stock_info": 1 * DAY,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    symbol TEXT NOT NULL,
+    fiscal_year INTEGER NOT NULL,
+    net_income REAL,
+    total_revenue REAL,
+    stockholders_equity REAL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (symbol, fiscal_year)
+);
+CREATE TABLE IF NOT EXISTS stock_info (
+    symbol TEXT PRIMARY KEY,
+    company_name TEXT,
+    sector TEXT,
+    market_cap REAL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fetch_log (
+    symbol TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (symbol, table_name)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    symbol TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    high_water INTEGER,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (symbol, dataset)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+class FundamentalsStore:
+    """종목/회계연도 단위 재무 데이터 로컬 저장소 (SQLite)
+
+    fetch_log 에 테이블별 마지막 조회 시각을 기록하여, TTL 이내에 저장된 데이터는 다시 데이터 제공자에 요청하지 않는다.
+    빈 결과도 저장하면(put_statements(symbol, [])) TTL 동안 재요청하지 않지만, 스크리너는 빈 재무제표를
+    일시적인 조회 실패로 보고 저장하지 않으므로 그런 종목은 다음 요청에서 다시 조회된다.
+    데이터 버전(version)은 이미 저장된 종목의 값이 실제로 바뀔 때만 갱신된다 (처음 저장하는 종목, TTL 만료 후
+    같은 값을 다시 받은 경우, touch 는 버전을 바꾸지 않음).
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttls: Optional[Dict[str, float]] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_DIR / "fundamentals.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def is_fresh(self, symbol: str, table: str) -> bool:
+        """해당 종목/테이블의 마지막 조회가 TTL 이내인지 여부"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM fetch_log WHERE symbol = ? AND table_name = ?",
+                (symbol, table)
+            ).fetchone()
+        if row is None:
+            return False
+        return (time.time() - row["fetched_at"]) < self.ttls[table]
+
+    @property
+    def version(self) -> float:
+        """데이터 버전: 저장된 값이 마지막으로 바뀐 시각 (다른 프로세스의 갱신도 반영되도록 DB 에 기록)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return row["value"] if row else 0.0
+
+    def get_statements(self, symbol: str) -> Optional[List[dict]]:
+        """저장된 연도별 재무 데이터 반환 (없거나 TTL 만료 시 None)"""
+        if not self.is_fresh(symbol, "statements"):
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fiscal_year, net_income, total_revenue, stockholders_equity "
+                "FROM statements WHERE symbol = ? ORDER BY fiscal_year",
+                (symbol,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def put_statements(self, symbol: str, rows: List[dict]):
+        """연도별 재무 데이터 저장 (같은 회계연도는 덮어씀)"""
+        now = time.time()
+        values = {
+            row["fiscal_year"]: (row.get("net_income"), row.get("total_revenue"), row.get("stockholders_equity"))
+            for row in rows
+        }
+        with self._lock:
+            stored = {
+                row["fiscal_year"]: (row["net_income"], row["total_revenue"], row["stockholders_equity"])
+                for row in self._conn.execute(
+                    "SELECT fiscal_year, net_income, total_revenue, stockholders_equity "
+                    "FROM statements WHERE symbol = ?",
+                    (symbol,)
+                )
+            }
+            if stored and any(stored.get(year) != value for year, value in values.items()):
+                self._mark_changed(now)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO statements "
+                "(symbol, fiscal_year, net_income, total_revenue, stockholders_equity, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (symbol, year, *value, now)
+                    for year, value in values.items()
+                ]
+            )
+            self._mark_fetched(symbol, "statements", now)
+            self._conn.commit()
+
+    def get_stock_info(self, symbol: str) -> Optional[dict]:
+        """저장된 기업 기본 정보 반환 (없거나 TTL 만료 시 None)"""
+        if not self.is_fresh(symbol, "stock_info"):
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT symbol, company_name, sector, market_cap FROM stock_info WHERE symbol = ?",
+                (symbol,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def put_stock_info(self, symbol: str, company_name: str, sector: Optional[str], market_cap: Optional[float]):
+        """기업 기본 정보 저장"""
+        now = time.time()
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT company_name, sector, market_cap FROM stock_info WHERE symbol = ?", (symbol,)
+            ).fetchone()
+            if stored is not None and tuple(stored) != (company_name, sector, market_cap):
+                self._mark_changed(now)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stock_info (symbol, company_name, sector, market_cap, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (symbol, company_name, sector, market_cap, now)
+            )
+            self._mark_fetched(symbol, "stock_info", now)
+            self._conn.commit()
+
+    def stored_years(self, symbol: str) -> List[int]:
+        """TTL 과 무관하게 저장되어 있는 회계연도 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fiscal_year FROM statements WHERE symbol = ? ORDER BY fiscal_year", (symbol,)
+            ).fetchall()
+        return [row["fiscal_year"] for row in rows]
+
+    def touch(self, symbol: str, table: str):
+        """데이터를 다시 받지 않고 최신 상태임을 기록 (TTL 갱신)"""
+        with self._lock:
+            self._mark_fetched(symbol, table, time.time())
+            self._conn.commit()
+
+    def get_high_water(self, symbol: str, dataset: str) -> Optional[dict]:
+        """증분 동기화 기준점 (dataset 별 마지막으로 저장된 값과 동기화 시각)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water, synced_at FROM sync_state WHERE symbol = ? AND dataset = ?",
+                (symbol, dataset)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def set_high_water(self, symbol: str, dataset: str, high_water: Optional[int]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (symbol, dataset, high_water, synced_at) VALUES (?, ?, ?, ?)",
+                (symbol, dataset, high_water, time.time())
+            )
+            self._conn.commit()
+
+    def _mark_fetched(self, symbol: str, table: str, fetched_at: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO fetch_log (symbol, table_name, fetched_at) VALUES (?, ?, ?)",
+            (symbol, table, fetched_at)
+        )
+
+    def _mark_changed(self, changed_at: float):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('data_version', ?)", (changed_at,)
+        )
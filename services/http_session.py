@@ -0,0 +1,150 @@
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+# yfinance 는 curl_cffi 세션(브라우저 TLS 지문)을 권장, 없으면 requests 세션 사용
+try:
+    from curl_cffi import requests as _http
+    _SESSION_KWARGS = {"impersonate": "chrome"}
+except ImportError:
+    import requests as _http
+    _SESSION_KWARGS = {}
+
+# 전체 프로세스 공통 요청 속도 제한 (초당 요청 수, 순간 최대 요청 수, 워커 프로세스는 set_rate_share 로 나눠 씀)
+DEFAULT_RATE = 4.0
+DEFAULT_BURST = 8
+
+# 재시도 대상 응답 코드와 지수 백오프 설정
+RETRY_STATUS = {429, 500, 502, 503, 504}
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+# 호출자가 제한 시간을 주지 않은 요청의 기본 제한 시간 (초, 응답이 없는 종목 하나가 분석 전체를 붙잡지 않도록)
+DEFAULT_TIMEOUT = 15.0
+
+
+class TokenBucket:
+    """토큰 버킷 요청 속도 제한기 (스레드 안전)"""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기하고 대기한 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class PooledSession(_http.Session):
+    """모든 데이터 제공자 요청이 공유하는 HTTP 세션
+
+    - 연결 재사용(connection pool)
+    - 프로세스 전체 토큰 버킷 속도 제한
+    - 429/5xx 응답과 연결 오류에 대해 지터를 포함한 지수 백오프 재시도 (Retry-After 우선)
+    - 요청/재시도/스로틀 횟수 통계
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = BACKOFF_BASE,
+                 backoff_cap: float = BACKOFF_CAP, **kwargs):
+        super().__init__(**{**_SESSION_KWARGS, **kwargs})
+        self.limiter = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._stats = {"requests": 0, "retries": 0, "throttled": 0, "server_errors": 0,
+                       "connection_errors": 0, "failures": 0, "rate_limit_wait_s": 0.0}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """요청 통계 스냅샷"""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, name: str, amount: float = 1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """재시도 대기 시간: Retry-After 헤더가 있으면 그 값, 없으면 full jitter 지수 백오프"""
+        if retry_after:
+            try:
+                return min(self.backoff_cap, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def request(self, method, url, *args, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        for attempt in range(self.max_retries + 1):
+            self._count("rate_limit_wait_s", self.limiter.acquire())
+            self._count("requests")
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except Exception as e:
+                self._count("connection_errors")
+                if attempt == self.max_retries:
+                    self._count("failures")
+                    raise
+                delay = self._backoff(attempt)
+                print(f"[HTTP] {method} {url} 연결 오류 ({e}) - {delay:.1f}초 후 재시도")
+            else:
+                if response.status_code not in RETRY_STATUS:
+                    return response
+                self._count("throttled" if response.status_code == 429 else "server_errors")
+                if attempt == self.max_retries:
+                    self._count("failures")
+                    return response
+                delay = self._backoff(attempt, response.headers.get("Retry-After"))
+                print(f"[HTTP] {method} {url} 응답 {response.status_code} - {delay:.1f}초 후 재시도")
+            self._count("retries")
+            time.sleep(delay)
+
+
+_session: Optional[PooledSession] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+# 전체 속도 제한을 나눠 쓰는 프로세스 수 (토큰 버킷은 프로세스마다 따로 있으므로 워커 프로세스는 몫만 사용)
+_rate_share = 1
+
+
+def set_rate_share(processes: int):
+    """이 프로세스가 전체 속도 제한의 1/processes 만 쓰도록 설정 (워커 프로세스 초기화 시 호출)
+
+    프로세스 간에 토큰 버킷을 공유하면 요청마다 프로세스 간 잠금이 필요하므로, 대신 속도와 순간 최대 요청 수를
+    워커 수로 똑같이 나눈다. 먼저 끝난 워커의 몫은 다른 워커가 쓰지 못하므로 합계는 항상 전체 제한 이하이다.
+    """
+    global _rate_share, _session
+    with _session_lock:
+        _rate_share = max(1, processes)
+        _session = None
+
+
+def get_http_session() -> PooledSession:
+    """프로세스 공용 HTTP 세션 (처음 호출 시 생성, fork 된 워커 프로세스는 새로 생성)"""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = PooledSession(rate=DEFAULT_RATE / _rate_share,
+                                     burst=max(1, DEFAULT_BURST // _rate_share))
+            _session_pid = os.getpid()
+        return _session
@@ -0,0 +1,133 @@
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from services.data_provider import DEFAULT_CHUNK_SIZE, DataProvider
+from services.fundamentals_store import DAY, FundamentalsStore
+from services.price_ingest import period_for, to_price_series
+from services.price_store import PriceSeries, PriceStore
+from services.roe_calculator import rows_from_frame
+
+# 겹치는 거래일의 종가 비교 허용 오차 (상대값, 제공자의 반올림 차이는 무시하고 배당/분할 수정은 감지)
+ADJUSTMENT_TOLERANCE = 1e-4
+
+# 최신 회계연도가 아직 없는 종목의 재무제표를 다시 확인하는 주기
+FUNDAMENTALS_RECHECK = 7 * DAY
+
+
+class IncrementalSync:
+    """주가/재무 데이터 증분 동기화
+
+    - 주가: 종목별 마지막 저장일부터의 데이터만 받아 덧붙인다 (시작일이 같은 종목끼리 다중 종목 요청).
+      겹치는 마지막 저장일의 수정 종가가 달라졌으면(분할/배당) 그 종목은 전체 기간을 다시 받는다
+    - 재무: 아직 저장되지 않은 회계연도만 저장하고, 최신 연도가 이미 있으면 제공자를 호출하지 않는다
+    종목별 기준점(high-water mark)은 FundamentalsStore 의 sync_state 테이블에 기록한다.
+    """
+
+    def __init__(self, provider: DataProvider, fundamentals: FundamentalsStore, prices: PriceStore,
+                 years: int = 10, fundamentals_recheck: float = FUNDAMENTALS_RECHECK):
+        self.provider = provider
+        self.fundamentals = fundamentals
+        self.prices = prices
+        self.years = years
+        self.fundamentals_recheck = fundamentals_recheck
+
+    def sync_prices(self, symbols: List[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, int]:
+        """주가 증분 동기화 (저장된 데이터가 없거나 수정 기준이 바뀐 종목만 전체 기간 다운로드)"""
+        today = pd.Timestamp.now().normalize()
+        full, by_start = [], defaultdict(list)
+        stored: Dict[str, PriceSeries] = {}
+        up_to_date = 0
+
+        for symbol in symbols:
+            existing = self.prices.load(symbol, fresh_only=False)
+            if existing is None or not len(existing) or self.prices.covered_years(symbol) < self.years:
+                full.append(symbol)
+                continue
+            last = pd.Timestamp(int(existing.dates[-1]), unit="s").normalize()
+            if last + pd.Timedelta(days=1) > today:
+                self.prices.touch(symbol)
+                up_to_date += 1
+                continue
+            # 마지막 저장일부터 받아 겹치는 거래일 하나로 수정 기준이 바뀌었는지 확인
+            stored[symbol] = existing
+            by_start[last.strftime("%Y-%m-%d")].append(symbol)
+
+        bars = 0
+        readjusted = []
+        for start, group in by_start.items():
+            closes = self.provider.download_prices(group, chunk_size=chunk_size, start=start)
+            for symbol, close in closes.items():
+                series = to_price_series(symbol, close)
+                if not self._same_adjustment(stored[symbol], series):
+                    readjusted.append(symbol)
+                    continue
+                bars += self.prices.append(series)
+                self.fundamentals.set_high_water(symbol, "prices", int(series.dates[-1]))
+
+        if full or readjusted:
+            closes = self.provider.download_prices(full + readjusted, chunk_size=chunk_size,
+                                                   period=period_for(self.years))
+            for symbol, close in closes.items():
+                series = to_price_series(symbol, close)
+                self.prices.save(series, years=self.years)
+                self.fundamentals.set_high_water(symbol, "prices", int(series.dates[-1]))
+                bars += len(series)
+
+        return {
+            "symbols": len(symbols),
+            "full": len(full),
+            "delta": sum(len(group) for group in by_start.values()) - len(readjusted),
+            "readjusted": len(readjusted),
+            "up_to_date": up_to_date,
+            "bars": bars,
+        }
+
+    @staticmethod
+    def _same_adjustment(existing: PriceSeries, delta: PriceSeries) -> bool:
+        """새로 받은 데이터의 겹치는 거래일 종가가 저장된 종가와 같은지 (수정 종가 기준이 그대로인지)
+
+        분할/배당이 생기면 수정 종가는 과거 전체가 다시 계산되므로, 겹치는 날의 종가가 달라진 종목은
+        덧붙이지 않고 전체 기간을 다시 받아야 한다. 겹치는 날이 없으면 확인할 수 없으므로 다시 받는다.
+        """
+        overlap = np.flatnonzero(delta.dates == existing.dates[-1])
+        if not len(overlap):
+            return False
+        return bool(np.isclose(delta.close[overlap[0]], existing.close[-1], rtol=ADJUSTMENT_TOLERANCE, atol=0))
+
+    def sync_fundamentals(self, symbols: List[str]) -> Dict[str, int]:
+        """재무 데이터 증분 동기화 (새 회계연도만 저장)"""
+        current_year = pd.Timestamp.now().year
+        fetched = skipped = new_rows = 0
+
+        for symbol in symbols:
+            stored = self.fundamentals.stored_years(symbol)
+            state = self.fundamentals.get_high_water(symbol, "statements")
+            recently_checked = state is not None and time.time() - state["synced_at"] < self.fundamentals_recheck
+            # 연간 재무제표는 회계연도가 끝난 뒤 공시되므로 직전 회계연도까지 저장되어 있으면 최신
+            if stored and (stored[-1] >= current_year - 1 or recently_checked):
+                self.fundamentals.touch(symbol, "statements")
+                skipped += 1
+                continue
+
+            try:
+                frame = self.provider.get_statements(symbol)
+            except Exception as e:
+                print(f"Error syncing statements for {symbol}: {e}")
+                continue
+            fetched += 1
+            if frame.empty:  # 조회 실패는 기준점을 남기지 않고 다음 동기화에서 재시도
+                continue
+
+            new = frame[~frame.index.isin(stored)]
+            if new.empty:
+                self.fundamentals.touch(symbol, "statements")
+            else:
+                self.fundamentals.put_statements(symbol, rows_from_frame(new))
+                new_rows += len(new)
+            self.fundamentals.set_high_water(symbol, "statements", int(frame.index.max()))
+
+        return {"symbols": len(symbols), "fetched": fetched, "skipped": skipped, "new_years": new_rows}
@@ -1,21 +1,61 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from scipy import stats
+import asyncio
+import copy
+import time
 from typing import Optional, List
 from datetime import datetime, timedelta
 from models.stock_models import (
-    StockInfo, StockAnalysisResult, ROEData, StockPrice,
+    StockInfo, StockAnalysisResult, ROEData,
     CorrelationAnalysis, InvestmentScore
 )
+from services.fundamentals_store import DAY
+from services.price_store import (
+    PriceSeries, PriceStore, SECONDS_PER_YEAR, empty_series, epoch_months, epoch_years, to_stock_prices
+)
+from services.data_context import RequestDataContext
+from services.metrics import IN_FLIGHT, STAGE_SECONDS, record_cache
+from services.data_provider import DEFAULT_CHUNK_SIZE, DataProvider, get_default_provider
+from services.price_ingest import ingest_prices, period_for, to_price_series
+from services import scoring
 from services.stock_screener import StockScreener
 
+# 주가 저장소에 받아 두는 최소 기간 (년): 짧은 기간 요청이 먼저 와도 분석에 필요한 10년을 저장
+STORED_PRICE_YEARS = 10
+
 class InvestmentAnalyzer:
-    def __init__(self):
-        self.screener = StockScreener()
+    def __init__(self, prices: Optional[PriceStore] = None, provider: Optional[DataProvider] = None,
+                 screener: Optional[StockScreener] = None):
+        # 데이터 제공자 (기본값: yfinance, ROE_FIXTURE_DIR 설정 시 픽스처)
+        self.provider = provider or get_default_provider()
+        self.screener = screener or StockScreener(provider=self.provider)
+        # 주가 로컬 컬럼 저장소: 일간 주가를 모델 객체가 아닌 NumPy 배열로 보관
+        self.prices = prices or PriceStore()
+    
+    def with_context(self, context: RequestDataContext,
+                     screener: Optional[StockScreener] = None) -> "InvestmentAnalyzer":
+        """요청 단위 데이터 컨텍스트를 사용하는 분석기 (스크리너도 같은 컨텍스트 사용)"""
+        analyzer = copy.copy(self)
+        analyzer.provider = context
+        analyzer.screener = screener or self.screener.with_context(context)
+        return analyzer
+    
+    async def analyze_stock(self, stock_info: StockInfo,
+                            include_prices: bool = False) -> Optional[StockAnalysisResult]:
+        """개별 주식에 대한 종합 분석
+
+        include_prices 가 True 일 때만 일간 주가를 StockPrice 모델 리스트로 변환하여 포함한다.
+        데이터 조회와 계산은 블로킹 호출이므로 이벤트 루프를 막지 않도록 작업 스레드에서 실행한다.
+        """
+        return await asyncio.to_thread(self.analyze_stock_sync, stock_info, include_prices)
+    
+    def analyze_stock_sync(self, stock_info: StockInfo,
+                           include_prices: bool = False) -> Optional[StockAnalysisResult]:
+        """analyze_stock 의 동기 버전 (블로킹 호출을 하므로 작업 스레드에서 asyncio.to_thread 로 실행)"""
+        with IN_FLIGHT.track_in_progress(kind="analyses"), STAGE_SECONDS.time(stage="analyze_stock"):
+            return self._analyze_stock(stock_info, include_prices)
     
-    async def analyze_stock(self, stock_info: StockInfo) -> Optional[StockAnalysisResult]:
-        """개별 주식에 대한 종합 분석"""
+    def _analyze_stock(self, stock_info: StockInfo, include_prices: bool) -> Optional[StockAnalysisResult]:
         try:
             # 10년간 ROE 데이터 수집
             roe_history = self.screener.get_stock_roe_history(stock_info.symbol, 10)
@@ -23,32 +63,37 @@ class InvestmentAnalyzer:
                 return None
             
             # 10년간 주가 데이터 수집
-            price_history = self._get_price_history(stock_info.symbol, 10)
-            if not price_history:
+            with STAGE_SECONDS.time(stage="price_history"):
+                price_history = self._get_price_history(stock_info.symbol, 10)
+            if not len(price_history):
                 return None
             
             # 10년 수익률 계산
-            ten_year_return = self._calculate_total_return(price_history)
+            with STAGE_SECONDS.time(stage="total_return"):
+                ten_year_return = self._calculate_total_return(price_history)
             
             # 5년 평균 ROE 계산
             recent_roe = [r for r in roe_history if r.year >= (datetime.now().year - 5)]
             five_year_roe_avg = np.mean([r.roe for r in recent_roe]) if recent_roe else 0
             
             # ROE와 주가 수익률 상관관계 분석
-            correlation_analysis = self._analyze_correlation(roe_history, price_history)
+            with STAGE_SECONDS.time(stage="correlation"):
+                correlation_analysis = self._analyze_correlation(roe_history, price_history)
             
             # 투자 점수 계산
-            investment_score = self._calculate_investment_score(
-                roe_history, price_history, ten_year_return, correlation_analysis
-            )
+            with STAGE_SECONDS.time(stage="scoring"):
+                investment_score = self._calculate_investment_score(
+                    roe_history, price_history, ten_year_return, correlation_analysis
+                )
             
             # 차트 데이터 준비
-            chart_data = self._prepare_chart_data(roe_history, price_history)
+            with STAGE_SECONDS.time(stage="chart_prep"):
+                chart_data = self._prepare_chart_data(roe_history, price_history)
             
             return StockAnalysisResult(
                 stock_info=stock_info,
                 roe_history=roe_history,
-                price_history=price_history,
+                price_history=to_stock_prices(price_history) if include_prices else [],
                 ten_year_return=ten_year_return,
                 five_year_roe_avg=five_year_roe_avg,
                 correlation_analysis=correlation_analysis,
@@ -60,81 +105,89 @@ class InvestmentAnalyzer:
             print(f"Error analyzing {stock_info.symbol}: {e}")
             return None
     
-    def _get_price_history(self, symbol: str, years: int = 10) -> List[StockPrice]:
-        """주가 히스토리 가져오기"""
+    def _get_price_history(self, symbol: str, years: int = 10) -> PriceSeries:
+        """주가 히스토리 가져오기 (로컬 컬럼 저장소 우선)"""
+        key = ("price_history", symbol, years)
+        return self.screener._memoize(key, self.screener.flight.do, key, self._load_price_history, symbol, years)
+    
+    def _load_price_history(self, symbol: str, years: int) -> PriceSeries:
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # period만 사용 (start, end와 함께 사용 불가)
-            period_map = {1: "1y", 2: "2y", 3: "3y", 5: "5y", 10: "10y", 15: "15y", 20: "20y"}
-            period = period_map.get(years, "10y")
-            
-            hist = ticker.history(period=period)
-            
-            price_history = []
-            for date, row in hist.iterrows():
-                price_history.append(StockPrice(
-                    date=date.to_pydatetime(),
-                    close_price=float(row['Close']),
-                    adjusted_close=float(row['Close'])
-                ))
-            
-            return sorted(price_history, key=lambda x: x.date)
+            series = self.prices.load(symbol)
+            # 저장된 기간이 요청 기간보다 짧으면 (예: 1년 조회 후 10년 분석) 다시 받음
+            if series is not None and self.prices.covered_years(symbol) < years:
+                series = None
+            record_cache("price_store", series is not None)
+            if series is None:
+                period_years = max(years, STORED_PRICE_YEARS)
+                series = self._fetch_price_history(symbol, period_years)
+                if len(series):
+                    self.prices.save(series, years=period_years)
+            
+            # 요청 기간만 사용 (저장소에는 더 긴 기간이 있을 수 있음)
+            return series.since(int(time.time() - years * SECONDS_PER_YEAR))
             
         except Exception as e:
             print(f"Error getting price history for {symbol}: {e}")
+            return empty_series(symbol)
+    
+    def _fetch_price_history(self, symbol: str, years: int = 10) -> PriceSeries:
+        """데이터 제공자에서 주가 히스토리를 받아 컬럼 배열로 변환"""
+        # period만 사용 (start, end와 함께 사용 불가)
+        close = self.provider.get_price_history(symbol, period=period_for(years))
+        if close.empty:
+            return empty_series(symbol)
+        
+        return to_price_series(symbol, close)
+    
+    def prefetch_prices(self, symbols: List[str], years: int = 10,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[str]:
+        """저장소에 없는 종목들의 주가를 다중 종목 요청으로 미리 받아 저장 (저장된 종목 반환)"""
+        missing = [symbol for symbol in symbols
+                   if self.prices.load(symbol) is None or self.prices.covered_years(symbol) < years]
+        if not missing:
             return []
+        return ingest_prices(missing, self.prices, self.provider,
+                             years=max(years, STORED_PRICE_YEARS), chunk_size=chunk_size)
     
-    def _calculate_total_return(self, price_history: List[StockPrice]) -> float:
+    def _calculate_total_return(self, price_history: PriceSeries) -> float:
         """총 수익률 계산 (복리)"""
         if len(price_history) < 2:
             return 0.0
         
-        start_price = price_history[0].adjusted_close
-        end_price = price_history[-1].adjusted_close
+        start_price = price_history.close[0]
+        end_price = price_history.close[-1]
         
         if start_price <= 0:
             return 0.0
         
-        years = (price_history[-1].date - price_history[0].date).days / 365.25
+        years = ((price_history.dates[-1] - price_history.dates[0]) // DAY) / 365.25
         if years <= 0:
             return 0.0
         
         # 연평균 복리 수익률 계산
         annual_return = ((end_price / start_price) ** (1 / years)) - 1
-        return annual_return * 100
+        return float(annual_return * 100)
     
     def _analyze_correlation(self, roe_history: List[ROEData], 
-                           price_history: List[StockPrice]) -> CorrelationAnalysis:
+                           price_history: PriceSeries) -> CorrelationAnalysis:
         """ROE와 주가 수익률 상관관계 분석"""
         try:
             # 연도별로 데이터 매칭
             roe_by_year = {r.year: r.roe for r in roe_history}
             
-            # 연도별 주가 수익률 계산
-            annual_returns = {}
-            price_by_year = {}
-            
-            for price in price_history:
-                year = price.date.year
-                if year not in price_by_year:
-                    price_by_year[year] = price.adjusted_close
-                else:
-                    # 해당 연도의 마지막 가격으로 업데이트
-                    if price.date.month == 12:
-                        price_by_year[year] = price.adjusted_close
+            # 연도별 대표 가격: 12월 데이터가 있으면 해당 연도 마지막 가격, 없으면 첫 가격
+            years, first_idx, last_idx = _year_bounds(price_history.dates)
+            has_december = epoch_months(price_history.dates[last_idx]) == 12
+            year_prices = price_history.close[np.where(has_december, last_idx, first_idx)]
             
             # 연간 수익률 계산
-            years = sorted(price_by_year.keys())
-            for i in range(1, len(years)):
-                prev_year = years[i-1]
-                curr_year = years[i]
-                if prev_year in price_by_year and curr_year in price_by_year:
-                    prev_price = price_by_year[prev_year]
-                    curr_price = price_by_year[curr_year]
-                    if prev_price > 0:
-                        annual_return = ((curr_price / prev_price) - 1) * 100
-                        annual_returns[curr_year] = annual_return
+            annual_returns = {}
+            prev_prices, curr_prices = year_prices[:-1], year_prices[1:]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = (curr_prices / prev_prices - 1) * 100
+            for year, prev_price, annual_return in zip(years[1:], prev_prices, returns):
+                if prev_price > 0:
+                    annual_returns[int(year)] = float(annual_return)
             
             # 공통 연도 데이터 추출
             common_years = set(roe_by_year.keys()) & set(annual_returns.keys())
@@ -149,6 +202,7 @@ class InvestmentAnalyzer:
             return_values = [annual_returns[year] for year in sorted(common_years)]
             
             # 피어슨 상관계수 계산
+            from scipy import stats  # scipy.stats 는 import 비용이 커서 처음 사용할 때 로드
             correlation, p_value = stats.pearsonr(roe_values, return_values)
             
             # NaN 값 처리
@@ -182,56 +236,15 @@ class InvestmentAnalyzer:
             )
     
     def _calculate_investment_score(self, roe_history: List[ROEData], 
-                                  price_history: List[StockPrice],
+                                  price_history: PriceSeries,
                                   ten_year_return: float,
                                   correlation: CorrelationAnalysis) -> InvestmentScore:
         """투자 점수 계산"""
         try:
-            # 1. ROE 일관성 점수 (0-25점)
+            # 1. ROE 일관성 점수 (0-25점) / 2. ROE 성장 점수 (0-25점)
             roe_values = [r.roe for r in roe_history]
-            roe_std = np.std(roe_values)
-            roe_mean = np.mean(roe_values)
-            
-            # NaN 값 처리
-            if pd.isna(roe_std):
-                roe_std = 0.0
-            if pd.isna(roe_mean) or roe_mean == 0:
-                roe_mean = 1.0
-            
-            # 변동계수 기반 일관성 점수
-            cv = roe_std / roe_mean if roe_mean > 0 else float('inf')
-            if cv < 0.2:
-                roe_consistency_score = 25
-            elif cv < 0.4:
-                roe_consistency_score = 20
-            elif cv < 0.6:
-                roe_consistency_score = 15
-            elif cv < 0.8:
-                roe_consistency_score = 10
-            else:
-                roe_consistency_score = 5
-            
-            # 2. ROE 성장 점수 (0-25점)
-            if len(roe_values) >= 5:
-                recent_roe = np.mean(roe_values[-3:])  # 최근 3년 평균
-                early_roe = np.mean(roe_values[:3])    # 초기 3년 평균
-                
-                if early_roe > 0:
-                    roe_growth_rate = ((recent_roe / early_roe) - 1) * 100
-                    if roe_growth_rate > 20:
-                        roe_growth_score = 25
-                    elif roe_growth_rate > 10:
-                        roe_growth_score = 20
-                    elif roe_growth_rate > 0:
-                        roe_growth_score = 15
-                    elif roe_growth_rate > -10:
-                        roe_growth_score = 10
-                    else:
-                        roe_growth_score = 5
-                else:
-                    roe_growth_score = 10
-            else:
-                roe_growth_score = 10
+            roe_consistency_score = scoring.roe_consistency_score(roe_values)
+            roe_growth_score = scoring.roe_growth_score(roe_values)
             
             # 3. 주가 수익률 점수 (0-25점)
             if ten_year_return > 15:
@@ -304,7 +317,7 @@ class InvestmentAnalyzer:
             )
     
     def _prepare_chart_data(self, roe_history: List[ROEData], 
-                           price_history: List[StockPrice]) -> dict:
+                           price_history: PriceSeries) -> dict:
         """차트 데이터 준비"""
         try:
             # 연도별 데이터 정렬
@@ -314,25 +327,15 @@ class InvestmentAnalyzer:
             
             # 연도별 누적 수익률 계산
             price_returns = {}
-            if price_history:
+            if len(price_history):
                 # 전체 기간에서 가장 이른 날짜의 주가를 기준으로 사용
-                sorted_prices = sorted(price_history, key=lambda x: x.date)
-                base_price = sorted_prices[0].adjusted_close
-                print(f"DEBUG: Base price (earliest): ${base_price:.2f} on {sorted_prices[0].date}")
+                base_price = price_history.close[0]
                 
                 # 연도별로 가장 늦은 날짜의 가격 사용
-                yearly_latest_prices = {}
-                for price in price_history:
-                    year = price.date.year
-                    if year not in yearly_latest_prices or price.date > yearly_latest_prices[year]['date']:
-                        yearly_latest_prices[year] = {'price': price.adjusted_close, 'date': price.date}
-                
-                # 각 연도별로 누적 수익률 계산
-                for year, data in yearly_latest_prices.items():
-                    if base_price > 0:
-                        cumulative_return = ((data['price'] / base_price) - 1) * 100
-                        price_returns[year] = cumulative_return
-                        print(f"DEBUG: {year}: ${data['price']:.2f} -> {cumulative_return:.2f}% (date: {data['date']})")
+                years, _, last_idx = _year_bounds(price_history.dates)
+                if base_price > 0:
+                    cumulative_returns = (price_history.close[last_idx] / base_price - 1) * 100
+                    price_returns = {int(year): float(value) for year, value in zip(years, cumulative_returns)}
             
             # 공통 연도 추출
             common_years = sorted(set(roe_data.keys()) & set(price_returns.keys()))
@@ -340,7 +343,9 @@ class InvestmentAnalyzer:
             chart_data = {
                 "labels": common_years,
                 "roe_data": [roe_data.get(year, 0) for year in common_years],
-                "return_data": [price_returns.get(year, 0) for year in common_years]
+                "return_data": [price_returns.get(year, 0) for year in common_years],
+                # 투자금 1 기준 평가액 (대시보드 투자 가치 차트)
+                "investment_value": [round(1 + price_returns.get(year, 0) / 100, 2) for year in common_years]
             }
             
             return chart_data
@@ -350,5 +355,15 @@ class InvestmentAnalyzer:
             return {
                 "labels": [],
                 "roe_data": [],
-                "return_data": []
-            }
\ No newline at end of file
+                "return_data": [],
+                "investment_value": []
+            }
+
+
+def _year_bounds(dates: np.ndarray):
+    """날짜 배열(오름차순)의 연도 목록과 연도별 첫/마지막 인덱스"""
+    date_years = epoch_years(dates)
+    years = np.unique(date_years)
+    first_idx = np.searchsorted(date_years, years, side="left")
+    last_idx = np.searchsorted(date_years, years, side="right") - 1
+    return years, first_idx, last_idx
@@ -0,0 +1,147 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from services.fundamentals_store import DEFAULT_CACHE_DIR
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    total INTEGER,
+    message TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_stocks (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    symbol TEXT NOT NULL,
+    stock_info TEXT NOT NULL,
+    PRIMARY KEY (job_id, position)
+);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (job_id, symbol)
+);
+"""
+
+# 작업 상태: pending -> screening -> analyzing -> completed / failed
+UNFINISHED_STATUSES = ("pending", "screening", "analyzing")
+
+
+class JobStore:
+    """백그라운드 분석 작업 상태/결과 저장소 (SQLite)
+
+    스크리닝으로 선정된 종목 목록과 종목별 분석 결과를 단계마다 기록하므로,
+    서버가 재시작되어도 끝나지 않은 작업을 이어서 실행하거나 결과를 다시 조회할 수 있다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_DIR / "jobs.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+    def create_job(self, request: dict) -> str:
+        """새 작업 등록 후 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, request, created_at, updated_at) VALUES (?, 'pending', ?, ?, ?)",
+                (job_id, json.dumps(request), now, now)
+            )
+            self._conn.commit()
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["request"] = json.loads(job["request"])
+        return job
+
+    def update_status(self, job_id: str, status: str, message: Optional[str] = None):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, message = COALESCE(?, message), updated_at = ? WHERE id = ?",
+                (status, message, time.time(), job_id)
+            )
+            self._conn.commit()
+
+    def unfinished_jobs(self) -> List[str]:
+        """완료되지 않은 작업 ID 목록 (생성 순)"""
+        placeholders = ", ".join("?" for _ in UNFINISHED_STATUSES)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+                UNFINISHED_STATUSES
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def set_stocks(self, job_id: str, stocks: List[dict]):
+        """스크리닝으로 선정된 종목 목록 저장 (재시작 시 스크리닝을 다시 하지 않도록)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM job_stocks WHERE job_id = ?", (job_id,))
+            self._conn.executemany(
+                "INSERT INTO job_stocks (job_id, position, symbol, stock_info) VALUES (?, ?, ?, ?)",
+                [(job_id, i, stock["symbol"], json.dumps(stock)) for i, stock in enumerate(stocks)]
+            )
+            self._conn.execute(
+                "UPDATE jobs SET total = ?, updated_at = ? WHERE id = ?",
+                (len(stocks), time.time(), job_id)
+            )
+            self._conn.commit()
+
+    def get_stocks(self, job_id: str) -> Optional[List[dict]]:
+        """선정된 종목 목록 (아직 스크리닝 전이면 None)"""
+        job = self.get_job(job_id)
+        if job is None or job["total"] is None:
+            return None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stock_info FROM job_stocks WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return [json.loads(row["stock_info"]) for row in rows]
+
+    def add_result(self, job_id: str, symbol: str, result: Optional[dict]):
+        """종목별 분석 결과 기록 (result 가 None 이면 분석 실패로 기록)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_results (job_id, symbol, status, result, finished_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, symbol, "failed" if result is None else "ok",
+                 None if result is None else json.dumps(result), time.time())
+            )
+            self._conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+            self._conn.commit()
+
+    def get_results(self, job_id: str) -> List[dict]:
+        """종목별 분석 결과 목록 (완료 순) - 각 항목은 symbol, status, result"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT symbol, status, result FROM job_results WHERE job_id = ? ORDER BY finished_at",
+                (job_id,)
+            ).fetchall()
+        return [
+            {"symbol": row["symbol"], "status": row["status"],
+             "result": json.loads(row["result"]) if row["result"] else None}
+            for row in rows
+        ]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from typing import Iterable, List
+
+from services.data_provider import DEFAULT_CHUNK_SIZE, DataProvider
+from services.price_store import PriceSeries, PriceStore
+
+
+def to_price_series(symbol: str, close: pd.Series) -> PriceSeries:
+    """종가 Series 를 컬럼 배열 시계열로 변환
+
+    날짜는 거래일 자정(UTC 기준 epoch)으로 통일하여, 시간대가 있는 종목별 조회 결과와
+    시간대가 없는 다중 종목 조회 결과를 이어 붙여도 같은 거래일이 같은 값을 갖도록 한다.
+    """
+    index = pd.DatetimeIndex(close.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return PriceSeries(
+        symbol,
+        index.normalize().as_unit("s").asi8.astype(np.int64),
+        close.to_numpy(dtype=np.float64)
+    )
+
+
+# yfinance 가 받는 년 단위 period (그 외 기간은 "max" 로 받은 뒤 잘라 씀)
+YEAR_PERIODS = (1, 2, 5, 10)
+
+
+def period_for(years: int) -> str:
+    """years 년 이상을 포함하는 yfinance period 문자열"""
+    return f"{years}y" if years in YEAR_PERIODS else "max"
+
+
+def ingest_prices(symbols: Iterable[str], store: PriceStore, provider: DataProvider,
+                  years: int = 10, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[str]:
+    """여러 종목의 최근 years 년 주가를 일괄 다운로드하여 주가 저장소에 바로 기록
+
+    데이터 제공자의 다중 종목 요청을 사용하므로 500 종목도 chunk_size 단위 몇 번의 요청으로
+    갱신된다. 저장된 종목 목록을 반환한다.
+    """
+    closes = provider.download_prices(symbols, chunk_size=chunk_size, period=period_for(years))
+    for symbol, close in closes.items():
+        store.save(to_price_series(symbol, close), years=years)
+    return list(closes)
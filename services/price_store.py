@@ -0,0 +1,149 @@
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from models.stock_models import StockPrice
+from services.fundamentals_store import DEFAULT_CACHE_DIR, DAY
+
+SECONDS_PER_YEAR = 365.25 * DAY
+
+
+class PriceSeries(NamedTuple):
+    """종목별 일간 종가 시계열 (컬럼 배열, 날짜 오름차순)"""
+    symbol: str
+    dates: np.ndarray   # int64, epoch seconds (UTC)
+    close: np.ndarray   # float64, 수정 종가
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def since(self, start: int) -> "PriceSeries":
+        """start(epoch seconds) 이후 구간만 잘라낸 시계열 (복사 없이 view)"""
+        idx = int(np.searchsorted(self.dates, start, side="left"))
+        return PriceSeries(self.symbol, self.dates[idx:], self.close[idx:])
+
+
+def empty_series(symbol: str) -> PriceSeries:
+    return PriceSeries(symbol, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+
+def epoch_years(dates: np.ndarray) -> np.ndarray:
+    """epoch seconds 배열을 연도 배열로 변환"""
+    return dates.astype("datetime64[s]").astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def epoch_months(dates: np.ndarray) -> np.ndarray:
+    """epoch seconds 배열을 월(1-12) 배열로 변환"""
+    return dates.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def to_stock_prices(series: PriceSeries) -> List[StockPrice]:
+    """API 응답용 StockPrice 모델 리스트로 변환 (클라이언트가 원본 주가를 요청할 때만 사용)"""
+    return [
+        StockPrice(
+            date=datetime.fromtimestamp(int(date), tz=timezone.utc),
+            close_price=float(close),
+            adjusted_close=float(close)
+        )
+        for date, close in zip(series.dates, series.close)
+    ]
+
+
+class PriceStore:
+    """종목별 주가 시계열 로컬 저장소 (.npy 컬럼 파일)
+
+    종목마다 {symbol}.dates.npy (int64 epoch seconds) 와 {symbol}.close.npy (float64)
+    두 파일로 저장하며, 파일 수정 시각 기준 TTL 이 지나면 만료된 것으로 본다.
+    {symbol}.years 에는 받아 둔 기간(년)을 기록한다 (상장 기간이 짧은 종목은 데이터가 기간보다 짧을 수 있으므로
+    첫 날짜가 아니라 요청한 기간으로 판단, 기록이 없으면 0년으로 보고 다시 받음).
+    """
+
+    def __init__(self, root: Optional[str] = None, ttl: float = 1 * DAY):
+        self.root = Path(root) if root else DEFAULT_CACHE_DIR / "prices"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    @property
+    def version(self) -> int:
+        """데이터 버전: 저장된 시계열이 마지막으로 바뀐 시각 (ns) - 다른 프로세스의 갱신도 반영되도록 파일로 기록"""
+        try:
+            return int((self.root / "VERSION").read_text())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _paths(self, symbol: str):
+        return self.root / f"{symbol}.dates.npy", self.root / f"{symbol}.close.npy"
+
+    def load(self, symbol: str, fresh_only: bool = True) -> Optional[PriceSeries]:
+        """저장된 시계열 반환 (없거나, fresh_only 일 때 TTL 만료 시 None)"""
+        dates_path, close_path = self._paths(symbol)
+        try:
+            if fresh_only and time.time() - dates_path.stat().st_mtime >= self.ttl:
+                return None
+            dates, close = np.load(dates_path), np.load(close_path)
+        except (FileNotFoundError, ValueError):
+            return None
+        if len(dates) != len(close):  # 저장 도중에 읽은 경우
+            return None
+        return PriceSeries(symbol, dates, close)
+
+    def covered_years(self, symbol: str) -> float:
+        """저장된 시계열이 포함하는 기간 (년, 기록이 없으면 0)"""
+        try:
+            return float((self.root / f"{symbol}.years").read_text())
+        except (FileNotFoundError, ValueError):
+            return 0.0
+
+    def save(self, series: PriceSeries, years: Optional[float] = None):
+        """시계열 저장 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않도록 함)
+
+        years 를 지정하면 받아 둔 기간으로 기록한다 (지정하지 않으면 기존 기록 유지).
+        저장된 시계열과 같으면 다시 쓰지 않고 TTL 만 갱신한다. 데이터 버전(VERSION)은 이미 저장된 시계열이
+        바뀐 경우에만 갱신한다 (처음 저장하는 종목은 분석이 방금 받은 데이터와 같으므로 캐시된 결과에 영향 없음).
+        """
+        dates_path, close_path = self._paths(series.symbol)
+        if years is not None:
+            (self.root / f"{series.symbol}.years").write_text(str(years))
+        existing = self.load(series.symbol, fresh_only=False)
+        if (existing is not None and np.array_equal(existing.dates, series.dates)
+                and np.array_equal(existing.close, series.close, equal_nan=True)):
+            self.touch(series.symbol)
+            return
+        # close 를 먼저 교체하고 dates 를 나중에 교체: dates 파일의 수정 시각이 TTL 기준
+        for path, values in ((close_path, series.close), (dates_path, series.dates)):
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, values)
+            os.replace(tmp_path, path)
+        if existing is not None:
+            (self.root / "VERSION").write_text(str(time.time_ns()))
+
+    def append(self, series: PriceSeries) -> int:
+        """기존 시계열의 마지막 날짜 이후 데이터만 덧붙여 저장 (추가된 데이터 수 반환)"""
+        existing = self.load(series.symbol, fresh_only=False)
+        if existing is None or not len(existing):
+            if len(series):
+                self.save(series)
+            return len(series)
+
+        new = series.dates > existing.dates[-1]
+        count = int(new.sum())
+        if count:
+            self.save(PriceSeries(
+                series.symbol,
+                np.concatenate([existing.dates, series.dates[new]]),
+                np.concatenate([existing.close, series.close[new]])
+            ))
+        else:
+            self.touch(series.symbol)
+        return count
+
+    def touch(self, symbol: str):
+        """데이터를 다시 쓰지 않고 최신 상태임을 기록 (TTL 갱신)"""
+        dates_path, _ = self._paths(symbol)
+        if dates_path.exists():
+            os.utime(dates_path)
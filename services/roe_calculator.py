@@ -0,0 +1,63 @@
+import pandas as pd
+from typing import List
+
+# 재무상태표의 자기자본 항목명 (데이터 제공 시점에 따라 이름이 다름)
+EQUITY_ROWS = ['Stockholders Equity', 'Total Stockholder Equity', 'Shareholders Equity']
+
+STATEMENT_COLUMNS = ['net_income', 'total_revenue', 'stockholders_equity']
+
+
+def _by_fiscal_year(statement: pd.DataFrame, row: str) -> pd.Series:
+    """재무제표의 한 항목을 회계연도 인덱스 Series 로 변환 (같은 연도는 첫 번째 컬럼 사용)"""
+    if row not in statement.index:
+        return pd.Series(dtype=float)
+    values = pd.Series(statement.loc[row].to_numpy(), index=pd.DatetimeIndex(statement.columns).year)
+    return pd.to_numeric(values[~values.index.duplicated(keep='first')], errors='coerce')
+
+
+def statement_frame(financials: pd.DataFrame, balance_sheet: pd.DataFrame) -> pd.DataFrame:
+    """손익계산서와 재무상태표를 회계연도 기준으로 정렬한 DataFrame
+
+    index 는 fiscal_year, 컬럼은 net_income / total_revenue / stockholders_equity 이며
+    손익계산서에 있는 회계연도만 포함한다.
+    """
+    if financials.empty:
+        return pd.DataFrame(columns=STATEMENT_COLUMNS, index=pd.Index([], name='fiscal_year', dtype=int))
+
+    equity_row = next((row for row in EQUITY_ROWS if row in balance_sheet.index), None)
+    frame = pd.DataFrame({
+        'net_income': _by_fiscal_year(financials, 'Net Income'),
+        'total_revenue': _by_fiscal_year(financials, 'Total Revenue'),
+    }).reindex(pd.DatetimeIndex(financials.columns).year.unique())
+    frame['stockholders_equity'] = (
+        _by_fiscal_year(balance_sheet, equity_row) if equity_row else pd.Series(dtype=float)
+    )
+    frame.index = frame.index.astype(int).rename('fiscal_year')
+    return frame.sort_index()[STATEMENT_COLUMNS]
+
+
+def frame_from_rows(rows: List[dict]) -> pd.DataFrame:
+    """저장소 행 목록을 statement_frame 과 같은 형태의 DataFrame 으로 변환"""
+    frame = pd.DataFrame.from_records(rows, columns=['fiscal_year'] + STATEMENT_COLUMNS, index='fiscal_year')
+    frame.index = frame.index.astype(int)
+    return frame.astype(float).sort_index()
+
+
+def rows_from_frame(frame: pd.DataFrame) -> List[dict]:
+    """statement_frame 결과를 저장소 행 목록으로 변환 (결측치는 None)"""
+    records = frame.astype(object).where(frame.notna(), None).reset_index().to_dict('records')
+    return [{**record, 'fiscal_year': int(record['fiscal_year'])} for record in records]
+
+
+def compute_roe(frame: pd.DataFrame, revenue_fallback: bool = False) -> pd.Series:
+    """회계연도별 ROE(%) 를 한 번에 계산 (Net Income / Shareholders' Equity)
+
+    revenue_fallback 이 True 이면 순이익이 없는 연도에 매출의 10% 를 임시 추정치로 사용한다.
+    자기자본이 없거나 0 인 연도는 결과에서 제외된다.
+    """
+    net_income = frame['net_income']
+    if revenue_fallback:
+        net_income = net_income.fillna(frame['total_revenue'] * 0.1)
+    equity = frame['stockholders_equity']
+    roe = net_income / equity.where(equity != 0) * 100
+    return roe.dropna()
@@ -0,0 +1,105 @@
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.stock_models import ROEData
+from services.scoring import roe_pre_score
+
+# 스크리닝 기준 (StockScreener._passes_roe_criteria 와 동일)
+MIN_RECENT_YEARS = 3        # 최근 평균 기준에 필요한 최소 데이터 년수
+MAX_REQUIRED_GOOD_YEARS = 7  # 다년도 기준: min(7, 보유 년수 * 0.7) 년 이상 달성
+GOOD_YEARS_RATIO = 0.7
+SPARSE_YEARS = 5            # 데이터 부족 기준: 보유 년수 5년 미만이면 완화된 기준 적용
+RELAXED_ROE = 12.0
+
+
+class _SortedIndex:
+    """종목별 점수를 내림차순 정렬해 두고, 임계값 이상인 종목을 이진 탐색으로 찾는 인덱스"""
+
+    def __init__(self, scores: np.ndarray):
+        candidates = np.flatnonzero(~np.isnan(scores))
+        self.order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        self._neg_scores = -scores[self.order]  # 오름차순
+
+    def at_least(self, threshold: float) -> np.ndarray:
+        """점수가 threshold 이상인 종목 인덱스"""
+        return self.order[:np.searchsorted(self._neg_scores, -threshold, side="right")]
+
+
+class ROEPanel:
+    """유니버스 전체 종목 x 회계연도 ROE 패널
+
+    최근 w 년 누적합/데이터 수(prefix sum), 다년도 기준에 필요한 k 번째로 높은 ROE,
+    그리고 기준별로 정렬된 인덱스를 미리 계산해 두어 (min_roe, years) 조합의 스크리닝을
+    종목별 재계산 없이 이진 탐색만으로 처리한다.
+    """
+
+    def __init__(self, symbols: List[str], years: np.ndarray, values: np.ndarray):
+        self.symbols = list(symbols)
+        self.years = np.asarray(years, dtype=np.int64)  # 오름차순
+        self.values = np.asarray(values, dtype=np.float64)  # 종목 x 연도, 결측치는 NaN
+        self.built_at = time.time()
+
+        n, n_years = self.values.shape
+        valid = ~np.isnan(self.values)
+
+        # 최근 연도부터 누적: sums[:, w] / counts[:, w] = 최근 w 년 합계 / 데이터 수
+        recent_first = np.where(valid, self.values, 0.0)[:, ::-1]
+        zeros = np.zeros((n, 1))
+        self.sums = np.hstack([zeros, np.cumsum(recent_first, axis=1)])
+        self.counts = np.hstack([zeros, np.cumsum(valid[:, ::-1], axis=1)]).astype(np.int64)
+        total = self.counts[:, n_years]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = self.sums / self.counts
+        # 1. 최근 w 년 평균 ROE (데이터가 MIN_RECENT_YEARS 년 이상인 경우만)
+        recent_means = np.where(self.counts >= MIN_RECENT_YEARS, means, np.nan)
+        self._recent = [_SortedIndex(recent_means[:, w]) for w in range(n_years + 1)]
+
+        # 2. 다년도 기준: k = ceil(min(7, 보유 년수 * 0.7)) 번째로 높은 ROE 가 min_roe 이상이면 통과
+        descending = -np.sort(-np.where(valid, self.values, -np.inf), axis=1)
+        required = np.ceil(np.minimum(MAX_REQUIRED_GOOD_YEARS, total * GOOD_YEARS_RATIO)).astype(np.int64)
+        kth = descending[np.arange(n), np.maximum(required - 1, 0)]
+        self._good_years = _SortedIndex(np.where(total > 0, kth, np.nan))
+
+        # 3. 데이터 부족 종목의 전체 평균 ROE (완화된 기준)
+        sparse = (total > 0) & (total < SPARSE_YEARS)
+        self._sparse = _SortedIndex(np.where(sparse, means[:, n_years], np.nan))
+
+        # 데이터가 한 해라도 있는 종목만 패널로 판정 (나머지는 실시간 조회로 판정)
+        self._covered = {symbol for symbol, count in zip(self.symbols, total) if count > 0}
+        self._pre_scores: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def from_histories(cls, histories: Dict[str, List[ROEData]], last_year: int,
+                       n_years: int = 12) -> "ROEPanel":
+        """종목별 ROE 히스토리로 패널 생성 (last_year 까지 n_years 년)"""
+        years = np.arange(last_year - n_years + 1, last_year + 1)
+        values = np.full((len(histories), n_years), np.nan)
+        for row, history in enumerate(histories.values()):
+            for roe in history:
+                col = roe.year - years[0]
+                if 0 <= col < n_years:
+                    values[row, col] = roe.roe
+        return cls(list(histories), years, values)
+
+    def covers(self, symbol: str) -> bool:
+        return symbol in self._covered
+
+    def pre_scores(self) -> Dict[str, float]:
+        """데이터가 있는 종목별 사전 점수 (scoring.roe_pre_score, 조건과 무관하므로 처음 조회할 때 한 번 계산)"""
+        if self._pre_scores is None:
+            self._pre_scores = {
+                symbol: float(roe_pre_score(row[~np.isnan(row)]))
+                for symbol, row in zip(self.symbols, self.values) if symbol in self._covered
+            }
+        return self._pre_scores
+
+    def query(self, min_roe: float, years: int) -> List[str]:
+        """(min_roe, years) 스크리닝 기준을 통과한 종목 (유니버스 순서)"""
+        window = min(max(years, 0), len(self.years))
+        hits = [self._recent[window].at_least(min_roe), self._good_years.at_least(min_roe)]
+        if min_roe > RELAXED_ROE:
+            hits.append(self._sparse.at_least(RELAXED_ROE))
+        return [self.symbols[i] for i in np.unique(np.concatenate(hits))]
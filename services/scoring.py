@@ -0,0 +1,60 @@
+import math
+from typing import Sequence
+
+import numpy as np
+
+# 투자 점수 중 ROE 히스토리만으로 정해지는 부분(일관성 + 성장)의 최대값과 주가 기반 부분(수익률 + 상관관계)의 최대값
+MAX_ROE_SCORE = 50
+MAX_PRICE_SCORE = 50
+
+
+def roe_consistency_score(roe_values: Sequence[float]) -> int:
+    """ROE 일관성 점수 (0-25점): 변동계수(표준편차 / 평균)가 작을수록 높음"""
+    roe_std = np.std(roe_values) if len(roe_values) else float("nan")
+    roe_mean = np.mean(roe_values) if len(roe_values) else float("nan")
+
+    # NaN 값 처리
+    if math.isnan(roe_std):
+        roe_std = 0.0
+    if math.isnan(roe_mean) or roe_mean == 0:
+        roe_mean = 1.0
+
+    cv = roe_std / roe_mean if roe_mean > 0 else float('inf')
+    if cv < 0.2:
+        return 25
+    elif cv < 0.4:
+        return 20
+    elif cv < 0.6:
+        return 15
+    elif cv < 0.8:
+        return 10
+    return 5
+
+
+def roe_growth_score(roe_values: Sequence[float]) -> int:
+    """ROE 성장 점수 (0-25점): 초기 3년 평균 대비 최근 3년 평균 ROE 증가율 (연도 오름차순 입력)"""
+    if len(roe_values) < 5:
+        return 10
+    recent_roe = np.mean(roe_values[-3:])  # 최근 3년 평균
+    early_roe = np.mean(roe_values[:3])    # 초기 3년 평균
+    if early_roe <= 0:
+        return 10
+
+    roe_growth_rate = ((recent_roe / early_roe) - 1) * 100
+    if roe_growth_rate > 20:
+        return 25
+    elif roe_growth_rate > 10:
+        return 20
+    elif roe_growth_rate > 0:
+        return 15
+    elif roe_growth_rate > -10:
+        return 10
+    return 5
+
+
+def roe_pre_score(roe_values: Sequence[float]) -> int:
+    """스크리닝 단계의 사전 점수 (0-50점): 투자 점수 중 ROE 부분
+
+    주가를 조회하지 않고 계산할 수 있으며, 최종 투자 점수는 항상 이 값 이상 이 값 + MAX_PRICE_SCORE 이하이다.
+    """
+    return roe_consistency_score(roe_values) + roe_growth_score(roe_values)
@@ -0,0 +1,133 @@
+import gzip
+import importlib
+import importlib.util
+import json
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel
+
+MEDIA_JSON = "application/json"
+MEDIA_MSGPACK = "application/msgpack"
+MEDIA_ARROW = "application/vnd.apache.arrow.stream"
+MEDIA_ALIASES = {"application/x-msgpack": MEDIA_MSGPACK, "application/vnd.msgpack": MEDIA_MSGPACK}
+
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+MIN_COMPRESS_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _optional(module: str):
+    """선택 의존성 (설치되어 있을 때만 해당 형식/압축 제공, pyarrow 등은 import 비용이 커서 처음 사용할 때 로드)"""
+    return importlib.import_module(module) if _installed(module) else None
+
+
+def available_media_types() -> List[str]:
+    """현재 환경에서 응답 가능한 형식 (선호 순서)"""
+    media_types = [MEDIA_JSON]
+    if _installed("msgpack"):
+        media_types.append(MEDIA_MSGPACK)
+    if _installed("pyarrow"):
+        media_types.append(MEDIA_ARROW)
+    return media_types
+
+
+def _parse_accept(header: str) -> List[Tuple[str, float]]:
+    """Accept 헤더를 (미디어 타입, q) 목록으로 파싱 (q 가 높은 순)"""
+    entries = []
+    for order, part in enumerate(header.split(",")):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        if not media_type:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        entries.append((MEDIA_ALIASES.get(media_type.lower(), media_type.lower()), q, order))
+    entries.sort(key=lambda entry: (-entry[1], entry[2]))
+    return [(media_type, q) for media_type, q, _ in entries]
+
+
+def negotiate(accept: Optional[str]) -> Optional[str]:
+    """Accept 헤더에 맞는 응답 형식 (없으면 JSON, 지원하는 형식이 없으면 None)"""
+    if not accept:
+        return MEDIA_JSON
+    supported = available_media_types()
+    for media_type, q in _parse_accept(accept):
+        if q <= 0:
+            continue
+        if media_type in supported:
+            return media_type
+        if media_type in ("*/*", "application/*"):
+            return MEDIA_JSON
+    return None
+
+
+def columnar_prices(prices: List[dict]) -> dict:
+    """[{date, close_price, adjusted_close}, ...] 형식의 주가(StockPrice)를 컬럼 배열로 변환"""
+    return {
+        "date": [p["date"] for p in prices],
+        "close_price": [p["close_price"] for p in prices],
+        "adjusted_close": [p["adjusted_close"] for p in prices],
+    }
+
+
+def to_payload(response: BaseModel, columnar: bool = True) -> dict:
+    """분석 응답을 직렬화용 dict 로 변환 (columnar 이면 종목별 주가를 컬럼 배열로)"""
+    payload = response.model_dump(mode="json")
+    if columnar:
+        for item in payload.get("data", []):
+            if isinstance(item.get("price_history"), list):
+                item["price_history"] = columnar_prices(item["price_history"])
+    return payload
+
+
+def encode(response: BaseModel, media_type: str = MEDIA_JSON, columnar: bool = False) -> bytes:
+    """분석 응답 직렬화
+
+    - JSON: 기본 레이아웃은 pydantic 의 Rust 직렬화기, 컬럼 레이아웃은 orjson (없으면 json)
+    - MessagePack / Arrow IPC: 항상 컬럼 레이아웃 (Arrow 는 종목당 한 행, 성공 여부/메시지는 스키마 메타데이터,
+      형식이 고정되지 않은 chart_data 는 JSON 문자열 컬럼)
+    """
+    if media_type == MEDIA_JSON and not columnar:
+        return response.model_dump_json().encode()
+
+    payload = to_payload(response, columnar=True)
+    if media_type == MEDIA_MSGPACK:
+        return _optional("msgpack").packb(payload, use_bin_type=True)
+    if media_type == MEDIA_ARROW:
+        pa = _optional("pyarrow")
+        rows = [{**item, "chart_data": json.dumps(item.get("chart_data"), ensure_ascii=False)}
+                for item in payload.get("data", [])]
+        table = pa.Table.from_pylist(rows)
+        metadata = {key: json.dumps(value, ensure_ascii=False) for key, value in payload.items() if key != "data"}
+        table = table.replace_schema_metadata(metadata)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    orjson = _optional("orjson")
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compress(body: bytes, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Accept-Encoding 에 따라 brotli(설치된 경우) 또는 gzip 으로 압축 (압축하지 않으면 인코딩 None)"""
+    if len(body) < MIN_COMPRESS_SIZE or not accept_encoding:
+        return body, None
+    accepted = {encoding for encoding, q in _parse_accept(accept_encoding) if q > 0}
+    brotli = _optional("brotli") if "br" in accepted else None
+    if brotli is not None:
+        return brotli.compress(body, quality=5), "br"
+    if "gzip" in accepted:
+        return gzip.compress(body, compresslevel=6), "gzip"
+    return body, None
@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+from models.stock_models import StockInfo
+from services.data_provider import DataProvider, get_default_provider
+from services.fundamentals_store import FundamentalsStore
+from services.stock_screener import StockScreener
+
+
+def _screen_shard(symbols: List[str], min_roe: float, years: int, limit: int, provider: DataProvider,
+                  db_path: Optional[str], threads: int, quiet: bool) -> List[Tuple[float, dict]]:
+    """워커 프로세스에서 유니버스 일부(shard)의 사전 점수 상위 limit 개를 스크리닝
+
+    결과는 프로세스 간 전달을 위해 (사전 점수, 기업 정보 dict) 쌍.
+    """
+    screener = StockScreener(max_concurrency=threads, store=FundamentalsStore(db_path), provider=provider)
+    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    with output:
+        scored = asyncio.run(screener.screen_scored(
+            min_roe=min_roe, years=years, limit=limit, symbols=symbols
+        ))
+    return [(score, stock.model_dump()) for score, stock in scored]
+
+
+def _init_worker(processes: int):
+    """워커 프로세스 초기화: 데이터 제공자 요청 속도 제한을 워커 수로 나눠 씀 (http_session.set_rate_share)"""
+    from services.http_session import set_rate_share
+    set_rate_share(processes)
+
+
+def screen_universe_sharded(symbols: List[str], min_roe: float = 15.0, years: int = 5,
+                            limit: Optional[int] = None, workers: Optional[int] = None,
+                            shard_size: Optional[int] = None, threads_per_worker: int = 4,
+                            provider: Optional[DataProvider] = None, db_path: Optional[str] = None,
+                            quiet: bool = True) -> List[StockInfo]:
+    """전체 유니버스 스크리닝: 종목을 shard 로 나눠 프로세스 풀에서 병렬 실행 후 결과 병합
+
+    각 워커는 자기 shard 를 StockScreener 의 스레드 풀 동시 스크리닝으로 처리해 shard 안의 상위 limit 개를 돌려준다
+    (전체 상위 limit 개는 항상 shard 별 상위 limit 개의 합집합 안에 있음).
+    결과는 단일 프로세스 스크리닝과 같이 사전 점수 내림차순(같은 점수는 유니버스 순서)으로 정렬한 뒤
+    limit 이 있으면 상위 limit 개만 반환한다.
+    provider 는 워커로 전달되므로 pickle 가능해야 한다.
+    HTTP 요청 속도 제한은 프로세스마다 따로 적용되므로, 워커마다 전체 제한을 워커 수로 나눈 몫만 쓴다
+    (워커가 많아져도 전체 업스트림 요청 속도는 단일 프로세스와 같음).
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or math.ceil(len(symbols) / workers)
+    shards = [symbols[i:i + shard_size] for i in range(0, len(symbols), shard_size)]
+    provider = provider or get_default_provider()
+
+    print(f"\n=== 유니버스 스크리닝 시작: {len(symbols)}개 종목, {len(shards)}개 shard, 워커 {workers}개 ===")
+
+    qualified = {}
+    processes = min(workers, len(shards))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(processes,)) as pool:
+        futures = {
+            pool.submit(_screen_shard, shard, min_roe, years, limit or len(shard), provider, db_path,
+                        threads_per_worker, quiet): i
+            for i, shard in enumerate(shards)
+        }
+        for future in as_completed(futures):
+            try:
+                for score, stock in future.result():
+                    qualified[stock["symbol"]] = (score, StockInfo(**stock))
+            except Exception as e:
+                print(f"[ERROR] shard {futures[future]} 스크리닝 오류 - {e}")
+
+    order = {symbol: i for i, symbol in enumerate(symbols)}
+    ranked = sorted(qualified, key=lambda symbol: (-qualified[symbol][0], order[symbol]))
+    merged = [qualified[symbol][1] for symbol in (ranked[:limit] if limit else ranked)]
+    print(f"=== 유니버스 스크리닝 완료: {len(merged)}개 기업 선정 ===")
+    return merged
@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+import pandas as pd
+
+from services.data_provider import DEFAULT_CHUNK_SIZE, DataProvider
+
+
+class SingleFlight:
+    """동일 키에 대한 동시 호출 병합 (single-flight)
+
+    같은 key 로 진행 중인 호출이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 받는다.
+    결과는 호출이 끝나면 버린다 (캐시가 아님).
+    """
+
+    def __init__(self):
+        self.calls = 0    # 실제로 실행된 호출 수
+        self.shared = 0   # 진행 중인 호출의 결과를 공유한 횟수
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable, *args) -> Any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class SingleFlightProvider(DataProvider):
+    """데이터 제공자 호출을 종목/데이터셋 단위로 병합하는 래퍼
+
+    여러 요청이 동시에 같은 종목의 같은 데이터를 조회하면 업스트림 호출은 한 번만 실행된다.
+    """
+
+    def __init__(self, provider: DataProvider):
+        self.provider = provider
+        self.flight = SingleFlight()
+
+    def get_statements(self, symbol: str) -> pd.DataFrame:
+        return self.flight.do(("statements", symbol), self.provider.get_statements, symbol)
+
+    def get_price_history(self, symbol: str, **history_kwargs) -> pd.Series:
+        key = ("price_history", symbol, tuple(sorted(history_kwargs.items())))
+        return self.flight.do(key, lambda: self.provider.get_price_history(symbol, **history_kwargs))
+
+    def get_info(self, symbol: str) -> dict:
+        return self.flight.do(("info", symbol), self.provider.get_info, symbol)
+
+    def download_prices(self, symbols: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        **history_kwargs) -> Dict[str, pd.Series]:
+        symbols = list(dict.fromkeys(symbols))
+        key = ("download_prices", tuple(symbols), chunk_size, tuple(sorted(history_kwargs.items())))
+        return self.flight.do(
+            key, lambda: self.provider.download_prices(symbols, chunk_size=chunk_size, **history_kwargs)
+        )
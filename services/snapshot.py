@@ -0,0 +1,164 @@
+"""
+사전 계산 스냅샷: 유니버스 전체를 미리 스크리닝/분석해 디스크에 버전별로 저장하고,
+서버는 요청마다 데이터 제공자를 호출하지 않고 메모리의 스냅샷을 필터링/정렬해 응답한다.
+
+    python run.py snapshot --universe sp500_sample   # 스냅샷 생성
+
+스냅샷 디렉토리 구성 ({root}/{version}/):
+    manifest.json  버전, 생성 시각, 유니버스, 분석 성공/실패 종목
+    panel.npz      ROE 패널 (종목, 회계연도, 종목 x 연도 ROE)
+    results.json   종목별 분석 결과 (수익률/상관관계 등 주가 기반 지표, 투자 점수, 차트 데이터)
+{root}/CURRENT 파일에 현재 버전 이름을 기록한다 (새 버전을 다 쓴 뒤 원자적으로 교체).
+"""
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from models.stock_models import AnalysisRequest, AnalysisResponse, StockAnalysisResult
+from services.fundamentals_store import DEFAULT_CACHE_DIR
+from services.roe_panel import ROEPanel
+
+if TYPE_CHECKING:
+    from services.investment_analyzer import InvestmentAnalyzer
+
+DEFAULT_SNAPSHOT_DIR = Path(os.environ.get("ROE_SNAPSHOT_DIR", DEFAULT_CACHE_DIR / "snapshots"))
+
+# 보관할 스냅샷 버전 수 (오래된 버전부터 삭제)
+KEEP_VERSIONS = 3
+
+
+class Snapshot:
+    """메모리에 올린 스냅샷 한 버전: ROE 패널로 필터링하고 투자 점수 순으로 정렬해 응답"""
+
+    def __init__(self, version: str, manifest: dict, panel: ROEPanel, results: List[StockAnalysisResult]):
+        self.version = version
+        self.manifest = manifest
+        self.panel = panel
+        # 투자 점수 내림차순으로 미리 정렬 (요청마다 정렬하지 않음)
+        self.ranked = sorted(results, key=lambda r: r.investment_score.total_score, reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.ranked)
+
+    def analyze(self, request: AnalysisRequest) -> AnalysisResponse:
+        """(min_roe, years) 기준을 통과한 종목 중 투자 점수 상위 limit 개"""
+        passed = set(self.panel.query(request.min_roe, request.years))
+        data = [r for r in self.ranked if r.stock_info.symbol in passed][:max(request.limit, 0)]
+        if not data:
+            return AnalysisResponse(success=False, message="조건에 맞는 기업을 찾을 수 없습니다.", data=[])
+        return AnalysisResponse(
+            success=True,
+            message=f"{len(data)}개 기업 분석 완료 (스냅샷 {self.version})",
+            data=data
+        )
+
+
+class SnapshotStore:
+    """버전별 스냅샷 디렉토리 읽기/쓰기"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root) if root else DEFAULT_SNAPSHOT_DIR
+
+    def current_version(self) -> Optional[str]:
+        """CURRENT 파일에 기록된 현재 버전 (스냅샷이 없으면 None)"""
+        try:
+            return (self.root / "CURRENT").read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def versions(self) -> List[str]:
+        """저장된 버전 목록 (오래된 순)"""
+        if not self.root.exists():
+            return []
+        return sorted(path.name for path in self.root.iterdir() if (path / "manifest.json").exists())
+
+    def write(self, panel: ROEPanel, results: List[StockAnalysisResult], manifest: dict) -> str:
+        """새 버전을 임시 디렉토리에 모두 쓴 뒤 이름을 바꾸고 CURRENT 를 교체 (버전 이름 반환)"""
+        base = version = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        self.root.mkdir(parents=True, exist_ok=True)
+        suffix = 0
+        while (self.root / version).exists():  # 같은 초에 두 번 생성한 경우
+            suffix += 1
+            version = f"{base}-{suffix}"
+        staging = self.root / f".{version}.tmp"
+        staging.mkdir()
+
+        np.savez(staging / "panel.npz", symbols=np.array(panel.symbols, dtype=str),
+                 years=panel.years, values=panel.values)
+        with open(staging / "results.json", "w", encoding="utf-8") as f:
+            json.dump([r.model_dump(mode="json") for r in results], f, ensure_ascii=False)
+        with open(staging / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump({**manifest, "version": version}, f, ensure_ascii=False, indent=2)
+
+        os.replace(staging, self.root / version)
+        current_tmp = self.root / "CURRENT.tmp"
+        current_tmp.write_text(version)
+        os.replace(current_tmp, self.root / "CURRENT")
+        self.prune()
+        return version
+
+    def load(self, version: Optional[str] = None) -> Optional[Snapshot]:
+        """스냅샷 로드 (version 을 지정하지 않으면 현재 버전, 없으면 None)"""
+        version = version or self.current_version()
+        if version is None:
+            return None
+        directory = self.root / version
+        with open(directory / "manifest.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+        with np.load(directory / "panel.npz") as arrays:
+            panel = ROEPanel([str(s) for s in arrays["symbols"]], arrays["years"], arrays["values"])
+        with open(directory / "results.json", encoding="utf-8") as f:
+            results = [StockAnalysisResult(**item) for item in json.load(f)]
+        return Snapshot(version, manifest, panel, results)
+
+    def prune(self, keep: int = KEEP_VERSIONS):
+        """현재 버전을 제외하고 오래된 버전 삭제 (최근 keep 개 보관)"""
+        current = self.current_version()
+        for version in self.versions()[:-keep]:
+            if version != current:
+                shutil.rmtree(self.root / version, ignore_errors=True)
+
+
+def build_snapshot(analyzer: "InvestmentAnalyzer", symbols: List[str], store: Optional[SnapshotStore] = None,
+                   universe: Optional[str] = None, max_workers: int = 8) -> str:
+    """유니버스 전체 스크리닝(ROE 패널) + 종목별 분석 결과를 스냅샷으로 저장 (버전 이름 반환)
+
+    어떤 (min_roe, years) 요청에도 답할 수 있도록 ROE 데이터가 있는 종목은 모두 분석한다.
+    """
+    store = store or SnapshotStore()
+    screener = analyzer.screener
+    symbols = list(dict.fromkeys(symbols))
+    started = time.time()
+
+    panel = screener.build_roe_panel(symbols)
+    candidates = [symbol for symbol in symbols if panel.covers(symbol)]
+    analyzer.prefetch_prices(candidates)
+
+    def analyze(symbol: str) -> Optional[StockAnalysisResult]:
+        try:
+            stock_info = screener._fetch_stock_info(symbol)
+            return analyzer.analyze_stock_sync(stock_info)
+        except Exception as e:
+            print(f"[ERROR] {symbol} 스냅샷 분석 실패 - {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="snapshot") as executor:
+        analyzed = dict(zip(candidates, executor.map(analyze, candidates)))
+    results = [result for result in analyzed.values() if result is not None]
+
+    manifest = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "universe": universe,
+        "symbols": len(symbols),
+        "analyzed": len(results),
+        "failed_symbols": [symbol for symbol, result in analyzed.items() if result is None],
+        "panel_years": [int(panel.years[0]), int(panel.years[-1])],
+        "build_seconds": round(time.time() - started, 3),
+    }
+    return store.write(panel, results, manifest)
@@ -0,0 +1,159 @@
+"""
+정적 자산(대시보드 HTML) 제공: 내용 해시 ETag, 사전 압축본(gzip/brotli), 304 응답
+
+    python -m services.static_assets api/static frontend   # {파일}.gz / {파일}.br 사전 압축본 생성
+
+사전 압축본이 없거나 원본보다 오래되었으면 처음 로드할 때 메모리에서 압축한다 (콜드 스타트마다 실행되므로
+빠른 압축 수준을 쓰고, 최고 압축 수준은 사전 압축 명령에서만 사용).
+서버리스 진입점에서도 쓰이므로 표준 라이브러리(와 선택적으로 brotli)만 사용한다.
+"""
+import gzip
+import hashlib
+import mimetypes
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 고정 주소(/)는 매번 ETag 로 재검증 (변경이 없으면 304)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+COMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# 압축 수준 (brotli quality, gzip compresslevel): 사전 압축은 최고 수준, 요청 경로의 대체 압축은 빠른 수준
+PRECOMPRESS_LEVELS = {"br": 11, "gzip": 9}
+RUNTIME_LEVELS = {"br": 5, "gzip": 6}
+
+
+class Asset(NamedTuple):
+    name: str
+    media_type: str
+    digest: str  # 내용 해시 (ETag 는 인코딩별로 _etag 로 만듦)
+    bodies: Dict[Optional[str], bytes]  # 인코딩(None=원본, "gzip", "br") -> 본문
+
+
+def _compress(body: bytes, encoding: str, levels: Dict[str, int] = RUNTIME_LEVELS) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=levels["br"])
+    return gzip.compress(body, compresslevel=levels["gzip"], mtime=0)
+
+
+def _encodings() -> List[str]:
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def _load_precompressed(path: Path, encoding: str, body: bytes) -> bytes:
+    """사전 압축본이 원본보다 새것이면 사용, 아니면 메모리에서 압축"""
+    compressed_path = path.with_name(path.name + COMPRESSED_SUFFIXES[encoding])
+    if compressed_path.exists() and compressed_path.stat().st_mtime >= path.stat().st_mtime:
+        return compressed_path.read_bytes()
+    return _compress(body, encoding)
+
+
+def load_asset(path: Path) -> Asset:
+    body = path.read_bytes()
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/"):
+        media_type += "; charset=utf-8"
+    bodies = {None: body}
+    for encoding in _encodings():
+        bodies[encoding] = _load_precompressed(path, encoding, body)
+    return Asset(
+        name=path.name,
+        media_type=media_type,
+        digest=digest,
+        bodies=bodies,
+    )
+
+
+def _etag(digest: str, encoding: Optional[str]) -> str:
+    """인코딩별 강한 ETag (같은 내용이라도 압축본마다 바이트가 다르므로 값이 달라야 함)"""
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def _accepted_encodings(header: Optional[str]) -> List[str]:
+    """Accept-Encoding 에서 q 가 0 보다 큰 인코딩 (q 를 해석할 수 없으면 제외)"""
+    accepted = []
+    for token in (header or "").split(","):
+        name, *params = [part.strip().lower() for part in token.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name and q > 0:
+            accepted.append(name)
+    return accepted
+
+
+def _etag_matches(header: Optional[str], digest: str) -> bool:
+    """If-None-Match 가 현재 내용의 ETag(어느 인코딩이든)와 일치하는지"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    variants = {_etag(digest, encoding) for encoding in (None, *COMPRESSED_SUFFIXES)}
+    return any(candidate.strip().removeprefix("W/") in variants for candidate in header.split(","))
+
+
+class StaticAssets:
+    """지정한 파일들을 처음 요청할 때 한 번 읽어 해시/압축본을 메모리에 보관하고 조건부 요청에 응답"""
+
+    def __init__(self, root: str, names: List[str]):
+        self.root = Path(root)
+        self.names = list(names)
+        self._assets: Dict[str, Asset] = {}
+
+    def get(self, name: str) -> Optional[Asset]:
+        """이름으로 자산 조회"""
+        if not self._assets:
+            for original in self.names:
+                self._assets[original] = load_asset(self.root / original)
+        return self._assets.get(name)
+
+    def response(self, request: Request, name: str) -> Response:
+        """ETag 재검증 응답 (변경이 없으면 304, 클라이언트가 받는 인코딩의 압축본 제공)"""
+        asset = self.get(name)
+        if asset is None:
+            return Response(status_code=404)
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+        encoding = next((e for e in _encodings() if e in accepted), None)
+        headers = {
+            "ETag": _etag(asset.digest, encoding),
+            "Cache-Control": REVALIDATE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if _etag_matches(request.headers.get("if-none-match"), asset.digest):
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=asset.bodies[encoding], media_type=asset.media_type, headers=headers)
+
+
+def precompress(directories: List[str]):
+    """디렉토리의 html/css/js 파일마다 .gz / .br 사전 압축본 생성"""
+    for directory in directories:
+        for path in sorted(Path(directory).iterdir()):
+            if path.suffix not in (".html", ".css", ".js"):
+                continue
+            body = path.read_bytes()
+            for encoding in _encodings():
+                compressed = _compress(body, encoding, PRECOMPRESS_LEVELS)
+                path.with_name(path.name + COMPRESSED_SUFFIXES[encoding]).write_bytes(compressed)
+                print(f"{path}{COMPRESSED_SUFFIXES[encoding]}: {len(body)} -> {len(compressed)} bytes")
+
+
+if __name__ == "__main__":
+    precompress(sys.argv[1:] or ["api/static", "frontend"])
@@ -1,173 +1,367 @@
-import yfinance as yf
 import pandas as pd
 import asyncio
-from typing import List, Optional
+import copy
+import heapq
+from typing import AsyncIterator, List, Optional, Tuple
 from models.stock_models import StockInfo, ROEData
+from services.fundamentals_store import FundamentalsStore
+from services.metrics import IN_FLIGHT, REGISTRY, STAGE_SECONDS, record_cache, record_orphan
+from services.data_context import RequestDataContext
+from services.data_provider import DataProvider, get_default_provider
+from services.roe_calculator import compute_roe, frame_from_rows, rows_from_frame
+from services.roe_panel import ROEPanel
+from services.scoring import roe_pre_score
+from services.single_flight import SingleFlight
+from services.universe import DEFAULT_UNIVERSE, UniverseRegistry
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCREENING_PRUNED = REGISTRY.counter(
+    "roe_screening_pruned_total", "ROE 패널 사전 점수가 상위 limit 개에 들 수 없어 판정을 생략한 종목 수", ("source",))
 
 class StockScreener:
-    def __init__(self):
-        # S&P 500 주요 기업들 - 실제 환경에서는 더 많은 기업 리스트 사용
-        self.sp500_symbols = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'JNJ', 'JPM', 'V',
-            'UNH', 'PG', 'HD', 'MA', 'BAC', 'XOM', 'ABBV', 'PFE', 'ASML', 'KO',
-            'AVGO', 'PEP', 'TMO', 'COST', 'MRK', 'WMT', 'ABT', 'NFLX', 'CRM', 'ACN',
-            'LLY', 'NKE', 'ORCL', 'DHR', 'TXN', 'NEE', 'VZ', 'RTX', 'CMCSA', 'INTC',
-            'AMD', 'HON', 'T', 'QCOM', 'LOW', 'IBM', 'UPS', 'INTU', 'AMGN', 'CAT'
-        ]
+    def __init__(self, max_concurrency: int = 8, store: Optional[FundamentalsStore] = None,
+                 provider: Optional[DataProvider] = None):
+        # S&P 500 주요 기업들 - 전체 유니버스는 UniverseRegistry 의 구성종목 파일 사용
+        self.sp500_symbols = UniverseRegistry().load(DEFAULT_UNIVERSE)
+        # 동시 스크리닝 설정: yfinance 호출은 블로킹이므로 제한된 스레드 풀에서 실행
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="screener")
+        # 재무 데이터 로컬 저장소: 저장소에 없거나 TTL 이 지난 경우에만 데이터 제공자 호출
+        self.store = store or FundamentalsStore()
+        # 재무제표/기업 정보 데이터 제공자 (기본값: yfinance, ROE_FIXTURE_DIR 설정 시 픽스처)
+        self.provider = provider or get_default_provider()
+        # 유니버스 ROE 패널: 설정되어 있으면 패널에 데이터가 있는 종목은 재계산 없이 판정
+        self.panel: Optional[ROEPanel] = None
+        self.panel_ttl = 24 * 3600
+        # 요청 단위 데이터 컨텍스트 (with_context 로 만든 복사본에서만 설정)
+        self.context: Optional[RequestDataContext] = None
+        # 저장소 조회 + 데이터 제공자 조회를 종목 단위로 병합 (with_context 복사본과 공유)
+        self.flight = SingleFlight()
+    
+    def with_context(self, context: RequestDataContext) -> "StockScreener":
+        """요청 단위 데이터 컨텍스트를 사용하는 스크리너 (스레드 풀/저장소/패널은 공유)"""
+        screener = copy.copy(self)
+        screener.provider = context
+        screener.context = context
+        return screener
     
-    async def screen_high_roe_stocks(self, min_roe: float = 15.0, years: int = 5, limit: int = 20) -> List[StockInfo]:
-        """ROE 기준 완화된 스크리닝: 최근 5년 평균 또는 10년 중 7년 이상"""
+    def _memoize(self, key, loader, *args):
+        """요청 컨텍스트가 있으면 종목별 데이터를 한 번만 조회"""
+        if self.context is None:
+            return loader(*args)
+        return self.context.memoize(key, loader, *args)
+    
+    async def screen_high_roe_stocks(self, min_roe: float = 15.0, years: int = 5, limit: int = 20,
+                                     concurrency: Optional[int] = None,
+                                     symbols: Optional[List[str]] = None,
+                                     deadline: Optional[float] = None) -> List[StockInfo]:
+        """ROE 기준 완화된 스크리닝: 최근 years 년 평균 또는 10년 중 7년 이상
+
+        기준을 통과한 기업 중 사전 점수(scoring.roe_pre_score, 투자 점수의 ROE 부분)가 높은 limit 개를
+        점수 순으로 반환한다 (같은 점수는 유니버스 순서). 기업 정보는 선정된 기업만 조회한다.
+        종목별 조회는 제한된 스레드 풀에서 동시에 실행된다.
+        concurrency 를 지정하지 않으면 생성자의 max_concurrency 를 사용한다.
+        symbols 를 지정하지 않으면 기본 유니버스(universe.DEFAULT_UNIVERSE) 전체를 스크리닝한다.
+        deadline(이벤트 루프 시각, loop.time() 기준)이 지나면 남은 종목 작업을 취소하고 그때까지 선정된 기업만 반환한다.
+        """
         
-        qualified_stocks = []
+        scored = await self.screen_scored(min_roe, years, limit, concurrency, symbols, deadline)
+        return [stock for _, stock in scored]
+
+    async def screen_scored(self, min_roe: float = 15.0, years: int = 5, limit: int = 20,
+                            concurrency: Optional[int] = None,
+                            symbols: Optional[List[str]] = None,
+                            deadline: Optional[float] = None) -> List[Tuple[float, StockInfo]]:
+        """screen_high_roe_stocks 와 같은 스크리닝, (사전 점수, 기업 정보) 쌍을 점수 순으로 반환
+
+        여러 shard 의 결과를 점수로 병합할 때 사용한다 (sharded_screener).
+        """
         print(f"\n=== ROE 스크리닝 시작 (기준: {min_roe}%, 기간: {years}년) ===")
         
-        # S&P 500 기업들 중에서 스크리닝 
-        for symbol in self.sp500_symbols[:30]:  # 처음 30개 기업만 테스트
-            try:
-                print(f"\n--- {symbol} 분석 중 ---")
-                roe_history = self.get_stock_roe_history(symbol, 10)
-                
-                if not roe_history:
-                    print(f"{symbol}: ROE 데이터 없음")
-                    continue
-                
-                # ROE 히스토리 출력 (디버깅용)
-                print(f"{symbol} ROE 히스토리:")
-                for roe_data in roe_history:
-                    print(f"  {roe_data.year}: {roe_data.roe:.1f}%")
-                
-                # 1. 최근 5년 평균 ROE 기준
-                recent_years = [r for r in roe_history if r.year >= 2019]
-                if len(recent_years) >= 3:  # 최근 3년 이상 데이터
-                    avg_roe = sum(r.roe for r in recent_years) / len(recent_years)
-                    print(f"{symbol}: 최근 {len(recent_years)}년 평균 ROE = {avg_roe:.1f}%")
-                    
-                    if avg_roe >= min_roe:
-                        print(f"[PASS] {symbol}: 최근 평균 ROE 기준 통과")
-                        qualified_stocks.append(await self._get_stock_info(symbol))
-                        continue
-                
-                # 2. 10년 중 7년 이상 ROE 15% 달성 기준 
-                good_years = [r for r in roe_history if r.roe >= min_roe]
-                print(f"{symbol}: {len(good_years)}/{len(roe_history)}년 ROE {min_roe}% 이상 달성")
-                
-                if len(good_years) >= min(7, len(roe_history) * 0.7):
-                    print(f"[PASS] {symbol}: 다년도 ROE 기준 통과")
-                    qualified_stocks.append(await self._get_stock_info(symbol))
+        with IN_FLIGHT.track_in_progress(kind="screenings"), STAGE_SECONDS.time(stage="screen"):
+            if symbols is None:
+                symbols = self.sp500_symbols
+            selected = await self._select_top_k(min_roe, years, limit, concurrency, symbols, deadline)
+            qualified_stocks = await self._fetch_stock_infos([symbol for _, symbol in selected], deadline)
+        
+        print(f"\n=== 스크리닝 완료: {len(qualified_stocks)}개 기업 선정 ===")
+        return [(score, stock) for (score, _), stock in zip(selected, qualified_stocks)]
+
+    async def _select_top_k(self, min_roe: float, years: int, limit: int, concurrency: Optional[int],
+                            symbols: List[str], deadline: Optional[float]) -> List[Tuple[float, str]]:
+        """기준을 통과한 종목 중 사전 점수 상위 limit 개의 (사전 점수, 종목) (점수 내림차순)
+
+        크기 limit 의 최소 힙을 유지한다. 패널에 데이터가 있는 종목은 사전 점수를 이미 알고 있으므로 점수 순으로
+        처리하고, 처음으로 힙에 들 수 없는 종목에서 나머지를 모두 건너뛴다.
+        패널에 없는 종목은 조회 전에 점수의 상한을 알 수 없으므로 모두 조회해 판정한다.
+        """
+        if limit <= 0:
+            return []
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+        order = {symbol: i for i, symbol in enumerate(dict.fromkeys(symbols))}
+        # (사전 점수, -유니버스 순서, 종목): 힙의 맨 앞이 가장 먼저 밀려날 종목
+        heap: List[Tuple[float, int, str]] = []
+        
+        def can_enter(upper_bound: float, symbol: str) -> bool:
+            return len(heap) < limit or (upper_bound, -order[symbol]) > heap[0][:2]
+        
+        def offer(score: float, symbol: str):
+            item = (score, -order[symbol], symbol)
+            if len(heap) < limit:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        
+        # 1. 패널에 데이터가 있는 종목: 기준 통과 여부와 사전 점수를 바로 알 수 있음
+        remaining = list(order)
+        panel = self._active_panel()
+        if panel is not None:
+            passed = set(panel.query(min_roe, years))
+            scores = panel.pre_scores()
+            candidates = sorted((s for s in order if panel.covers(s) and s in passed),
+                                key=lambda s: (-scores[s], order[s]))
+            for i, symbol in enumerate(candidates):
+                if not can_enter(scores[symbol], symbol):
+                    SCREENING_PRUNED.inc(len(candidates) - i, source="roe_panel")
+                    break
+                offer(scores[symbol], symbol)
+            remaining = [s for s in order if not panel.covers(s)]
+            for symbol in order:
+                record_cache("roe_panel", panel.covers(symbol))
+        
+        # 2. 나머지 종목: 종목별로 조회해 판정
+        async def evaluate(symbol: str):
+            async with semaphore:
+                score = await self._run_blocking(self._pre_screen, symbol, min_roe, years)
+                if score is not None:
+                    offer(score, symbol)
+        
+        tasks = [asyncio.ensure_future(evaluate(symbol)) for symbol in remaining]
+        timeout = None if deadline is None else max(deadline - loop.time(), 0)
+        try:
+            if tasks:
+                done, pending = await asyncio.wait(tasks, timeout=timeout)
+                if pending:
+                    print(f"[WARN] 스크리닝 제한 시간 초과 - {len(pending)}개 종목 판정 중단")
+                for task in done:
+                    if not task.cancelled() and task.exception() is not None:
+                        print(f"[ERROR] 스크리닝 작업 오류 - {task.exception()}")
+        finally:
+            # 제한 시간 초과 또는 호출자가 취소한 경우 아직 끝나지 않은 종목 작업은 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        return [(score, symbol) for score, _, symbol in sorted(heap, reverse=True)]
+
+    def _pre_screen(self, symbol: str, min_roe: float, years: int) -> Optional[float]:
+        """기준을 통과하면 사전 점수, 아니면 None (블로킹 호출, 스레드 풀에서 실행)"""
+        roe_history = self.get_stock_roe_history(symbol, 10)
+        if not self._passes_roe_criteria(symbol, min_roe, years, roe_history):
+            return None
+        return float(roe_pre_score([r.roe for r in roe_history]))
+
+    async def _fetch_stock_infos(self, symbols: List[str], deadline: Optional[float]) -> List[StockInfo]:
+        """선정된 종목들의 기업 정보를 동시에 조회 (deadline 까지 받지 못한 종목은 종목 코드만으로 대체)"""
+        if not symbols:
+            return []
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(self._run_blocking(self._fetch_stock_info, symbol)) for symbol in symbols]
+        timeout = None if deadline is None else max(deadline - loop.time(), 0)
+        try:
+            await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        return [
+            task.result() if task.done() and not task.cancelled() and task.exception() is None
+            else StockInfo(symbol=symbol, company_name=symbol, sector="", market_cap=None)
+            for symbol, task in zip(symbols, tasks)
+        ]
+
+    async def iter_high_roe_stocks(self, min_roe: float = 15.0, years: int = 5, limit: int = 20,
+                                   concurrency: Optional[int] = None,
+                                   symbols: Optional[List[str]] = None,
+                                   deadline: Optional[float] = None) -> AsyncIterator[StockInfo]:
+        """기준을 통과한 종목을 확정되는 즉시 하나씩 반환하는 스크리닝 (최대 limit 개, deadline 이 지나면 중단)"""
+        if limit <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+        panel = self._active_panel()
+        panel_passed = set(panel.query(min_roe, years)) if panel is not None else set()
+        
+        async def screen_symbol(symbol: str) -> Optional[StockInfo]:
+            async with semaphore:
+                covered = panel is not None and panel.covers(symbol)
+                if panel is not None:
+                    record_cache("roe_panel", covered)
+                if covered:
+                    passed = symbol in panel_passed
+                else:
+                    passed = await self._run_blocking(self._passes_roe_criteria, symbol, min_roe, years)
+                if not passed:
+                    return None
+                return await self._run_blocking(self._fetch_stock_info, symbol)
+        
+        # 지정하지 않으면 기본 유니버스 전체를 스크리닝
+        if symbols is None:
+            symbols = self.sp500_symbols
+        tasks = {asyncio.ensure_future(screen_symbol(symbol)): symbol for symbol in symbols}
+        found = 0
+        timeout = None if deadline is None else max(deadline - loop.time(), 0)
+        
+        try:
+            for future in asyncio.as_completed(tasks, timeout=timeout):
+                try:
+                    stock = await future
+                except asyncio.TimeoutError:
+                    print(f"[WARN] 스크리닝 제한 시간 초과 - {found}개 기업 선정 후 중단")
+                    break
+                except Exception as e:
+                    print(f"[ERROR] 스크리닝 작업 오류 - {e}")
                     continue
                 
-                # 3. 데이터 부족시 ROE 12% 기준으로 완화
-                if len(roe_history) < 5 and min_roe > 12:
-                    avg_roe = sum(r.roe for r in roe_history) / len(roe_history)
-                    if avg_roe >= 12:
-                        print(f"[PASS] {symbol}: 완화된 ROE 기준(12%) 통과")
-                        qualified_stocks.append(await self._get_stock_info(symbol))
-                        continue
+                if stock is not None:
+                    found += 1
+                    yield stock
                 
-                print(f"[FAIL] {symbol}: 모든 ROE 기준 미달")
-                
-                if len(qualified_stocks) >= limit:
+                if found >= limit:
                     break
-                    
-            except Exception as e:
-                print(f"[ERROR] {symbol}: 분석 중 오류 - {e}")
-                continue
-        
-        print(f"\n=== 스크리닝 완료: {len(qualified_stocks)}개 기업 선정 ===")
-        return qualified_stocks[:limit]
+        finally:
+            # limit 도달, 제한 시간 초과 또는 소비자가 중단한 경우 아직 대기 중인 종목 작업은 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _run_blocking(self, fn, *args):
+        """블로킹 호출을 스레드 풀에서 실행 (취소되면 시작 전 작업은 버리고, 실행 중인 작업은 고아 작업으로 집계)"""
+        future = self._executor.submit(fn, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            record_orphan(future, "screening", "cancelled")
+            raise
+
+    def build_roe_panel(self, symbols: Optional[List[str]] = None, years: int = 10) -> ROEPanel:
+        """유니버스 ROE 패널 생성 후 스크리닝에 사용하도록 설정 (블로킹 호출)
+
+        종목별 ROE 히스토리(최근 years + 2 년)는 스레드 풀에서 동시에 가져온다.
+        symbols 를 지정하지 않으면 기본 유니버스 전체를 사용한다.
+        """
+        symbols = list(dict.fromkeys(symbols if symbols is not None else self.sp500_symbols))
+        histories = dict(zip(symbols, self._executor.map(lambda s: self.get_stock_roe_history(s, years), symbols)))
+        self.panel = ROEPanel.from_histories(histories, last_year=pd.Timestamp.now().year - 1, n_years=years + 2)
+        print(f"ROE 패널 생성: {len(symbols)}개 종목, {len(self.panel.years)}개 연도")
+        return self.panel
+
+    def _active_panel(self) -> Optional[ROEPanel]:
+        """유효한 ROE 패널 (없거나 panel_ttl 이 지났으면 None - 종목별 실시간 판정)"""
+        if self.panel is None or time.time() - self.panel.built_at > self.panel_ttl:
+            return None
+        return self.panel
+
+    def _passes_roe_criteria(self, symbol: str, min_roe: float, years: int = 5,
+                             roe_history: Optional[List[ROEData]] = None) -> bool:
+        """개별 종목의 ROE 스크리닝 기준 통과 여부 (블로킹 호출, 스레드 풀에서 실행)"""
+        try:
+            print(f"\n--- {symbol} 분석 중 ---")
+            if roe_history is None:
+                roe_history = self.get_stock_roe_history(symbol, 10)
+            
+            if not roe_history:
+                print(f"{symbol}: ROE 데이터 없음")
+                return False
+            
+            # ROE 히스토리 출력 (디버깅용)
+            print(f"{symbol} ROE 히스토리:")
+            for roe_data in roe_history:
+                print(f"  {roe_data.year}: {roe_data.roe:.1f}%")
+            
+            # 1. 최근 years 년 평균 ROE 기준
+            current_year = pd.Timestamp.now().year
+            recent_years = [r for r in roe_history if r.year >= current_year - years]
+            if len(recent_years) >= 3:  # 최근 3년 이상 데이터
+                avg_roe = sum(r.roe for r in recent_years) / len(recent_years)
+                print(f"{symbol}: 최근 {len(recent_years)}년 평균 ROE = {avg_roe:.1f}%")
+                
+                if avg_roe >= min_roe:
+                    print(f"[PASS] {symbol}: 최근 평균 ROE 기준 통과")
+                    return True
+            
+            # 2. 10년 중 7년 이상 ROE 15% 달성 기준 
+            good_years = [r for r in roe_history if r.roe >= min_roe]
+            print(f"{symbol}: {len(good_years)}/{len(roe_history)}년 ROE {min_roe}% 이상 달성")
+            
+            if len(good_years) >= min(7, len(roe_history) * 0.7):
+                print(f"[PASS] {symbol}: 다년도 ROE 기준 통과")
+                return True
+            
+            # 3. 데이터 부족시 ROE 12% 기준으로 완화
+            if len(roe_history) < 5 and min_roe > 12:
+                avg_roe = sum(r.roe for r in roe_history) / len(roe_history)
+                if avg_roe >= 12:
+                    print(f"[PASS] {symbol}: 완화된 ROE 기준(12%) 통과")
+                    return True
+            
+            print(f"[FAIL] {symbol}: 모든 ROE 기준 미달")
+            return False
+            
+        except Exception as e:
+            print(f"[ERROR] {symbol}: 분석 중 오류 - {e}")
+            return False
 
     async def _get_stock_info(self, symbol: str) -> StockInfo:
         """주식 기본 정보 가져오기"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_stock_info, symbol)
+
+    def _fetch_stock_info(self, symbol: str) -> StockInfo:
+        """주식 기본 정보 조회 (로컬 저장소 우선, 블로킹 호출)"""
+        return self._memoize(("stock_info", symbol), self.flight.do, ("stock_info", symbol),
+                             self._load_stock_info, symbol)
+
+    def _load_stock_info(self, symbol: str) -> StockInfo:
+        cached = self.store.get_stock_info(symbol)
+        record_cache("stock_info_store", cached is not None)
+        if cached is not None:
+            return StockInfo(**cached)
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            return StockInfo(
+            info = self.provider.get_info(symbol)
+            stock_info = StockInfo(
                 symbol=symbol,
                 company_name=info.get('longName', symbol),
                 sector=info.get('sector', ''),
                 market_cap=float(info.get('marketCap', 0)) if info.get('marketCap') else None
             )
+            self.store.put_stock_info(symbol, stock_info.company_name, stock_info.sector, stock_info.market_cap)
+            return stock_info
         except:
             return StockInfo(symbol=symbol, company_name=symbol, sector="", market_cap=None)
     
     async def _analyze_stock_roe(self, symbol: str, min_roe: float, years: int) -> Optional[StockInfo]:
         """개별 주식의 ROE 분석"""
         try:
-            ticker = yf.Ticker(symbol)
-            
-            # 기업 정보 가져오기
-            info = ticker.info
-            company_name = info.get('longName', symbol)
-            sector = info.get('sector', '')
-            market_cap = info.get('marketCap', 0)
-            
-            # 재무제표 데이터 가져오기 (yfinance 사용)
-            financials = ticker.financials
-            balance_sheet = ticker.balance_sheet
-            
-            if financials.empty or balance_sheet.empty:
+            frame = self._load_statement_frame(symbol)
+            if frame.empty:
                 return None
             
-            # ROE 계산 (Net Income / Shareholders' Equity)
-            roe_data = []
+            # ROE 계산 (Net Income / Shareholders' Equity), 순이익이 없으면 매출 기반 임시 추정치 사용
             current_year = pd.Timestamp.now().year
+            window = frame.loc[current_year - years - 2:current_year - 1]  # 추가 년수를 더 확인해서 데이터 수집률 높임
+            roe = compute_roe(window, revenue_fallback=True)
             
-            for i in range(years + 2):  # 추가 년수를 더 확인해서 데이터 수집률 높임
-                year = current_year - i - 1
-                try:
-                    # 해당 연도의 데이터 찾기
-                    year_cols = [col for col in financials.columns if col.year == year]
-                    if not year_cols:
-                        continue
-                        
-                    year_col = year_cols[0]
-                    
-                    # Net Income
-                    net_income = financials.loc['Net Income', year_col] if 'Net Income' in financials.index else None
-                    if net_income is None:
-                        net_income = financials.loc['Total Revenue', year_col] * 0.1  # 임시 추정치
-                    
-                    # Shareholders' Equity
-                    equity_rows = ['Stockholders Equity', 'Total Stockholder Equity', 'Shareholders Equity']
-                    shareholders_equity = None
-                    
-                    for equity_row in equity_rows:
-                        if equity_row in balance_sheet.index:
-                            equity_cols = [col for col in balance_sheet.columns if col.year == year]
-                            if equity_cols:
-                                shareholders_equity = balance_sheet.loc[equity_row, equity_cols[0]]
-                                break
-                    
-                    if shareholders_equity is None or shareholders_equity == 0:
-                        continue
-                    
-                    # ROE 계산
-                    roe = (net_income / shareholders_equity) * 100
-                    
-                    if roe >= min_roe:
-                        roe_data.append(ROEData(
-                            year=year,
-                            roe=roe,
-                            net_income=float(net_income) if net_income else None
-                        ))
-                    else:
-                        # ROE가 기준에 미달하면 실격
-                        return None
-                        
-                except Exception as e:
-                    print(f"Error calculating ROE for {symbol} year {year}: {e}")
-                    continue
+            # ROE가 기준에 미달한 연도가 하나라도 있으면 실격
+            if (roe < min_roe).any():
+                return None
             
             # 지정된 년수만큼 ROE 기준을 충족했는지 확인 (최소 3년 이상이면 허용)
             min_years = max(3, years - 2)  # 5년 요구시 3년 이상이면 허용
-            if len(roe_data) >= min_years:
-                return StockInfo(
-                    symbol=symbol,
-                    company_name=company_name,
-                    sector=sector,
-                    market_cap=float(market_cap) if market_cap else None
-                )
+            if len(roe) >= min_years:
+                return await self._get_stock_info(symbol)
             
             return None
             
@@ -176,56 +370,38 @@ class StockScreener:
             return None
     
     def get_stock_roe_history(self, symbol: str, years: int = 10) -> List[ROEData]:
-        """특정 주식의 ROE 히스토리 가져오기 (Yahoo Finance 사용)"""
+        """특정 주식의 ROE 히스토리 가져오기 (로컬 저장소 우선, 없을 때만 데이터 제공자 사용)"""
+        return self._memoize(("roe_history", symbol, years), self._load_roe_history, symbol, years)
+
+    def _load_roe_history(self, symbol: str, years: int) -> List[ROEData]:
         try:
-            ticker = yf.Ticker(symbol)
-            financials = ticker.financials
-            balance_sheet = ticker.balance_sheet
-            
-            roe_history = []
-            current_year = pd.Timestamp.now().year
-            
-            for i in range(years + 2):  # 추가 년수를 더 확인해서 데이터 수집률 높임
-                year = current_year - i - 1
-                try:
-                    year_cols = [col for col in financials.columns if col.year == year]
-                    if not year_cols:
-                        continue
-                        
-                    year_col = year_cols[0]
-                    
-                    # Net Income
-                    net_income = financials.loc['Net Income', year_col] if 'Net Income' in financials.index else None
-                    if net_income is None:
-                        continue
-                    
-                    # Shareholders' Equity
-                    equity_rows = ['Stockholders Equity', 'Total Stockholder Equity', 'Shareholders Equity']
-                    shareholders_equity = None
-                    
-                    for equity_row in equity_rows:
-                        if equity_row in balance_sheet.index:
-                            equity_cols = [col for col in balance_sheet.columns if col.year == year]
-                            if equity_cols:
-                                shareholders_equity = balance_sheet.loc[equity_row, equity_cols[0]]
-                                break
-                    
-                    if shareholders_equity is None or shareholders_equity == 0:
-                        continue
-                    
-                    roe = (net_income / shareholders_equity) * 100
-                    
-                    roe_history.append(ROEData(
-                        year=year,
-                        roe=roe,
-                        net_income=float(net_income)
-                    ))
-                    
-                except Exception as e:
-                    continue
+            frame = self._load_statement_frame(symbol)
             
-            return sorted(roe_history, key=lambda x: x.year)
+            with STAGE_SECONDS.time(stage="roe_history"):
+                current_year = pd.Timestamp.now().year
+                window = frame.loc[current_year - years - 2:current_year - 1]  # 추가 년수를 더 확인해서 데이터 수집률 높임
+                roe = compute_roe(window)
+                net_income = window['net_income']
+                
+                return [
+                    ROEData(year=int(year), roe=float(value), net_income=float(net_income[year]))
+                    for year, value in roe.items()
+                ]
             
         except Exception as e:
             print(f"Error getting ROE history for {symbol}: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def _load_statement_frame(self, symbol: str) -> pd.DataFrame:
+        """회계연도별 재무 데이터 (로컬 저장소 우선, 없거나 만료 시 데이터 제공자 조회 후 저장)"""
+        return self.flight.do(("statements", symbol), self._read_statement_frame, symbol)
+
+    def _read_statement_frame(self, symbol: str) -> pd.DataFrame:
+        rows = self.store.get_statements(symbol)
+        record_cache("statements_store", rows is not None)
+        if rows is None:
+            frame = self.provider.get_statements(symbol)
+            if not frame.empty:  # 조회 실패(빈 재무제표)는 저장하지 않고 다음 요청에서 재시도
+                self.store.put_statements(symbol, rows_from_frame(frame))
+            return frame
+        return frame_from_rows(rows)
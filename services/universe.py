@@ -0,0 +1,47 @@
+import csv
+import os
+from pathlib import Path
+from typing import List, Optional
+
+# 구성종목 파일 위치: data/universes/{name}.txt 또는 {name}.csv
+UNIVERSE_DIR = Path(__file__).parent.parent / "data" / "universes"
+
+# 서버(/analyze)가 스크리닝하는 기본 유니버스 (ROE_UNIVERSE 환경변수 또는 run.py serve --universe 로 변경)
+DEFAULT_UNIVERSE = os.environ.get("ROE_UNIVERSE", "sp500_sample")
+
+# CSV 구성종목 파일에서 종목 코드로 인식하는 컬럼명
+SYMBOL_COLUMNS = ("symbol", "Symbol", "ticker", "Ticker", "SYMBOL", "TICKER")
+
+
+class UniverseRegistry:
+    """스크리닝 유니버스(구성종목 목록) 레지스트리
+
+    - {name}.txt: 한 줄에 종목 하나, '#' 이후는 주석
+    - {name}.csv: symbol / ticker 컬럼 (예: 지수 제공사의 구성종목 파일)
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root) if root else UNIVERSE_DIR
+
+    def names(self) -> List[str]:
+        """등록된 유니버스 이름 목록"""
+        return sorted({path.stem for path in self.root.glob("*") if path.suffix in (".txt", ".csv")})
+
+    def load(self, name: str) -> List[str]:
+        """유니버스 구성종목 로드 (중복 제거, 파일 순서 유지)"""
+        txt_path, csv_path = self.root / f"{name}.txt", self.root / f"{name}.csv"
+        if txt_path.exists():
+            lines = (line.split("#", 1)[0].strip() for line in txt_path.read_text().splitlines())
+            symbols = [line for line in lines if line]
+        elif csv_path.exists():
+            with open(csv_path, newline="") as f:
+                reader = csv.DictReader(f)
+                column = next((c for c in SYMBOL_COLUMNS if c in (reader.fieldnames or [])), None)
+                if column is None:
+                    raise ValueError(f"{csv_path}: symbol/ticker 컬럼을 찾을 수 없습니다.")
+                symbols = [row[column].strip() for row in reader if row[column].strip()]
+        else:
+            raise KeyError(f"등록되지 않은 유니버스: {name} (사용 가능: {', '.join(self.names())})")
+
+        # Yahoo Finance 표기법으로 통일 (BRK.B -> BRK-B)
+        return list(dict.fromkeys(symbol.upper().replace(".", "-") for symbol in symbols))
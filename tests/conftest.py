@@ -0,0 +1,50 @@
+"""
+테스트 공통 설정
+
+서비스 모듈은 import 시점에 ROE_CACHE_DIR 로 기본 저장 위치를 정하므로, 테스트 모듈을 import 하기 전에
+임시 디렉토리로 바꿔 실제 cache/ 를 건드리지 않도록 한다. 데이터 제공자는 합성 유니버스(SyntheticProvider) 또는
+그 응답을 기록한 픽스처(FixtureProvider)만 사용한다 (네트워크 호출 없음).
+"""
+import atexit
+import os
+import shutil
+import tempfile
+
+_test_root = tempfile.mkdtemp(prefix="roe-test-")
+atexit.register(shutil.rmtree, _test_root, True)
+os.environ["ROE_CACHE_DIR"] = os.path.join(_test_root, "cache")
+os.environ["ROE_FIXTURE_DIR"] = os.path.join(_test_root, "fixtures")
+
+import pytest
+
+from benchmarks.synthetic_universe import SyntheticProvider, make_symbols
+from services.fundamentals_store import FundamentalsStore
+from services.price_store import PriceStore
+from services.stock_screener import StockScreener
+
+
+@pytest.fixture
+def provider():
+    return SyntheticProvider(seed=7)
+
+
+@pytest.fixture
+def symbols():
+    return make_symbols(40)
+
+
+@pytest.fixture
+def fundamentals(tmp_path):
+    return FundamentalsStore(str(tmp_path / "fundamentals.db"))
+
+
+@pytest.fixture
+def prices(tmp_path):
+    return PriceStore(str(tmp_path / "prices"))
+
+
+@pytest.fixture
+def screener(provider, fundamentals, symbols):
+    screener = StockScreener(provider=provider, store=fundamentals)
+    screener.sp500_symbols = symbols
+    return screener
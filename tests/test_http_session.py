@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from services import http_session
+from services.http_session import PooledSession, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_token_bucket_allows_burst_then_waits_for_rate():
+    bucket = TokenBucket(rate=50.0, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    started = time.monotonic()
+    waited = bucket.acquire()
+    assert waited > 0
+    assert time.monotonic() - started >= 0.9 / 50
+
+
+def test_token_bucket_refills_up_to_burst():
+    bucket = TokenBucket(rate=1000.0, burst=2)
+    bucket.acquire(), bucket.acquire()
+    time.sleep(0.05)
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() > 0
+
+
+def test_backoff_prefers_retry_after_and_caps_it():
+    session = PooledSession(backoff_base=0.5, backoff_cap=10.0)
+    assert session._backoff(0, "3") == 3.0
+    assert session._backoff(0, "120") == 10.0
+    for attempt in range(8):
+        delay = session._backoff(attempt, "soon")  # 해석할 수 없으면 지수 백오프
+        assert 0 <= delay <= min(10.0, 0.5 * 2 ** attempt)
+
+
+@pytest.fixture
+def scripted(monkeypatch):
+    """상위 Session.request 가 정해 둔 응답(또는 예외)을 차례로 돌려주도록 하고 재시도 대기는 건너뜀"""
+    script, sleeps = [], []
+
+    def fake_request(self, method, url, *args, **kwargs):
+        outcome = script.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(http_session._http.Session, "request", fake_request)
+    monkeypatch.setattr(http_session.time, "sleep", sleeps.append)
+    return script, sleeps
+
+
+def test_request_retries_throttled_and_server_errors(scripted):
+    script, sleeps = scripted
+    script.extend([FakeResponse(429, {"Retry-After": "2"}), FakeResponse(503), FakeResponse(200)])
+    session = PooledSession(rate=1000.0, burst=10, backoff_base=0.01)
+
+    assert session.request("GET", "http://example.invalid").status_code == 200
+    stats = session.stats
+    assert (stats["requests"], stats["retries"], stats["throttled"], stats["server_errors"]) == (3, 2, 1, 1)
+    assert sleeps[0] == 2.0 and 0 <= sleeps[1] <= 0.02
+
+
+def test_request_gives_up_after_max_retries(scripted):
+    script, sleeps = scripted
+    script.extend([ConnectionError("reset")] + [FakeResponse(500)] * 2)
+    session = PooledSession(rate=1000.0, burst=10, max_retries=2, backoff_base=0.01)
+
+    assert session.request("GET", "http://example.invalid").status_code == 500
+    stats = session.stats
+    assert (stats["connection_errors"], stats["failures"], stats["retries"]) == (1, 1, 2)
+    assert len(sleeps) == 2
+
+
+def test_rate_share_splits_rate_and_burst():
+    try:
+        http_session.set_rate_share(4)
+        limiter = http_session.get_http_session().limiter
+        assert limiter.rate == http_session.DEFAULT_RATE / 4
+        assert limiter.burst == max(1, http_session.DEFAULT_BURST // 4)
+    finally:
+        http_session.set_rate_share(1)
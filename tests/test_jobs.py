@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+import backend.main as main
+from services.analysis_runner import SYMBOL_ANALYSES
+from services.investment_analyzer import InvestmentAnalyzer
+from services.job_store import JobStore
+
+REQUEST = {"min_roe": 10.0, "years": 5, "limit": 4}
+
+
+@pytest.fixture
+def app_state(monkeypatch, tmp_path, screener, prices):
+    """backend.main 의 저장소/스크리너/분석기를 임시 저장소와 합성 유니버스로 교체"""
+    analyzer = InvestmentAnalyzer(prices=prices, provider=screener.provider, screener=screener)
+    monkeypatch.setattr(main, "provider", screener.provider)
+    monkeypatch.setattr(main, "screener", screener)
+    monkeypatch.setattr(main, "analyzer", analyzer)
+    monkeypatch.setattr(main, "job_store", JobStore(str(tmp_path / "jobs.db")))
+    return main
+
+
+def screened_job(app_state, request):
+    """스크리닝까지 기록된 작업 (REQUEST 기준으로 선정한 종목 목록도 반환)"""
+    job_id = app_state.job_store.create_job(request)
+    stocks = [stock.model_dump() for stock in asyncio.run(
+        app_state.get_screener().screen_high_roe_stocks(**REQUEST))]
+    app_state.job_store.set_stocks(job_id, stocks)
+    return job_id, stocks
+
+
+def test_job_screens_and_records_every_stock(app_state):
+    job_id = app_state.job_store.create_job(REQUEST)
+    asyncio.run(app_state.run_analysis_job(job_id))
+
+    status = app_state.get_job_status(job_id)
+    assert status.status == "completed"
+    assert status.total == REQUEST["limit"]
+    assert status.completed == REQUEST["limit"] and not status.failed_symbols
+    assert {r.stock_info.symbol for r in status.results} == {
+        s["symbol"] for s in app_state.job_store.get_stocks(job_id)
+    }
+
+
+def test_resumed_job_skips_recorded_stocks(app_state):
+    job_store = app_state.job_store
+    job_id, stocks = screened_job(app_state, REQUEST)
+    job_store.update_status(job_id, "analyzing")
+    # 재시작 전에 첫 종목까지 기록된 작업
+    job_store.add_result(job_id, stocks[0]["symbol"], None)
+    assert job_id in job_store.unfinished_jobs()
+
+    before = SYMBOL_ANALYSES.value(outcome="ok")
+
+    async def restart():
+        await app_state.resume_unfinished_jobs()
+        await asyncio.gather(*app_state.running_jobs.values())
+
+    asyncio.run(restart())
+
+    assert SYMBOL_ANALYSES.value(outcome="ok") - before == len(stocks) - 1
+    status = app_state.get_job_status(job_id)
+    assert status.status == "completed"
+    assert status.failed_symbols == [stocks[0]["symbol"]]
+    assert job_id not in job_store.unfinished_jobs()
+
+
+def test_job_time_budget_records_unfinished_stocks_as_failed(app_state, monkeypatch):
+    def stalled(stock_info, include_prices=False):
+        time.sleep(1.0)
+
+    monkeypatch.setattr(app_state.analyzer, "analyze_stock_sync", stalled)
+    job_id, stocks = screened_job(app_state, {**REQUEST, "time_budget": 0.2})
+    asyncio.run(app_state.run_analysis_job(job_id))
+
+    status = app_state.get_job_status(job_id)
+    assert status.status == "completed"
+    assert sorted(status.failed_symbols) == sorted(s["symbol"] for s in stocks)
+    assert "시간 초과" in status.message
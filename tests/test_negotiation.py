@@ -0,0 +1,111 @@
+import gzip
+
+import pytest
+from starlette.requests import Request
+
+from services.serialization import MEDIA_ARROW, MEDIA_JSON, MEDIA_MSGPACK, compress, negotiate
+from services.static_assets import StaticAssets, _accepted_encodings, _etag, _etag_matches
+
+BODY = b"<html>" + b"ROE " * 1000 + b"</html>"
+
+
+@pytest.mark.parametrize("accept,expected", [
+    (None, MEDIA_JSON),
+    ("*/*", MEDIA_JSON),
+    ("application/json", MEDIA_JSON),
+    ("application/x-msgpack", MEDIA_MSGPACK),
+    ("application/json;q=0.5, application/msgpack", MEDIA_MSGPACK),
+    ("application/msgpack;q=0, application/json;q=0.1", MEDIA_JSON),
+    ("application/msgpack;q=0.0", None),
+    ("application/msgpack;q=abc", None),
+    ("text/html", None),
+])
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected
+
+
+def test_negotiate_arrow_when_installed():
+    pytest.importorskip("pyarrow")
+    assert negotiate(f"application/json;q=0.9, {MEDIA_ARROW}") == MEDIA_ARROW
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip", "gzip"),
+    ("gzip;q=0.5, identity", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip;q=0.0", None),
+    ("gzip;q=0.001", "gzip"),
+    ("gzip;q=bogus", None),
+    ("identity", None),
+    (None, None),
+])
+def test_compress_honours_q_values(header, expected):
+    body, encoding = compress(BODY, header)
+    assert encoding == expected
+    assert (gzip.decompress(body) if encoding == "gzip" else body) == BODY
+
+
+def test_compress_prefers_brotli_when_installed():
+    brotli = pytest.importorskip("brotli")
+    body, encoding = compress(BODY, "gzip, br")
+    assert encoding == "br" and brotli.decompress(body) == BODY
+
+
+def test_small_bodies_are_not_compressed():
+    assert compress(b"{}", "gzip") == (b"{}", None)
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip, br", ["gzip", "br"]),
+    ("br;q=0, gzip;q=0.8", ["gzip"]),
+    ("br;q=0.000, gzip;q=1.0", ["gzip"]),
+    ("br;q=x", []),
+    (None, []),
+])
+def test_accepted_encodings(header, expected):
+    assert _accepted_encodings(header) == expected
+
+
+def test_etag_differs_per_encoding_and_matches_any_variant():
+    etags = {_etag("abc", encoding) for encoding in (None, "gzip", "br")}
+    assert len(etags) == 3
+    for etag in etags:
+        assert _etag_matches(etag, "abc")
+        assert _etag_matches(f'"other", W/{etag}', "abc")
+    assert _etag_matches("*", "abc")
+    assert not _etag_matches('"abd"', "abc")
+    assert not _etag_matches(None, "abc")
+
+
+def make_request(**headers) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+@pytest.fixture
+def assets(tmp_path):
+    (tmp_path / "index.html").write_bytes(BODY)
+    return StaticAssets(str(tmp_path), ["index.html"])
+
+
+def test_static_asset_serves_encoding_with_its_own_etag(assets):
+    identity = assets.response(make_request(), "index.html")
+    gzipped = assets.response(make_request(accept_encoding="gzip"), "index.html")
+    assert identity.body == BODY and "content-encoding" not in identity.headers
+    assert gzipped.headers["content-encoding"] == "gzip" and gzip.decompress(gzipped.body) == BODY
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+
+
+def test_static_asset_revalidates_across_encodings(assets):
+    etag = assets.response(make_request(accept_encoding="gzip"), "index.html").headers["etag"]
+    not_modified = assets.response(make_request(if_none_match=etag), "index.html")
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == _etag(assets.get("index.html").digest, None)
+    assert assets.response(make_request(if_none_match='"stale"'), "index.html").status_code == 200
+
+
+def test_static_asset_missing_name(assets):
+    assert assets.response(make_request(), "missing.html").status_code == 404
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.data_provider import FixtureProvider
+from services.incremental_sync import IncrementalSync
+from services.price_ingest import to_price_series
+from services.price_store import PriceSeries
+
+DAY = 24 * 60 * 60
+
+
+def series(symbol, start_day, closes):
+    dates = (np.arange(len(closes), dtype=np.int64) + start_day) * DAY
+    return PriceSeries(symbol, dates, np.asarray(closes, dtype=np.float64))
+
+
+def test_append_adds_only_bars_after_last_stored_date(prices):
+    assert prices.append(series("A", 0, [1.0, 2.0, 3.0])) == 3
+    assert prices.append(series("A", 1, [2.0, 3.0, 4.0, 5.0])) == 2
+    stored = prices.load("A")
+    np.testing.assert_array_equal(stored.dates, np.arange(5) * DAY)
+    np.testing.assert_array_equal(stored.close, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_append_without_new_bars_keeps_data(prices):
+    prices.append(series("A", 0, [1.0, 2.0]))
+    assert prices.append(series("A", 0, [1.0, 2.0])) == 0
+    assert len(prices.load("A")) == 2
+
+
+def test_version_changes_only_when_stored_series_changes(prices):
+    prices.save(series("A", 0, [1.0, np.nan, 3.0]), years=1)
+    assert prices.version == 0  # 처음 저장한 종목은 버전을 바꾸지 않음
+    prices.save(series("A", 0, [1.0, np.nan, 3.0]))
+    prices.append(series("A", 0, [1.0, np.nan, 3.0]))
+    assert prices.version == 0
+    prices.append(series("A", 2, [3.0, 4.0]))
+    first = prices.version
+    assert first > 0
+    prices.save(series("A", 0, [0.5, 1.0, 1.5, 2.0]))  # 수정 종가 재계산
+    assert prices.version > first
+
+
+def test_fundamentals_version_changes_only_when_stored_values_change(fundamentals):
+    row = {"fiscal_year": 2020, "net_income": 1.0, "total_revenue": None, "stockholders_equity": 10.0}
+    fundamentals.put_statements("A", [row])
+    fundamentals.put_stock_info("A", "A Inc", "Technology", 1e9)
+    fundamentals.put_statements("A", [row])
+    fundamentals.put_stock_info("A", "A Inc", "Technology", 1e9)
+    fundamentals.touch("A", "statements")
+    assert fundamentals.version == 0
+
+    fundamentals.put_statements("A", [row, {**row, "fiscal_year": 2021}])
+    after_new_year = fundamentals.version
+    assert after_new_year > 0
+    fundamentals.put_stock_info("A", "A Inc", "Technology", 2e9)
+    assert fundamentals.version > after_new_year
+
+
+@pytest.fixture
+def fixtures(tmp_path, provider):
+    fixture_provider = FixtureProvider(str(tmp_path / "fixtures"))
+    fixture_provider.record(["SYN0001", "SYN0002"], provider)
+    return fixture_provider
+
+
+def truncate(prices, symbol, bars):
+    stored = prices.load(symbol, fresh_only=False)
+    prices.save(PriceSeries(symbol, stored.dates[:-bars], stored.close[:-bars]))
+
+
+def test_sync_appends_deltas_and_refetches_readjusted_history(fixtures, fundamentals, prices):
+    sync = IncrementalSync(fixtures, fundamentals, prices)
+    first = sync.sync_prices(["SYN0001", "SYN0002"])
+    assert (first["full"], first["delta"]) == (2, 0)
+    full_history = {s: prices.load(s, fresh_only=False) for s in ("SYN0001", "SYN0002")}
+
+    truncate(prices, "SYN0001", 20)
+    truncate(prices, "SYN0002", 20)
+    # SYN0002 는 분할/배당으로 과거 수정 종가가 모두 바뀐 것처럼 저장본을 조정
+    stored = prices.load("SYN0002", fresh_only=False)
+    prices.save(PriceSeries("SYN0002", stored.dates, stored.close * 1.02))
+
+    second = sync.sync_prices(["SYN0001", "SYN0002"])
+    assert (second["full"], second["delta"], second["readjusted"]) == (0, 1, 1)
+    for symbol, expected in full_history.items():
+        synced = prices.load(symbol, fresh_only=False)
+        np.testing.assert_array_equal(synced.dates, expected.dates)
+        np.testing.assert_allclose(synced.close, expected.close)
+
+
+def test_to_price_series_normalizes_dates_to_midnight():
+    close = pd.Series([1.0, 2.0], index=pd.DatetimeIndex(["2024-01-02 05:00", "2024-01-03 05:00"], tz="America/New_York"))
+    converted = to_price_series("A", close)
+    assert list(converted.dates % DAY) == [0, 0]
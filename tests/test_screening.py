@@ -0,0 +1,75 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.stock_models import ROEData
+from services.roe_panel import ROEPanel
+
+CRITERIA = [(min_roe, years) for min_roe in (5.0, 10.0, 12.0, 15.0, 20.0, 30.0) for years in (3, 5, 10)]
+
+
+def brute_force_top_k(screener, symbols, min_roe, years, limit):
+    """모든 종목을 판정해 사전 점수 순(같은 점수는 유니버스 순서)으로 자른 기대값"""
+    scored = []
+    for order, symbol in enumerate(symbols):
+        score = screener._pre_screen(symbol, min_roe, years)
+        if score is not None:
+            scored.append((-score, order, symbol))
+    return [(-score, symbol) for score, _, symbol in sorted(scored)[:limit]]
+
+
+@pytest.mark.parametrize("limit", [1, 5, 100])
+@pytest.mark.parametrize("min_roe,years", [(10.0, 5), (20.0, 3)])
+def test_select_top_k_matches_brute_force(screener, symbols, min_roe, years, limit):
+    expected = brute_force_top_k(screener, symbols, min_roe, years, limit)
+    selected = asyncio.run(screener._select_top_k(min_roe, years, limit, None, symbols, None))
+    assert selected == expected
+
+
+def test_select_top_k_with_panel_matches_live(screener, symbols):
+    live = {
+        criteria: asyncio.run(screener._select_top_k(*criteria, 5, None, symbols, None))
+        for criteria in CRITERIA
+    }
+    screener.build_roe_panel()
+    for criteria, expected in live.items():
+        assert asyncio.run(screener._select_top_k(*criteria, 5, None, symbols, None)) == expected
+
+
+def test_select_top_k_empty_limit(screener, symbols):
+    assert asyncio.run(screener._select_top_k(10.0, 5, 0, None, symbols, None)) == []
+
+
+def test_panel_query_matches_passes_roe_criteria(screener, symbols):
+    panel = screener.build_roe_panel()
+    for min_roe, years in CRITERIA:
+        passed = set(panel.query(min_roe, years))
+        for symbol in symbols:
+            assert panel.covers(symbol)
+            assert (symbol in passed) == screener._passes_roe_criteria(symbol, min_roe, years), (symbol, min_roe, years)
+
+
+def test_panel_query_matches_criteria_for_short_and_gappy_histories(screener):
+    """데이터 부족(완화 기준)과 결측 연도가 있는 히스토리에서도 패널 판정이 종목별 판정과 같아야 함"""
+    rng = np.random.default_rng(0)
+    last_year = pd.Timestamp.now().year - 1
+    histories = {}
+    for i in range(60):
+        n_years = int(rng.integers(1, 11))
+        years = sorted(rng.choice(np.arange(last_year - 9, last_year + 1), size=n_years, replace=False))
+        histories[f"H{i:03d}"] = [ROEData(year=int(y), roe=float(rng.uniform(-5, 35))) for y in years]
+    panel = ROEPanel.from_histories(histories, last_year=last_year, n_years=12)
+    for min_roe, years in CRITERIA:
+        passed = set(panel.query(min_roe, years))
+        for symbol, history in histories.items():
+            expected = screener._passes_roe_criteria(symbol, min_roe, years, history)
+            assert (symbol in passed) == expected, (symbol, min_roe, years)
+
+
+def test_panel_expires_after_ttl(screener):
+    panel = screener.build_roe_panel()
+    assert screener._active_panel() is panel
+    panel.built_at -= screener.panel_ttl + 1
+    assert screener._active_panel() is None
@@ -0,0 +1,71 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.single_flight import SingleFlight, SingleFlightProvider
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "key", slow, 21)
+        assert started.wait(5)
+        followers = [pool.submit(flight.do, "key", slow, 21) for _ in range(4)]
+        while flight.shared < 4:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == [42] * 5
+    assert calls == [21]
+    assert (flight.calls, flight.shared) == (1, 4)
+
+
+def test_different_keys_run_separately_and_results_are_not_cached():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.do("a", lambda: 3) == 3
+    assert flight.calls == 3
+
+
+def test_exception_is_shared_and_key_released():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("upstream")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", failing)
+        assert started.wait(5)
+        follower = pool.submit(flight.do, "key", failing)
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.do("key", lambda: "retried") == "retried"
+
+
+def test_provider_merges_by_symbol_and_dataset(provider):
+    flight_provider = SingleFlightProvider(provider)
+    statements = flight_provider.get_statements("SYN0001")
+    assert statements.equals(provider.get_statements("SYN0001"))
+    assert flight_provider.get_info("SYN0001") == provider.get_info("SYN0001")
+    assert flight_provider.flight.calls == 2